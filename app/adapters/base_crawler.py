@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from app.modules.crawling.entities import CrawledPost, NewsArticle, GovernmentDocument
+from typing import List, Dict, Any, Optional, Tuple
+from app.modules.crawling.entities import CrawledPost, NewsArticle, GovernmentDocument, PostType
 
 
 class BaseCrawler(ABC):
     """기본 크롤러 인터페이스 - 모든 크롤러가 구현해야 하는 공통 인터페이스."""
     
+    post_type: Optional[PostType] = None   # 수집하는 게시글 타입
+    capabilities: Tuple[str, ...] = ()     # 지원하는 크롤링 기능 (레지스트리에 노출)
+    
     def __init__(self, base_url: str, name: str):
         """크롤러를 초기화합니다.
         
@@ -19,6 +22,38 @@ class BaseCrawler(ABC):
         """
         self.base_url = base_url
         self.name = name
+        self._client = None
+    
+    async def fetch(self, path: str = "", **params) -> str:
+        """크롤링 대상 사이트의 페이지 HTML을 가져옵니다.
+        
+        Args:
+            path: base_url 기준 상대 경로
+            **params: 쿼리 파라미터
+            
+        Returns:
+            응답 본문 HTML
+        """
+        if self._client is None:
+            import httpx
+            from app.infrastructure.config.crawling_config import crawling_config
+            
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=crawling_config.CRAWL_TIMEOUT,
+                headers={"User-Agent": crawling_config.USER_AGENT},
+                follow_redirects=True
+            )
+        
+        response = await self._client.get(path, params=params or None)
+        response.raise_for_status()
+        return response.text
+    
+    async def close(self) -> None:
+        """HTTP 클라이언트를 정리합니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     @abstractmethod
     async def crawl(self, **kwargs) -> List[Any]:
@@ -32,19 +67,35 @@ class BaseCrawler(ABC):
         """
         pass
     
-    @abstractmethod
     async def health_check(self) -> bool:
-        """크롤러 상태를 확인합니다.
+        """크롤러 상태를 확인합니다 (base_url 첫 페이지 응답 여부).
         
         Returns:
             크롤러가 정상 작동하면 True, 그렇지 않으면 False
         """
-        pass
+        try:
+            await self.fetch()
+            return True
+        except Exception:
+            return False
 
 
 class CommunityCrawler(BaseCrawler):
     """커뮤니티 크롤러 기본 클래스."""
     
+    post_type = PostType.COMMUNITY
+    capabilities = ("hot_posts", "category")
+    
+    async def crawl(self, **kwargs) -> List[CrawledPost]:
+        """크롤링을 수행합니다."""
+        limit = kwargs.get('limit', 10)
+        category = kwargs.get('category')
+        
+        if category:
+            return await self.crawl_category(category, limit)
+        else:
+            return await self.crawl_hot_posts(limit)
+    
     @abstractmethod
     async def crawl_hot_posts(self, limit: int = 10) -> List[CrawledPost]:
         """인기 게시글을 크롤링합니다.
@@ -74,6 +125,20 @@ class CommunityCrawler(BaseCrawler):
 class NewsCrawler(BaseCrawler):
     """뉴스 크롤러 기본 클래스."""
     
+    post_type = PostType.NEWS
+    capabilities = ("tech_news", "telecom_news")
+    
+    async def crawl(self, **kwargs) -> List[NewsArticle]:
+        """크롤링을 수행합니다."""
+        limit = kwargs.get('limit', 10)
+        section = kwargs.get('section')
+        
+        if section == "tech":
+            return await self.crawl_tech_news(limit)
+        if section == "telecom":
+            return await self.crawl_telecom_news(limit)
+        return await self.crawl_tech_news(limit) + await self.crawl_telecom_news(limit)
+    
     @abstractmethod
     async def crawl_tech_news(self, limit: int = 10) -> List[NewsArticle]:
         """IT 뉴스를 크롤링합니다.
@@ -102,6 +167,14 @@ class NewsCrawler(BaseCrawler):
 class GovernmentCrawler(BaseCrawler):
     """정부 크롤러 기본 클래스."""
     
+    post_type = PostType.GOVERNMENT
+    capabilities = ("notices", "policies")
+    
+    async def crawl(self, **kwargs) -> List[GovernmentDocument]:
+        """크롤링을 수행합니다."""
+        limit = kwargs.get('limit', 10)
+        return await self.crawl_notices(limit) + await self.crawl_policies(limit)
+    
     @abstractmethod
     async def crawl_notices(self, limit: int = 10) -> List[GovernmentDocument]:
         """공지사항을 크롤링합니다.
@@ -1,10 +1,35 @@
-"""Crawlers - 크롤링 전용."""
+"""Crawlers - 크롤링 전용.
+
+크롤러 클래스는 처음 접근할 때 import 됩니다 (``crawler_registry`` 참고).
+"""
+
+from .registry import CrawlerRegistry, CrawlerSpec, crawler_registry, get_crawler_registry
+
+# 하위 호환성을 위한 클래스 이름 -> 소스 이름 매핑 (지연 로딩)
+_LAZY_CRAWLERS = {
+    "PpomppuCrawler": "ppomppu",
+    "RuliwebCrawler": "ruliweb",
+    "ClienCrawler": "clien",
+    "EtnewsCrawler": "etnews",
+    "YonhapCrawler": "yonhap",
+    "BroadcastCommissionCrawler": "broadcast_commission",
+    "KaitCrawler": "kait",
+}
+
+
+def __getattr__(name: str):
+    source = _LAZY_CRAWLERS.get(name)
+    if source is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return crawler_registry.get_class(source)
 
-from .community import PpomppuCrawler, RuliwebCrawler, ClienCrawler
-from .news import EtnewsCrawler, YonhapCrawler
-from .government import BroadcastCommissionCrawler, KaitCrawler
 
 __all__ = [
+    # Registry
+    "CrawlerRegistry",
+    "CrawlerSpec",
+    "crawler_registry",
+    "get_crawler_registry",
     # Community crawlers
     "PpomppuCrawler",
     "RuliwebCrawler", 
@@ -2,23 +2,26 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 from app.modules.crawling.entities import CrawledPost
+from app.adapters.base_crawler import CommunityCrawler
 
 
-class ClienCrawler:
+class ClienCrawler(CommunityCrawler):
     """클리앙 크롤러 - 매우 직관적."""
     
-    def __init__(self):
-        self.base_url = "https://www.clien.net"
-        self.name = "clien"
+    def __init__(self, base_url: Optional[str] = None):
+        super().__init__(
+            base_url=base_url or "https://www.clien.net",
+            name="clien"
+        )
     
-    async def crawl_hot_posts(self) -> List[CrawledPost]:
+    async def crawl_hot_posts(self, limit: int = 10) -> List[CrawledPost]:
         """인기 게시글 크롤링."""
         # TODO: 실제 크롤링 로직
         return []
     
-    async def crawl_category(self, category: str) -> List[CrawledPost]:
+    async def crawl_category(self, category: str, limit: int = 10) -> List[CrawledPost]:
         """카테고리별 게시글 크롤링."""
         # TODO: 실제 크롤링 로직
         return []
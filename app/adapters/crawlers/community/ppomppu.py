@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from app.modules.crawling.entities import CrawledPost
 from app.adapters.base_crawler import CommunityCrawler
 
@@ -10,27 +10,12 @@ from app.adapters.base_crawler import CommunityCrawler
 class PpomppuCrawler(CommunityCrawler):
     """뽐뿌 크롤러 - 뽐뿌 커뮤니티에서 게시글을 수집합니다."""
     
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None):
         super().__init__(
-            base_url="https://www.ppomppu.co.kr",
+            base_url=base_url or "https://www.ppomppu.co.kr",
             name="ppomppu"
         )
     
-    async def crawl(self, **kwargs) -> List[CrawledPost]:
-        """크롤링을 수행합니다."""
-        limit = kwargs.get('limit', 10)
-        category = kwargs.get('category')
-        
-        if category:
-            return await self.crawl_category(category, limit)
-        else:
-            return await self.crawl_hot_posts(limit)
-    
-    async def health_check(self) -> bool:
-        """크롤러 상태를 확인합니다."""
-        # TODO: 실제 헬스체크 로직 구현
-        return True
-    
     async def crawl_hot_posts(self, limit: int = 10) -> List[CrawledPost]:
         """인기 게시글을 크롤링합니다."""
         # TODO: 실제 크롤링 로직 구현 (Selenium, requests 등 사용)
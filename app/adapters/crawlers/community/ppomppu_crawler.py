@@ -1,58 +0,0 @@
-"""뽐뿌 크롤러 - 뽐뿌 커뮤니티에서 게시글을 크롤링하는 클래스."""
-
-from __future__ import annotations
-
-from typing import List, Dict, Any
-from app.modules.crawling.entities import CrawledPost
-from app.adapters.base_crawler import CommunityCrawler
-
-
-class PpomppuCrawler(CommunityCrawler):
-    """뽐뿌 크롤러 - 뽐뿌 커뮤니티에서 게시글을 수집합니다."""
-    
-    def __init__(self):
-        super().__init__(
-            base_url="https://www.ppomppu.co.kr",
-            name="ppomppu"
-        )
-    
-    async def crawl(self, **kwargs) -> List[CrawledPost]:
-        """크롤링을 수행합니다."""
-        limit = kwargs.get('limit', 10)
-        category = kwargs.get('category')
-        
-        if category:
-            return await self.crawl_category(category, limit)
-        else:
-            return await self.crawl_hot_posts(limit)
-    
-    async def health_check(self) -> bool:
-        """크롤러 상태를 확인합니다."""
-        # TODO: 실제 헬스체크 로직 구현
-        return True
-    
-    async def crawl_hot_posts(self, limit: int = 10) -> List[CrawledPost]:
-        """인기 게시글을 크롤링합니다."""
-        # TODO: 실제 크롤링 로직 구현 (Selenium, requests 등 사용)
-        from datetime import datetime
-        return [
-            CrawledPost(
-                id="ppomppu_1",
-                title="뽐뿌 핫 게시글 1",
-                content="뽐뿌 게시글 내용",
-                url=f"{self.base_url}/hot/1",
-                source="ppomppu",
-                post_type="community",
-                author="user1",
-                views=100,
-                likes=5,
-                comments=2,
-                metadata={},
-                crawled_at=datetime.utcnow()
-            )
-        ]
-    
-    async def crawl_category(self, category: str, limit: int = 10) -> List[CrawledPost]:
-        """특정 카테고리의 게시글을 크롤링합니다."""
-        # TODO: 실제 크롤링 로직 구현
-        return []
@@ -1,7 +1,20 @@
 """Government crawlers - 정부 기관 크롤러들."""
 
-from .broadcast_commission import BroadcastCommissionCrawler
-from .kait import KaitCrawler
+import importlib
+
+# 클래스 이름 -> 모듈 이름 (처음 접근할 때 import)
+_LAZY_CRAWLERS = {
+    "BroadcastCommissionCrawler": ".broadcast_commission",
+    "KaitCrawler": ".kait",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_CRAWLERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
+
 
 __all__ = [
     "BroadcastCommissionCrawler",
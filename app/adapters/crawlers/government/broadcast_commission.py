@@ -2,23 +2,26 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 from app.modules.crawling.entities import GovernmentDocument
+from app.adapters.base_crawler import GovernmentCrawler
 
 
-class BroadcastCommissionCrawler:
+class BroadcastCommissionCrawler(GovernmentCrawler):
     """방송통신위원회 크롤러."""
     
-    def __init__(self):
-        self.base_url = "https://www.kcc.go.kr"
-        self.name = "broadcast_commission"
+    def __init__(self, base_url: Optional[str] = None):
+        super().__init__(
+            base_url=base_url or "https://www.kcc.go.kr",
+            name="broadcast_commission"
+        )
     
-    async def crawl_notices(self) -> List[GovernmentDocument]:
+    async def crawl_notices(self, limit: int = 10) -> List[GovernmentDocument]:
         """공지사항을 크롤링합니다."""
         # TODO: 실제 크롤링 로직 구현
         return []
     
-    async def crawl_policies(self) -> List[GovernmentDocument]:
+    async def crawl_policies(self, limit: int = 10) -> List[GovernmentDocument]:
         """정책 자료를 크롤링합니다."""
         # TODO: 실제 크롤링 로직 구현
         return []
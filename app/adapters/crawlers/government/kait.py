@@ -2,23 +2,30 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 from app.modules.crawling.entities import GovernmentDocument
+from app.adapters.base_crawler import GovernmentCrawler
 
 
-class KaitCrawler:
+class KaitCrawler(GovernmentCrawler):
     """한국정보통신기술협회 크롤러."""
     
-    def __init__(self):
-        self.base_url = "https://www.kait.or.kr"
-        self.name = "kait"
+    def __init__(self, base_url: Optional[str] = None):
+        super().__init__(
+            base_url=base_url or "https://www.kait.or.kr",
+            name="kait"
+        )
     
-    async def crawl_notices(self) -> List[GovernmentDocument]:
+    async def crawl_notices(self, limit: int = 10) -> List[GovernmentDocument]:
         """공지사항을 크롤링합니다."""
         # TODO: 실제 크롤링 로직 구현
         return []
     
-    async def crawl_reports(self) -> List[GovernmentDocument]:
+    async def crawl_policies(self, limit: int = 10) -> List[GovernmentDocument]:
+        """KAIT는 정책 자료 대신 보고서를 발행하므로 보고서를 크롤링합니다."""
+        return await self.crawl_reports(limit)
+    
+    async def crawl_reports(self, limit: int = 10) -> List[GovernmentDocument]:
         """보고서를 크롤링합니다."""
         # TODO: 실제 크롤링 로직 구현
         return []
@@ -1,7 +1,20 @@
 """News crawlers - 뉴스 크롤러들."""
 
-from .etnews import EtnewsCrawler
-from .yonhap import YonhapCrawler
+import importlib
+
+# 클래스 이름 -> 모듈 이름 (처음 접근할 때 import)
+_LAZY_CRAWLERS = {
+    "EtnewsCrawler": ".etnews",
+    "YonhapCrawler": ".yonhap",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_CRAWLERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
+
 
 __all__ = [
     "EtnewsCrawler",
@@ -2,23 +2,26 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 from app.modules.crawling.entities import NewsArticle
+from app.adapters.base_crawler import NewsCrawler
 
 
-class EtnewsCrawler:
+class EtnewsCrawler(NewsCrawler):
     """전자신문 크롤러."""
     
-    def __init__(self):
-        self.base_url = "https://www.etnews.com"
-        self.name = "etnews"
+    def __init__(self, base_url: Optional[str] = None):
+        super().__init__(
+            base_url=base_url or "https://www.etnews.com",
+            name="etnews"
+        )
     
-    async def crawl_tech_news(self) -> List[NewsArticle]:
+    async def crawl_tech_news(self, limit: int = 10) -> List[NewsArticle]:
         """IT 뉴스를 크롤링합니다."""
         # TODO: 실제 크롤링 로직 구현
         return []
     
-    async def crawl_telecom_news(self) -> List[NewsArticle]:
+    async def crawl_telecom_news(self, limit: int = 10) -> List[NewsArticle]:
         """통신 뉴스를 크롤링합니다."""
         # TODO: 실제 크롤링 로직 구현
         return []
@@ -0,0 +1,228 @@
+"""Crawler registry - 소스 이름 기반 크롤러 레지스트리 (지연 로딩)."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from app.modules.crawling.entities import PostType
+
+logger = logging.getLogger(__name__)
+
+# 외부 패키지가 크롤러를 등록할 때 사용하는 entry point 그룹
+# (예: pyproject.toml 의 [project.entry-points."newsletter_system.crawlers"] myboard = "pkg.mod:MyCrawler")
+ENTRY_POINT_GROUP = "newsletter_system.crawlers"
+
+
+@dataclass
+class CrawlerSpec:
+    """크롤러 명세 - 크롤러 모듈을 import 하지 않고도 알 수 있는 정보."""
+    source: str                                # 소스 이름 (예: ppomppu)
+    target: str                                # "모듈경로:클래스명" 형식의 import 대상
+    post_type: Optional[PostType] = None       # 수집하는 게시글 타입
+    capabilities: Tuple[str, ...] = ()         # 지원하는 크롤링 기능 (예: hot_posts, category)
+    base_url: str = ""                         # 크롤링 대상 사이트의 기본 URL
+    origin: str = "builtin"                    # 등록 경로 (builtin, entry_point, manual)
+    options: Dict[str, Any] = field(default_factory=dict)  # 소스별 기본 크롤링 옵션
+
+
+# 기본 제공 크롤러 명세 - 여기에는 문자열만 두어 import 비용이 들지 않도록 합니다.
+BUILTIN_CRAWLERS: Tuple[CrawlerSpec, ...] = (
+    CrawlerSpec(
+        source="ppomppu",
+        target="app.adapters.crawlers.community.ppomppu:PpomppuCrawler",
+        post_type=PostType.COMMUNITY,
+        capabilities=("hot_posts", "category"),
+        base_url="https://www.ppomppu.co.kr",
+    ),
+    CrawlerSpec(
+        source="ruliweb",
+        target="app.adapters.crawlers.community.ruliweb:RuliwebCrawler",
+        post_type=PostType.COMMUNITY,
+        capabilities=("hot_posts", "category"),
+        base_url="https://bbs.ruliweb.com",
+    ),
+    CrawlerSpec(
+        source="clien",
+        target="app.adapters.crawlers.community.clien:ClienCrawler",
+        post_type=PostType.COMMUNITY,
+        capabilities=("hot_posts", "category"),
+        base_url="https://www.clien.net",
+    ),
+    CrawlerSpec(
+        source="etnews",
+        target="app.adapters.crawlers.news.etnews:EtnewsCrawler",
+        post_type=PostType.NEWS,
+        capabilities=("tech_news", "telecom_news"),
+        base_url="https://www.etnews.com",
+    ),
+    CrawlerSpec(
+        source="yonhap",
+        target="app.adapters.crawlers.news.yonhap:YonhapCrawler",
+        post_type=PostType.NEWS,
+        capabilities=("tech_news", "telecom_news"),
+        base_url="https://www.yna.co.kr",
+    ),
+    CrawlerSpec(
+        source="broadcast_commission",
+        target="app.adapters.crawlers.government.broadcast_commission:BroadcastCommissionCrawler",
+        post_type=PostType.GOVERNMENT,
+        capabilities=("notices", "policies"),
+        base_url="https://www.kcc.go.kr",
+    ),
+    CrawlerSpec(
+        source="kait",
+        target="app.adapters.crawlers.government.kait:KaitCrawler",
+        post_type=PostType.GOVERNMENT,
+        capabilities=("notices", "policies"),
+        base_url="https://www.kait.or.kr",
+    ),
+)
+
+
+class CrawlerRegistry:
+    """크롤러 레지스트리 - 소스 이름으로 크롤러를 찾고, 처음 사용할 때 모듈을 import 합니다.
+
+    API 프로세스처럼 크롤러를 쓰지 않는 프로세스는 크롤러 모듈을 전혀 import 하지 않고,
+    특정 소스만 담당하는 워커는 해당 소스의 모듈만 import 합니다.
+    """
+
+    def __init__(self, specs: Optional[List[CrawlerSpec]] = None, discover_entry_points: bool = True):
+        """레지스트리를 초기화합니다.
+
+        Args:
+            specs: 등록할 크롤러 명세 목록 (None이면 기본 제공 크롤러)
+            discover_entry_points: entry point로 설치된 외부 크롤러를 찾을지 여부
+        """
+        self._specs: Dict[str, CrawlerSpec] = {}
+        self._classes: Dict[str, Type[Any]] = {}
+        self._entry_points_discovered = not discover_entry_points
+
+        for spec in (BUILTIN_CRAWLERS if specs is None else specs):
+            self.register(spec)
+
+    def register(self, spec: CrawlerSpec, replace: bool = False) -> None:
+        """크롤러 명세를 등록합니다."""
+        if spec.source in self._specs and not replace:
+            raise ValueError(f"Crawler already registered for source: {spec.source}")
+        self._specs[spec.source] = spec
+        self._classes.pop(spec.source, None)
+
+    def discover(self) -> List[str]:
+        """entry point 그룹에서 외부 크롤러를 찾아 등록합니다 (모듈은 import 하지 않음).
+
+        Returns:
+            새로 등록된 소스 이름 목록
+        """
+        self._entry_points_discovered = True
+        try:
+            from importlib.metadata import entry_points
+            eps = entry_points()
+            group = eps.select(group=ENTRY_POINT_GROUP) if hasattr(eps, "select") else eps.get(ENTRY_POINT_GROUP, [])
+        except Exception as e:
+            logger.warning(f"크롤러 entry point 검색 실패: {e}")
+            return []
+
+        added = []
+        for ep in group:
+            if ep.name in self._specs:
+                logger.warning(f"이미 등록된 크롤러 소스를 건너뜁니다: {ep.name} ({ep.value})")
+                continue
+            self._specs[ep.name] = CrawlerSpec(source=ep.name, target=ep.value, origin="entry_point")
+            added.append(ep.name)
+        return added
+
+    def sources(self, post_type: Optional[PostType] = None) -> List[str]:
+        """등록된 소스 이름 목록을 반환합니다."""
+        self._ensure_discovered()
+        return [
+            source for source, spec in self._specs.items()
+            if post_type is None or spec.post_type == post_type
+        ]
+
+    def get_spec(self, source: str) -> CrawlerSpec:
+        """소스의 크롤러 명세를 반환합니다."""
+        self._ensure_discovered()
+        try:
+            return self._specs[source]
+        except KeyError:
+            raise ValueError(f"Unknown crawler source: {source}") from None
+
+    def is_loaded(self, source: str) -> bool:
+        """소스의 크롤러 모듈이 이미 import 되었는지 확인합니다."""
+        return source in self._classes
+
+    def get_class(self, source: str) -> Type[Any]:
+        """소스의 크롤러 클래스를 반환합니다 (처음 호출 시 모듈을 import)."""
+        cls = self._classes.get(source)
+        if cls is not None:
+            return cls
+
+        spec = self.get_spec(source)
+        module_path, _, attr = spec.target.partition(":")
+        module = importlib.import_module(module_path)
+        cls = getattr(module, attr) if attr else module
+
+        # entry point로 등록된 크롤러는 클래스 속성에서 명세를 보완
+        if spec.post_type is None:
+            spec.post_type = getattr(cls, "post_type", None)
+        if not spec.capabilities:
+            spec.capabilities = tuple(getattr(cls, "capabilities", ()))
+
+        self._classes[source] = cls
+        logger.debug(f"크롤러 로드 완료: {source} -> {spec.target}")
+        return cls
+
+    def create(self, source: str, **kwargs) -> Any:
+        """소스의 크롤러 인스턴스를 생성합니다."""
+        return self.get_class(source)(**kwargs)
+
+    def get_config(self, source: str) -> Dict[str, Any]:
+        """소스의 크롤링 설정을 반환합니다 (공통 설정 + 사이트별 설정 + 명세 옵션)."""
+        spec = self.get_spec(source)
+        from app.infrastructure.config.crawling_config import crawling_config
+
+        config: Dict[str, Any] = {
+            "base_url": spec.base_url,
+            "limit": crawling_config.DEFAULT_CRAWL_LIMIT,
+            "timeout": crawling_config.CRAWL_TIMEOUT,
+            "rate_limit": crawling_config.RATE_LIMIT_PER_MINUTE,
+            "request_delay": crawling_config.REQUEST_DELAY,
+            "max_retries": crawling_config.MAX_RETRIES,
+            "user_agent": crawling_config.USER_AGENT,
+        }
+        config.update(crawling_config.SITE_SETTINGS.get(source, {}))
+        config.update(spec.options)
+        return config
+
+    def describe(self, source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """오케스트레이터에 노출할 크롤러 정보(타입, 기능, 로드 여부)를 반환합니다."""
+        sources = [source] if source else self.sources()
+        described = []
+        for name in sources:
+            spec = self.get_spec(name)
+            described.append({
+                "source": spec.source,
+                "post_type": spec.post_type.value if spec.post_type else None,
+                "capabilities": list(spec.capabilities),
+                "base_url": spec.base_url,
+                "origin": spec.origin,
+                "loaded": self.is_loaded(name),
+            })
+        return described
+
+    def _ensure_discovered(self) -> None:
+        """entry point 검색을 최초 1회 수행합니다."""
+        if not self._entry_points_discovered:
+            self.discover()
+
+
+# 전역 크롤러 레지스트리 인스턴스
+crawler_registry = CrawlerRegistry()
+
+
+def get_crawler_registry() -> CrawlerRegistry:
+    """전역 크롤러 레지스트리를 반환합니다."""
+    return crawler_registry
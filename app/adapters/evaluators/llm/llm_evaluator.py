@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import List, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime
@@ -24,25 +25,41 @@ class LLMEvaluator:
         self.llm = llm_service
     
     async def evaluate_posts(self, posts: List[Dict[str, Any]]) -> List[EvaluationResult]:
-        """게시글들을 평가합니다."""
-        results = []
+        """게시글들을 평가합니다 (LLM 서비스가 지원하면 배치 프롬프트 사용)."""
+        if hasattr(self.llm, "evaluate_batch"):
+            return [
+                EvaluationResult(
+                    post_id=evaluation["id"],
+                    is_relevant=evaluation["is_relevant"],
+                    category=evaluation["category"],
+                    score=evaluation["relevance_score"],
+                    evaluated_at=datetime.utcnow()
+                )
+                for evaluation in await self.llm.evaluate_batch(
+                    [dict(post, id=post.get("id", "unknown")) for post in posts]
+                )
+            ]
         
-        for post in posts:
-            # LLM으로 관련성 평가
-            is_relevant = await self.llm.is_relevant(post["title"] + " " + post["content"])
-            
-            # LLM으로 카테고리 분류
-            category = await self.llm.classify_category(post["title"] + " " + post["content"])
-            
-            # 점수 계산
-            score = 0.8 if is_relevant else 0.2
-            
-            results.append(EvaluationResult(
-                post_id=post.get("id", "unknown"),
-                is_relevant=is_relevant,
-                category=category,
-                score=score,
-                evaluated_at=datetime.utcnow()
-            ))
+        # 게시글별 평가를 동시에 실행 (요청 속도는 LLM 서비스의 스케줄러가 조절)
+        return list(await asyncio.gather(*(self._evaluate_post(post) for post in posts)))
+    
+    async def _evaluate_post(self, post: Dict[str, Any]) -> EvaluationResult:
+        """게시글 하나를 관련성/카테고리 프롬프트로 평가합니다."""
+        text = post["title"] + " " + post["content"]
+        
+        # LLM으로 관련성 평가와 카테고리 분류를 동시에 요청
+        is_relevant, category = await asyncio.gather(
+            self.llm.is_relevant(text),
+            self.llm.classify_category(text)
+        )
+        
+        # 점수 계산
+        score = 0.8 if is_relevant else 0.2
         
-        return results
+        return EvaluationResult(
+            post_id=post.get("id", "unknown"),
+            is_relevant=is_relevant,
+            category=category,
+            score=score,
+            evaluated_at=datetime.utcnow()
+        )
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import List, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime
+from app.modules.evaluation.keywords import get_keyword_matcher
 
 
 @dataclass
@@ -22,30 +24,31 @@ class RelevanceEvaluator:
     
     def __init__(self, llm_service):
         self.llm = llm_service
-        self.keywords = ["통신", "5G", "이통", "KT", "SKT", "LGU", "방통위", "KAIT"]
+        self.matcher = get_keyword_matcher()
+        self.keywords = self.matcher.keywords
     
     async def evaluate_relevance(self, posts: List[Dict[str, Any]]) -> List[RelevanceResult]:
         """게시글들의 관련성을 평가합니다."""
-        results = []
+        # 게시글별 평가를 동시에 실행 (요청 속도는 LLM 서비스의 스케줄러가 조절)
+        return list(await asyncio.gather(*(self._evaluate_post(post) for post in posts)))
+    
+    async def _evaluate_post(self, post: Dict[str, Any]) -> RelevanceResult:
+        """게시글 하나의 관련성을 평가합니다."""
+        text = post["title"] + " " + post["content"]
+        
+        # 키워드 매칭
+        keywords_found = self.matcher.match(text).keywords
+        
+        # LLM 관련성 평가
+        is_relevant = await self.llm.is_relevant(text)
         
-        for post in posts:
-            text = post["title"] + " " + post["content"]
-            
-            # 키워드 매칭
-            keywords_found = [kw for kw in self.keywords if kw in text]
-            
-            # LLM 관련성 평가
-            is_relevant = await self.llm.is_relevant(text)
-            
-            # 신뢰도 계산
-            confidence = 0.9 if keywords_found else 0.7
-            
-            results.append(RelevanceResult(
-                post_id=post.get("id", "unknown"),
-                is_relevant=is_relevant,
-                confidence=confidence,
-                keywords_found=keywords_found,
-                evaluated_at=datetime.utcnow()
-            ))
+        # 신뢰도 계산
+        confidence = 0.9 if keywords_found else 0.7
         
-        return results
+        return RelevanceResult(
+            post_id=post.get("id", "unknown"),
+            is_relevant=is_relevant,
+            confidence=confidence,
+            keywords_found=keywords_found,
+            evaluated_at=datetime.utcnow()
+        )
@@ -0,0 +1,9 @@
+"""Rule-based evaluators - 규칙 기반 평가자들."""
+
+from .keyword_evaluator import KeywordEvaluator
+from .category_evaluator import CategoryEvaluator
+
+__all__ = [
+    "KeywordEvaluator",
+    "CategoryEvaluator",
+]
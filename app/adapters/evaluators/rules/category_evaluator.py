@@ -0,0 +1,42 @@
+"""Category evaluator - 키워드 기반 카테고리 분류 전용."""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from app.modules.evaluation.keywords import KeywordMatcher, get_keyword_matcher
+
+
+@dataclass
+class CategoryResult:
+    """카테고리 분류 결과."""
+    post_id: str
+    category: str
+    keyword_counts: Dict[str, int]
+    evaluated_at: datetime
+
+
+class CategoryEvaluator:
+    """카테고리 평가자 - 가장 많이 언급된 사업자/기관으로 분류합니다."""
+    
+    def __init__(self, matcher: Optional[KeywordMatcher] = None, categories: Optional[List[str]] = None):
+        self.matcher = matcher or get_keyword_matcher()
+        self.categories = categories or ["SKT", "KT", "LGU", "방통위", "KAIT"]
+    
+    async def classify(self, posts: List[Dict[str, Any]]) -> List[CategoryResult]:
+        """게시글들을 키워드 출현 횟수로 분류합니다 (해당 키워드가 없으면 OTHER)."""
+        results = []
+        
+        for post in posts:
+            match = self.matcher.match(post["title"] + " " + post["content"])
+            counts = {category: match.counts[category] for category in self.categories if category in match.counts}
+            
+            results.append(CategoryResult(
+                post_id=post.get("id", "unknown"),
+                category=max(counts, key=counts.get) if counts else "OTHER",
+                keyword_counts=match.counts,
+                evaluated_at=datetime.utcnow()
+            ))
+        
+        return results
@@ -0,0 +1,41 @@
+"""Keyword evaluator - 키워드 사전 필터 전용."""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from app.modules.evaluation.keywords import RelevancePrefilter, engagement_score
+
+
+@dataclass
+class KeywordResult:
+    """키워드 평가 결과."""
+    post_id: str
+    keyword_counts: Dict[str, int]
+    engagement: int
+    needs_llm: bool
+    evaluated_at: datetime
+
+
+class KeywordEvaluator:
+    """키워드 평가자 - LLM 평가가 필요한 게시글을 고릅니다."""
+    
+    def __init__(self, prefilter: Optional[RelevancePrefilter] = None):
+        self.prefilter = prefilter or RelevancePrefilter()
+    
+    async def evaluate_keywords(self, posts: List[Dict[str, Any]]) -> List[KeywordResult]:
+        """게시글들의 키워드 출현과 LLM 평가 필요 여부를 구합니다."""
+        results = []
+        
+        for post in posts:
+            needs_llm, match = self.prefilter.check(post)
+            results.append(KeywordResult(
+                post_id=post.get("id", "unknown"),
+                keyword_counts=match.counts,
+                engagement=engagement_score(post),
+                needs_llm=needs_llm,
+                evaluated_at=datetime.utcnow()
+            ))
+        
+        return results
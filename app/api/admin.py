@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 
 from app.infrastructure.di import get_dependency_container
+from app.infrastructure.external.llm.scheduler import PRIORITY_INTERACTIVE, request_priority
 
 router = APIRouter()
 
@@ -57,15 +58,16 @@ async def test_email_send(subject: str = "테스트 이메일") -> Dict[str, Any
 
 @router.post("/test_llm")
 async def test_llm_processing(text: str = "통신 관련 뉴스입니다.") -> Dict[str, Any]:
-    """LLM 처리 기능을 테스트합니다."""
+    """LLM 처리 기능을 테스트합니다 (대화형 우선순위로 대량 평가 요청보다 먼저 처리)."""
     try:
         container = get_dependency_container()
         llm_service = container.get_llm_service()
         
         # LLM 관련성 평가 테스트
-        is_relevant = await llm_service.is_relevant(text)
-        category = await llm_service.classify_category(text)
-        summary = await llm_service.summarize(text, sentences=2)
+        with request_priority(PRIORITY_INTERACTIVE):
+            is_relevant = await llm_service.is_relevant(text)
+            category = await llm_service.classify_category(text)
+            summary = await llm_service.summarize(text, sentences=2)
         
         return {
             "success": True,
@@ -80,3 +82,49 @@ async def test_llm_processing(text: str = "통신 관련 뉴스입니다.") -> D
         raise HTTPException(status_code=500, detail=f"LLM 처리 테스트 실패: {str(e)}")
 
 
+@router.get("/llm_cache")
+async def llm_cache_stats() -> Dict[str, Any]:
+    """LLM 응답 캐시의 적중/실패 통계와 제공자 프롬프트 캐시의 읽기/기록 토큰을 조회합니다."""
+    container = get_dependency_container()
+    llm_service = container.get_llm_service()
+    
+    prompt_cache = llm_service.prompt_cache_stats() if hasattr(llm_service, "prompt_cache_stats") else None
+    if not hasattr(llm_service, "cache_stats"):
+        return {"enabled": False, "prompt_cache": prompt_cache}
+    return {"enabled": True, **llm_service.cache_stats(), "prompt_cache": prompt_cache}
+
+
+@router.get("/llm_routing")
+async def llm_routing_stats() -> Dict[str, Any]:
+    """LLM 제공자 라우팅 통계(장애 전환, 헤지 요청, 서킷 상태, p95 지연)를 조회합니다."""
+    container = get_dependency_container()
+    llm_service = container.get_llm_service()
+    
+    if not hasattr(llm_service, "routing_stats"):
+        return {"enabled": False, "provider": getattr(llm_service, "name", None)}
+    return {"enabled": True, **llm_service.routing_stats()}
+
+
+@router.get("/evaluation_cascade")
+async def evaluation_cascade_stats() -> Dict[str, Any]:
+    """평가 캐스케이드 통계(에스컬레이션 비율과 사유, 단계별 평균 지연)를 조회합니다."""
+    container = get_dependency_container()
+    evaluation_service = container.get_evaluation_service()
+    
+    if evaluation_service.cascade is None:
+        return {"enabled": False}
+    return {"enabled": True, "tier1": evaluation_service.cascade.tier_name, **evaluation_service.cascade_stats()}
+
+
+@router.get("/llm_usage")
+async def llm_usage_stats() -> Dict[str, Any]:
+    """프로세스 전체 LLM 호출 사용량(토큰, 예상 비용, 재시도, 캐시 적중, 지연 백분위)을 템플릿별로 조회합니다."""
+    container = get_dependency_container()
+    return container.get_llm_usage()
+
+
+@router.get("/llm_scheduler")
+async def llm_scheduler_stats() -> Dict[str, Any]:
+    """제공자 계정별 LLM 요청 스케줄러 통계(우선순위 등급별 대기 요청 수, 배정 수, 대기 시간)를 조회합니다."""
+    container = get_dependency_container()
+    return container.get_llm_scheduler_stats()
@@ -24,6 +24,9 @@ class CrawlingConfig(BaseSettings):
     # User Agent
     USER_AGENT: str = "Newsletter System Bot 1.0"
     
+    # 일일 뉴스레터가 크롤링할 소스 (쉼표 구분, 비어 있으면 Mock 데이터 사용)
+    ENABLED_CRAWL_SOURCES: str = ""
+    
     # Community Crawling Settings
     COMMUNITY_HOT_POSTS_LIMIT: int = 20
     COMMUNITY_CATEGORY_LIMIT: int = 10
@@ -9,6 +9,7 @@ from app.infrastructure.database.models import (
     CrawlSessionDocument,
     EvaluationResultDocument,
     EvaluationSessionDocument,
+    LLMCacheDocument,
 )
 import logging
 
@@ -41,6 +42,7 @@ async def init_db():
                 CrawlSessionDocument,
                 EvaluationResultDocument,
                 EvaluationSessionDocument,
+                LLMCacheDocument,
             ]
         )
         
@@ -12,11 +12,13 @@ class LLMConfig(BaseSettings):
     OPENAI_MODEL: str = "gpt-3.5-turbo"
     OPENAI_MAX_TOKENS: int = 2000
     OPENAI_TEMPERATURE: float = 0.7
+    OPENAI_BASE_URL: Optional[str] = None     # API 주소 재정의 (프록시, 로컬 대체 서버)
     
     # Claude Configuration
     CLAUDE_API_KEY: Optional[str] = None
     CLAUDE_MODEL: str = "claude-3-sonnet-20240229"
     CLAUDE_MAX_TOKENS: int = 2000
+    CLAUDE_BASE_URL: Optional[str] = None     # API 주소 재정의 (프록시, 로컬 대체 서버)
     
     # Gemini Configuration
     GEMINI_API_KEY: Optional[str] = None
@@ -24,13 +26,91 @@ class LLMConfig(BaseSettings):
     GEMINI_MAX_TOKENS: int = 2000
     
     # Default LLM Provider
-    DEFAULT_LLM_PROVIDER: str = "openai"  # openai, claude, gemini
+    DEFAULT_LLM_PROVIDER: str = "openai"  # openai, claude, gemini, simulated (부하 테스트용 시뮬레이터)
+    LLM_PROVIDERS: str = ""                # 우선순위 순 제공자 목록 (예: "claude,openai", 비우면 DEFAULT_LLM_PROVIDER만 사용)
+    
+    # Provider Routing Settings (여러 제공자 사용 시)
+    HEDGE_ENABLED: bool = True                # 응답이 늦으면 다음 제공자에 같은 요청을 보냄
+    HEDGE_PERCENTILE: float = 0.95            # 헤지 요청을 보낼 지연 백분위
+    HEDGE_DEFAULT_DELAY: float = 10.0         # 지연 표본이 부족할 때의 헤지 지연 (초)
+    CIRCUIT_FAILURE_THRESHOLD: int = 5        # 제공자를 차단하는 연속 실패 수
+    CIRCUIT_RESET_SECONDS: float = 60.0       # 차단 후 시험 요청까지의 시간 (초)
     
     # Request Settings
     REQUEST_TIMEOUT: int = 30
+    HTTP_KEEPALIVE_EXPIRY: float = 120.0      # 유휴 keep-alive 연결 유지 시간 (초, 배치 사이 재연결 방지)
+    LLM_WARMUP_ENABLED: bool = True           # 시작 시 LLM 클라이언트 생성과 API 호스트 연결 예열
     MAX_RETRIES: int = 3
     RETRY_DELAY: float = 1.0
     
+    # Rate Limit Settings (제공자 계정 한도에 맞춰 설정)
+    RATE_LIMIT_RPM: int = 50                  # 분당 최대 요청 수
+    RATE_LIMIT_TPM: int = 40000               # 분당 최대 토큰 수 (입력 + 최대 출력 추정치)
+    MAX_CONCURRENT_REQUESTS: int = 8          # 동시에 진행할 최대 요청 수
+    LLM_PRIORITY_WEIGHTS: str = "interactive=8,daily=1,backfill=1"  # 우선순위 등급별 가중 공정 큐잉 가중치
+    INTERACTIVE_RESERVED_SLOTS: int = 1       # interactive 요청만 쓸 수 있는 동시성 슬롯 수
+    
+    # Batch Evaluation Settings (여러 게시글을 하나의 프롬프트로 평가)
+    BATCH_MAX_POSTS: int = 20                 # 배치당 최대 게시글 수
+    BATCH_MAX_INPUT_TOKENS: int = 8000        # 배치 프롬프트의 최대 입력 토큰 (추정치)
+    BATCH_OUTPUT_TOKENS_PER_POST: int = 60    # 게시글당 예상 출력 토큰
+    BATCH_POST_CHARS: int = 1500              # 배치 프롬프트에 포함할 게시글당 최대 글자 수
+    BATCH_JOB_POLL_SECONDS: float = 60.0      # 제공자 배치 작업 완료 확인 간격 (초)
+    BATCH_JOB_TIMEOUT_SECONDS: float = 24 * 3600  # 제공자 배치 작업 최대 대기 시간 (초)
+    
+    # Input Token Limits (작업별 프롬프트에 넣을 본문 최대 토큰, 추정치)
+    TOKENIZER_ENCODING: Optional[str] = None  # tiktoken 인코딩 이름 (예: cl100k_base, 설치 시 정확한 계산)
+    RELEVANCE_INPUT_TOKENS: int = 600         # 관련성 판단: 앞부분 + 키워드 주변 구간
+    CLASSIFY_INPUT_TOKENS: int = 1000         # 카테고리 분류: 앞부분 + 키워드 주변 구간
+    ANALYSIS_INPUT_TOKENS: int = 1500         # 통합 분석(analyze_post): 앞부분 + 키워드 주변 구간
+    SUMMARY_CHUNK_TOKENS: int = 2000          # 요약: 이보다 길면 조각별로 요약 후 합침 (맵리듀스)
+    SUMMARY_MAP_SENTENCES: int = 4            # 맵리듀스 요약의 조각별 요약 문장 수
+    
+    # Local Classifier Settings (지난 LLM 평가 결과로 학습한 로컬 분류기)
+    LOCAL_CLASSIFIER_PATH: Optional[str] = None   # 학습된 모델(.npz) 경로 (없으면 사용 안 함)
+    LOCAL_CLASSIFIER_THRESHOLD: float = 0.9       # 로컬 판정을 사용할 최소 보정 신뢰도
+    
+    # Evaluation Cascade Settings (1단계: 로컬 분류기 또는 소형 모델, 2단계: 기본 모델)
+    CASCADE_ENABLED: bool = True              # 1단계 모델이 있으면 캐스케이드 평가 사용
+    CASCADE_THRESHOLD: float = 0.85           # 1단계 판정을 그대로 사용할 최소 신뢰도
+    CASCADE_STRONG_KEYWORD_HITS: int = 3      # 1단계가 관련 없음으로 판정해도 에스컬레이션할 키워드 수
+    CLAUDE_SMALL_MODEL: Optional[str] = None  # 1단계 소형 모델 (예: claude-3-haiku-20240307)
+    OPENAI_SMALL_MODEL: Optional[str] = None  # 1단계 소형 모델 (예: gpt-4o-mini)
+    
+    # Incremental Evaluation Settings
+    EVALUATION_INCREMENTAL: bool = True       # 제목+본문 해시가 같은 기존 평가 결과는 재사용 (LLM 호출 없음)
+    EVALUATION_WRITE_BATCH_SIZE: int = 100    # 평가 결과를 이만큼 모아 일괄 저장
+    EVALUATION_WRITE_INTERVAL_SECONDS: float = 1.0  # 덜 모였어도 이 시간이 지나면 저장 (세션 진행 상황 갱신 주기)
+    
+    # Response Cache Settings (정규화된 입력 해시 기반 2단계 캐시)
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 10000            # 프로세스 내 LRU 최대 항목 수
+    CACHE_TTL_SECONDS: int = 7 * 24 * 3600    # MongoDB 캐시 보관 기간
+    CACHE_PERSISTENT: bool = True             # MongoDB 2단계 캐시 사용 여부
+    PROMPT_TEMPLATE_VERSION: str = "3"        # 프롬프트 변경 시 올려서 캐시 무효화
+    PROMPT_CACHE_ENABLED: bool = True         # 평가 공통 시스템 프롬프트를 제공자 프롬프트 캐시 접두부로 사용
+    
+    # Classification Settings (카테고리 분류)
+    CLASSIFY_CONSTRAINED: bool = True         # 카테고리마다 한 글자 라벨을 붙여 라벨 하나만 답하게 함
+    CLASSIFY_MAX_TOKENS: int = 2              # 제한 분류 모드의 최대 출력 토큰 수
+    CLASSIFY_MIN_CONFIDENCE: float = 0.5      # 라벨 확률(logprobs 지원 제공자)이 이보다 낮으면 OTHER
+    
+    # LLM Simulator Settings (LLM_PROVIDERS=simulated, API 없이 평가 파이프라인 부하 테스트)
+    SIMULATED_MODEL: str = "simulated"        # 계측 비용 추정에 쓸 모델 이름 (예: gpt-4o-mini)
+    SIMULATED_LATENCY: str = (                # 템플릿별 지연 분포 ("템플릿=fixed|uniform|normal|lognormal:a:b,...", ms)
+        "default=lognormal:800:0.5,relevance=lognormal:400:0.4,classify=lognormal:300:0.3,"
+        "batch_evaluation=lognormal:3000:0.5,analysis=lognormal:1500:0.5"
+    )
+    SIMULATED_RATE_LIMIT_ERROR_RATE: float = 0.0  # 무작위로 낼 429 비율
+    SIMULATED_SERVER_ERROR_RATE: float = 0.0      # 무작위로 낼 5xx 비율
+    SIMULATED_RETRY_AFTER_SECONDS: float = 1.0    # 무작위 429의 Retry-After
+    SIMULATED_RPM: int = 0                    # 시뮬레이션 서버의 분당 요청 한도 (0이면 제한 없음)
+    SIMULATED_TPM: int = 0                    # 시뮬레이션 서버의 분당 토큰 한도 (입력 + 최대 출력, 0이면 제한 없음)
+    SIMULATED_SEED: int = 0                   # 지연/오류 난수 시드 (같은 시드, 같은 요청이면 같은 결과)
+    
+    # Usage Instrumentation Settings
+    LLM_PRICES: str = ""                      # 모델별 100만 토큰당 가격 재정의 ("모델=입력/출력,..." USD, 모델 이름 접두어)
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
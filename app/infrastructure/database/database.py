@@ -8,6 +8,7 @@ import logging
 from app.settings import settings
 from app.infrastructure.database.models.crawling_models import CrawledPostDocument, CrawlSessionDocument
 from app.infrastructure.database.models.evaluation_models import EvaluationResultDocument, EvaluationSessionDocument
+from app.infrastructure.database.models.llm_models import LLMCacheDocument
 from app.infrastructure.database.models.newsletter_models import NewsletterDocument, NewsletterItemDocument, SubscriberDocument
 
 
@@ -45,6 +46,8 @@ async def init_database() -> None:
                 # 평가 관련 모델
                 EvaluationResultDocument,
                 EvaluationSessionDocument,
+                # LLM 관련 모델
+                LLMCacheDocument,
                 # 뉴스레터 관련 모델
                 NewsletterDocument,
                 NewsletterItemDocument,
@@ -3,6 +3,7 @@
 from .newsletter_models import NewsletterDocument, NewsletterItemDocument, SubscriberDocument
 from .crawling_models import CrawledPostDocument, CrawlSessionDocument
 from .evaluation_models import EvaluationResultDocument, EvaluationSessionDocument
+from .llm_models import LLMCacheDocument
 
 __all__ = [
     "NewsletterDocument",
@@ -12,4 +13,5 @@ __all__ = [
     "CrawlSessionDocument",
     "EvaluationResultDocument",
     "EvaluationSessionDocument",
+    "LLMCacheDocument",
 ]
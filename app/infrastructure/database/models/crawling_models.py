@@ -38,6 +38,8 @@ class CrawledPostDocument(Document):
     comments: int = Field(default=0, ge=0, description="댓글 수")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="추가 메타데이터")
     crawled_at: datetime = Field(default_factory=datetime.utcnow, description="크롤링 시간")
+    simhash: Optional[int] = Field(None, description="제목+본문 SimHash 지문 (부호 있는 int64로 저장)")
+    duplicate_of: Optional[str] = Field(None, description="유사 중복일 경우 원본 게시글 ID")
     
     class Settings:
         name = "crawled_posts"
@@ -46,6 +48,7 @@ class CrawledPostDocument(Document):
             "post_type",
             "crawled_at",
             "url",
+            "simhash",
         ]
 
 
@@ -6,6 +6,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from beanie import Document, Indexed
 from pydantic import Field
+from pymongo import ASCENDING, IndexModel
 from enum import Enum
 
 
@@ -27,6 +28,7 @@ class EvaluationResultDocument(Document):
     confidence: float = Field(..., ge=0.0, le=1.0, description="신뢰도")
     details: Dict[str, Any] = Field(default_factory=dict, description="평가 세부 정보")
     evaluated_at: datetime = Field(default_factory=datetime.utcnow, description="평가 시간")
+    content_hash: Optional[str] = Field(None, description="평가한 제목+본문의 해시")
     
     class Settings:
         name = "evaluation_results"
@@ -36,12 +38,14 @@ class EvaluationResultDocument(Document):
             "category",
             "relevance_score",
             "evaluated_at",
+            IndexModel([("post_id", ASCENDING), ("content_hash", ASCENDING)]),
         ]
 
 
 class EvaluationSessionDocument(Document):
     """평가 세션 문서 모델."""
     
+    session_id: str = Field(..., description="평가 세션 ID (엔티티 ID)")
     total_posts: int = Field(default=0, ge=0, description="전체 게시글 수")
     evaluated_posts: int = Field(default=0, ge=0, description="평가 완료된 게시글 수")
     relevant_posts: int = Field(default=0, ge=0, description="관련성 있는 게시글 수")
@@ -50,10 +54,13 @@ class EvaluationSessionDocument(Document):
     started_at: datetime = Field(default_factory=datetime.utcnow, description="시작 시간")
     completed_at: Optional[datetime] = Field(None, description="완료 시간")
     error_message: Optional[str] = Field(None, description="에러 메시지")
+    batch_job_id: Optional[str] = Field(None, description="제공자 배치 작업 ID (배치 작업 모드)")
+    llm_usage: Dict[str, Any] = Field(default_factory=dict, description="LLM 호출 계측 (토큰, 비용, 지연 백분위, 템플릿별 합계)")
     
     class Settings:
         name = "evaluation_sessions"
         indexes = [
+            IndexModel([("session_id", ASCENDING)], unique=True),
             "status",
             "started_at",
         ]
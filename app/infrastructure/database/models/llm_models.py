@@ -0,0 +1,28 @@
+"""LLM MongoDB 모델들 - Beanie ODM을 사용한 문서 모델 정의."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+from datetime import datetime
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class LLMCacheDocument(Document):
+    """LLM 응답 캐시 문서 모델 (expires_at TTL 인덱스로 자동 만료)."""
+    
+    key: str = Field(..., description="캐시 키 (provider, model, 템플릿 버전, 메서드, 정규화된 입력의 해시)")
+    provider: str = Field(..., description="LLM 제공자 이름")
+    model: Optional[str] = Field(None, description="모델 이름")
+    method: str = Field(..., description="캐시된 메서드 이름")
+    value: Any = Field(None, description="캐시된 응답 값")
+    created_at: datetime = Field(default_factory=datetime.utcnow, description="저장 시간")
+    expires_at: datetime = Field(..., description="만료 시간")
+    
+    class Settings:
+        name = "llm_cache"
+        indexes = [
+            IndexModel([("key", ASCENDING)], unique=True),
+            IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+        ]
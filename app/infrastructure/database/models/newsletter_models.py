@@ -27,6 +27,7 @@ class NewsletterItemDocument(Document):
     category: str = Field(..., description="카테고리")
     relevance_score: float = Field(..., ge=0.0, le=1.0, description="관련성 점수")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="생성 시간")
+    related_urls: List[str] = Field(default_factory=list, description="같은 스토리의 다른 소스 URL들")
     
     class Settings:
         name = "newsletter_items"
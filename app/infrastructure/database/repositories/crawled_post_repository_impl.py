@@ -5,18 +5,25 @@ from __future__ import annotations
 from typing import List, Optional
 from datetime import datetime
 from beanie import PydanticObjectId
+from beanie.operators import In
 
 from app.modules.crawling.entities import CrawledPost, PostType
+from app.modules.crawling.fingerprints import from_signed64, to_signed64
 from app.modules.crawling.repositories import CrawledPostRepository
+from app.infrastructure.database.models.crawling_models import CrawledPostDocument
 
 
 class CrawledPostRepositoryImpl(CrawledPostRepository):
     """크롤링된 게시글 레포지토리 구현체 - MongoDB 기반."""
 
     async def save(self, post: CrawledPost) -> str:
-        """게시글을 MongoDB에 저장합니다."""
-        # TODO: 실제 MongoDB 저장 로직 구현
-        return str(PydanticObjectId())
+        """게시글을 MongoDB에 저장합니다 (같은 URL이 있으면 덮어써 지문/중복 정보를 갱신)."""
+        doc = self._entity_to_document(post)
+        existing = await CrawledPostDocument.find_one(CrawledPostDocument.url == post.url)
+        if existing is not None:
+            doc.id = existing.id
+        await doc.save()
+        return str(doc.id)
 
     async def get_by_id(self, post_id: str) -> Optional[CrawledPost]:
         """ID로 게시글을 조회합니다."""
@@ -37,3 +44,57 @@ class CrawledPostRepositoryImpl(CrawledPostRepository):
         """최근 크롤링된 게시글 목록을 조회합니다."""
         # TODO: 실제 MongoDB 조회 로직 구현
         return []
+
+    async def list_since(self, since: datetime, limit: int = 5000) -> List[CrawledPost]:
+        """특정 시점 이후 크롤링된 게시글 목록을 최신순으로 조회합니다."""
+        docs = await CrawledPostDocument.find(
+            CrawledPostDocument.crawled_at >= since
+        ).sort(-CrawledPostDocument.crawled_at).limit(limit).to_list()
+
+        return [self._document_to_entity(doc) for doc in docs]
+
+    async def get_many(self, post_ids: List[str]) -> List[CrawledPost]:
+        """여러 ID의 게시글을 한 번의 $in 쿼리로 조회합니다 (없는 ID는 제외)."""
+        object_ids = [PydanticObjectId(post_id) for post_id in post_ids if PydanticObjectId.is_valid(post_id)]
+        if not object_ids:
+            return []
+        docs = await CrawledPostDocument.find(In(CrawledPostDocument.id, object_ids)).to_list()
+
+        return [self._document_to_entity(doc) for doc in docs]
+
+    def _entity_to_document(self, post: CrawledPost) -> CrawledPostDocument:
+        """엔티티를 문서로 변환합니다 (SimHash는 부호 있는 int64로 저장)."""
+        return CrawledPostDocument(
+            title=post.title,
+            content=post.content,
+            url=post.url,
+            source=post.source,
+            post_type=post.post_type.value,
+            author=post.author,
+            views=post.views,
+            likes=post.likes,
+            comments=post.comments,
+            metadata=post.metadata,
+            crawled_at=post.crawled_at,
+            simhash=to_signed64(post.simhash) if post.simhash is not None else None,
+            duplicate_of=post.duplicate_of,
+        )
+
+    def _document_to_entity(self, doc: CrawledPostDocument) -> CrawledPost:
+        """문서를 엔티티로 변환합니다."""
+        return CrawledPost(
+            id=str(doc.id),
+            title=doc.title,
+            content=doc.content,
+            url=doc.url,
+            source=doc.source,
+            post_type=PostType(doc.post_type.value),
+            author=doc.author,
+            views=doc.views,
+            likes=doc.likes,
+            comments=doc.comments,
+            metadata=doc.metadata,
+            crawled_at=doc.crawled_at,
+            simhash=from_signed64(doc.simhash) if doc.simhash is not None else None,
+            duplicate_of=doc.duplicate_of,
+        )
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
-from beanie import PydanticObjectId
+from typing import Dict, List, Optional
+from beanie.operators import Set
 
-from app.modules.evaluation.entities import EvaluationResult, EvaluationSession
+from app.modules.evaluation.entities import EvaluationResult, EvaluationSession, EvaluationStatus
 from app.modules.evaluation.repositories import EvaluationResultRepository, EvaluationSessionRepository
+from app.infrastructure.database.models.evaluation_models import EvaluationResultDocument, EvaluationSessionDocument
 
 
 class EvaluationResultRepositoryImpl(EvaluationResultRepository):
@@ -14,8 +15,18 @@ class EvaluationResultRepositoryImpl(EvaluationResultRepository):
 
     async def save(self, result: EvaluationResult) -> str:
         """평가 결과를 MongoDB에 저장합니다."""
-        # TODO: 실제 MongoDB 저장 로직 구현
-        return str(PydanticObjectId())
+        doc = await self._entity_to_document(result).insert()
+        return str(doc.id)
+
+    async def save_many(self, results: List[EvaluationResult]) -> List[str]:
+        """평가 결과들을 한 번의 순서 없는 insert_many로 저장합니다 (일부 문서가 실패해도 나머지는 저장)."""
+        if not results:
+            return []
+        inserted = await EvaluationResultDocument.insert_many(
+            [self._entity_to_document(result) for result in results],
+            ordered=False
+        )
+        return [str(inserted_id) for inserted_id in inserted.inserted_ids]
 
     async def get_by_id(self, result_id: str) -> Optional[EvaluationResult]:
         """ID로 평가 결과를 조회합니다."""
@@ -37,26 +48,119 @@ class EvaluationResultRepositoryImpl(EvaluationResultRepository):
         # TODO: 실제 MongoDB 조회 로직 구현
         return []
 
+    async def list_recent(self, limit: int = 50000) -> List[EvaluationResult]:
+        """최근 평가 결과 목록을 최신순으로 조회합니다."""
+        docs = await EvaluationResultDocument.find_all().sort(
+            -EvaluationResultDocument.evaluated_at
+        ).limit(limit).to_list()
+
+        return [self._document_to_entity(doc) for doc in docs]
+
+    async def list_by_content_hashes(self, content_hashes: Dict[str, str]) -> List[EvaluationResult]:
+        """게시글 ID와 내용 해시를 $in 조건 하나로 조회하고, 정확히 일치하는 쌍만 반환합니다."""
+        if not content_hashes:
+            return []
+        docs = await EvaluationResultDocument.find({
+            "post_id": {"$in": list(content_hashes)},
+            "content_hash": {"$in": list(set(content_hashes.values()))},
+        }).to_list()
+
+        return [
+            self._document_to_entity(doc) for doc in docs
+            if content_hashes.get(doc.post_id) == doc.content_hash
+        ]
+
+    def _entity_to_document(self, result: EvaluationResult) -> EvaluationResultDocument:
+        """엔티티를 문서로 변환합니다."""
+        return EvaluationResultDocument(
+            post_id=result.post_id,
+            is_relevant=result.is_relevant,
+            category=result.category,
+            relevance_score=result.relevance_score,
+            confidence=result.confidence,
+            details=result.details,
+            evaluated_at=result.evaluated_at,
+            content_hash=result.content_hash,
+        )
+
+    def _document_to_entity(self, doc: EvaluationResultDocument) -> EvaluationResult:
+        """문서를 엔티티로 변환합니다."""
+        return EvaluationResult(
+            id=str(doc.id),
+            post_id=doc.post_id,
+            is_relevant=doc.is_relevant,
+            category=doc.category,
+            relevance_score=doc.relevance_score,
+            confidence=doc.confidence,
+            details=doc.details,
+            evaluated_at=doc.evaluated_at,
+            content_hash=doc.content_hash,
+        )
+
 
 class EvaluationSessionRepositoryImpl(EvaluationSessionRepository):
     """평가 세션 레포지토리 구현체 - MongoDB 기반."""
 
     async def save(self, session: EvaluationSession) -> str:
-        """세션을 MongoDB에 저장합니다."""
-        # TODO: 실제 MongoDB 저장 로직 구현
-        return str(PydanticObjectId())
+        """세션을 MongoDB에 저장합니다 (같은 세션 ID가 있으면 카운터/상태를 덮어씀)."""
+        doc = self._entity_to_document(session)
+        existing = await EvaluationSessionDocument.find_one(EvaluationSessionDocument.session_id == session.id)
+        if existing is not None:
+            doc.id = existing.id
+        await doc.save()
+        return session.id
 
     async def get_by_id(self, session_id: str) -> Optional[EvaluationSession]:
         """ID로 세션을 조회합니다."""
-        # TODO: 실제 MongoDB 조회 로직 구현
-        return None
+        doc = await EvaluationSessionDocument.find_one(EvaluationSessionDocument.session_id == session_id)
+        return self._document_to_entity(doc) if doc is not None else None
 
     async def list_by_status(self, status: str) -> List[EvaluationSession]:
-        """상태별 세션 목록을 조회합니다."""
-        # TODO: 실제 MongoDB 조회 로직 구현
-        return []
+        """상태별 세션 목록을 최신순으로 조회합니다."""
+        docs = await EvaluationSessionDocument.find(
+            EvaluationSessionDocument.status == status
+        ).sort(-EvaluationSessionDocument.started_at).to_list()
+
+        return [self._document_to_entity(doc) for doc in docs]
 
     async def update_status(self, session_id: str, status: str, error_message: str = None) -> bool:
         """세션 상태를 업데이트합니다."""
-        # TODO: 실제 MongoDB 업데이트 로직 구현
-        return True
+        result = await EvaluationSessionDocument.find_one(
+            EvaluationSessionDocument.session_id == session_id
+        ).update(Set({
+            EvaluationSessionDocument.status: status,
+            EvaluationSessionDocument.error_message: error_message,
+        }))
+        return bool(result and result.matched_count)
+
+    def _entity_to_document(self, session: EvaluationSession) -> EvaluationSessionDocument:
+        """엔티티를 문서로 변환합니다."""
+        return EvaluationSessionDocument(
+            session_id=session.id,
+            total_posts=session.total_posts,
+            evaluated_posts=session.evaluated_posts,
+            relevant_posts=session.relevant_posts,
+            irrelevant_posts=session.irrelevant_posts,
+            status=session.status.value,
+            started_at=session.started_at,
+            completed_at=session.completed_at,
+            error_message=session.error_message,
+            batch_job_id=session.batch_job_id,
+            llm_usage=session.llm_usage,
+        )
+
+    def _document_to_entity(self, doc: EvaluationSessionDocument) -> EvaluationSession:
+        """문서를 엔티티로 변환합니다."""
+        return EvaluationSession(
+            id=doc.session_id,
+            total_posts=doc.total_posts,
+            evaluated_posts=doc.evaluated_posts,
+            relevant_posts=doc.relevant_posts,
+            irrelevant_posts=doc.irrelevant_posts,
+            status=EvaluationStatus(doc.status.value),
+            started_at=doc.started_at,
+            completed_at=doc.completed_at,
+            error_message=doc.error_message,
+            batch_job_id=doc.batch_job_id,
+            llm_usage=doc.llm_usage,
+        )
@@ -40,6 +40,7 @@ class NewsletterRepositoryImpl(NewsletterRepository):
                 category=item.category,
                 relevance_score=item.relevance_score,
                 created_at=item.created_at,
+                related_urls=item.related_urls,
             )
             newsletter_doc.items.append(item_doc)
         
@@ -94,6 +95,7 @@ class NewsletterRepositoryImpl(NewsletterRepository):
                 category=item_doc.category,
                 relevance_score=item_doc.relevance_score,
                 created_at=item_doc.created_at,
+                related_urls=item_doc.related_urls,
             )
             items.append(item)
         
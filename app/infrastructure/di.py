@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional, Any
+import os
+from typing import Dict, List, Optional, Any
 from app.infrastructure.database.database import get_database_client
 from app.infrastructure.database.repositories import (
     NewsletterRepositoryImpl,
@@ -15,14 +16,137 @@ from app.infrastructure.database.repositories import (
 from app.modules.newsletter.repositories import NewsletterRepository, SubscriberRepository
 from app.modules.crawling.repositories import CrawledPostRepository, CrawlSessionRepository
 from app.modules.evaluation.repositories import EvaluationResultRepository, EvaluationSessionRepository
+from app.modules.evaluation.cascade import EvaluationCascade
+from app.modules.evaluation.services import LLMEvaluationService
+from app.modules.evaluation.use_cases import EvaluatePostsUseCase
 from app.modules.newsletter.services import NewsletterService, TemplateService
 from app.modules.newsletter.use_cases import DailyNewsletterUseCase
+from app.modules.newsletter.clustering import StoryClusterer
 from app.infrastructure.external.llm.mock import MockLLM
+from app.infrastructure.external.llm.cache import CachedLLMService, MongoLLMCacheStore
+from app.infrastructure.external.llm.claude import ClaudeService
+from app.infrastructure.external.llm.openai import OpenAIService
+from app.infrastructure.external.llm.router import RoutingLLMService
+from app.infrastructure.external.llm.simulated import SimulatedLLM
+from app.infrastructure.external.llm.scheduler import LLMScheduler
+from app.infrastructure.external.llm.local_classifier import LocalClassifierService
+from app.infrastructure.external.llm.instrumentation import get_usage_registry, track_usage
+from app.infrastructure.config.llm_config import llm_config
+from app.infrastructure.config.crawling_config import crawling_config
 from app.infrastructure.external.email.smtp import SMTPEmailService
+from app.adapters.crawlers.registry import CrawlerRegistry, get_crawler_registry
 
 logger = logging.getLogger(__name__)
 
 
+def _create_llm_service(
+    cache_store: Optional[MongoLLMCacheStore] = None,
+    schedulers: Optional[Dict[str, LLMScheduler]] = None
+):
+    """설정된 LLM 제공자들로 LLM 서비스를 만듭니다.
+
+    LLM_PROVIDERS(없으면 DEFAULT_LLM_PROVIDER) 중 API 키가 있는 제공자만 사용하며,
+    둘 이상이면 장애 전환/헤지 요청/서킷 브레이커를 적용하는 RoutingLLMService로 묶습니다.
+    schedulers는 제공자 계정별 요청 스케줄러로, 같은 계정을 쓰는 서비스들이 한 대기열과 예산을 공유합니다.
+    """
+    schedulers = schedulers if schedulers is not None else {}
+    factories = {
+        "claude": lambda: ClaudeService({
+            "api_key": llm_config.CLAUDE_API_KEY,
+            "model": llm_config.CLAUDE_MODEL,
+            "max_tokens": llm_config.CLAUDE_MAX_TOKENS,
+            "base_url": llm_config.CLAUDE_BASE_URL,
+            "cache_store": cache_store,
+            "scheduler": schedulers.setdefault("claude", LLMScheduler.from_config()),
+        }) if llm_config.CLAUDE_API_KEY else None,
+        "openai": lambda: OpenAIService({
+            "api_key": llm_config.OPENAI_API_KEY,
+            "model": llm_config.OPENAI_MODEL,
+            "max_tokens": llm_config.OPENAI_MAX_TOKENS,
+            "base_url": llm_config.OPENAI_BASE_URL,
+            "cache_store": cache_store,
+            "scheduler": schedulers.setdefault("openai", LLMScheduler.from_config()),
+        }) if llm_config.OPENAI_API_KEY else None,
+        # 부하 테스트용 시뮬레이터 (API 키 불필요, SIMULATED_* 설정 사용)
+        "simulated": lambda: SimulatedLLM({
+            "cache_store": cache_store,
+            "scheduler": schedulers.setdefault("simulated", LLMScheduler.from_config()),
+        }),
+    }
+
+    names = [name.strip().lower() for name in (llm_config.LLM_PROVIDERS or llm_config.DEFAULT_LLM_PROVIDER).split(",")]
+    providers = []
+    for name in dict.fromkeys(names):
+        provider = factories[name]() if name in factories else None
+        if provider is None:
+            if llm_config.LLM_PROVIDERS:
+                logger.warning(f"LLM 제공자 {name}을(를) 사용할 수 없습니다 (미지원 또는 API 키 없음)")
+            continue
+        providers.append(provider)
+
+    if not providers:
+        return MockLLM()
+    if len(providers) == 1:
+        return providers[0]
+    return RoutingLLMService(providers)
+
+
+def _create_local_classifier(fallback) -> Optional[LocalClassifierService]:
+    """LOCAL_CLASSIFIER_PATH의 모델로 로컬 분류기를 만듭니다 (신뢰도가 낮으면 fallback LLM 사용)."""
+    path = llm_config.LOCAL_CLASSIFIER_PATH
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        return LocalClassifierService.from_path(path, fallback=fallback)
+    except Exception as e:
+        logger.warning(f"로컬 분류기를 불러올 수 없습니다 ({path}): {e}")
+        return None
+
+
+def _create_small_llm_service(
+    cache_store: Optional[MongoLLMCacheStore] = None,
+    schedulers: Optional[Dict[str, LLMScheduler]] = None
+):
+    """CLAUDE_SMALL_MODEL/OPENAI_SMALL_MODEL이 설정된 제공자 중 첫 번째로 소형 LLM 서비스를 만듭니다.
+
+    소형 모델도 같은 계정 한도를 쓰므로 기본 모델과 스케줄러를 공유합니다.
+    """
+    schedulers = schedulers if schedulers is not None else {}
+    names = [name.strip().lower() for name in (llm_config.LLM_PROVIDERS or llm_config.DEFAULT_LLM_PROVIDER).split(",")]
+    for name in dict.fromkeys(names):
+        if name == "claude" and llm_config.CLAUDE_API_KEY and llm_config.CLAUDE_SMALL_MODEL:
+            return ClaudeService({
+                "api_key": llm_config.CLAUDE_API_KEY,
+                "model": llm_config.CLAUDE_SMALL_MODEL,
+                "max_tokens": llm_config.CLAUDE_MAX_TOKENS,
+                "base_url": llm_config.CLAUDE_BASE_URL,
+                "cache_store": cache_store,
+                "scheduler": schedulers.setdefault("claude", LLMScheduler.from_config()),
+            })
+        if name == "openai" and llm_config.OPENAI_API_KEY and llm_config.OPENAI_SMALL_MODEL:
+            return OpenAIService({
+                "api_key": llm_config.OPENAI_API_KEY,
+                "model": llm_config.OPENAI_SMALL_MODEL,
+                "max_tokens": llm_config.OPENAI_MAX_TOKENS,
+                "base_url": llm_config.OPENAI_BASE_URL,
+                "cache_store": cache_store,
+                "scheduler": schedulers.setdefault("openai", LLMScheduler.from_config()),
+            })
+    return None
+
+
+def _create_evaluation_cascade(local_classifier, small_llm_service) -> Optional[EvaluationCascade]:
+    """로컬 분류기(없으면 소형 LLM)를 1단계로 하는 평가 캐스케이드를 만듭니다."""
+    first_tier = local_classifier or small_llm_service
+    if not llm_config.CASCADE_ENABLED or first_tier is None:
+        return None
+    return EvaluationCascade(
+        first_tier,
+        threshold=llm_config.CASCADE_THRESHOLD,
+        strong_keyword_hits=llm_config.CASCADE_STRONG_KEYWORD_HITS
+    )
+
+
 class Container:
     """의존성 주입 컨테이너 - 새로운 모듈 구조에 맞는 DI 관리."""
 
@@ -53,8 +177,24 @@ class Container:
         newsletter_service = NewsletterService(newsletter_repo, None)
         template_service = TemplateService()
         
-        # 외부 서비스들 생성 (개발용 Mock 사용)
-        llm_service = MockLLM()
+        # 외부 서비스들 생성 (API 키가 설정된 제공자가 없으면 개발용 Mock 사용)
+        cache_store = MongoLLMCacheStore() if llm_config.CACHE_ENABLED and llm_config.CACHE_PERSISTENT else None
+        schedulers: Dict[str, LLMScheduler] = {}
+        llm_service = _create_llm_service(cache_store, schedulers)
+        if llm_config.CACHE_ENABLED:
+            # 같은 입력의 반복 평가는 LRU → MongoDB 캐시에서 응답
+            llm_service = CachedLLMService(llm_service, store=cache_store)
+        local_classifier = _create_local_classifier(llm_service)
+        small_llm_service = _create_small_llm_service(cache_store, schedulers)
+        evaluation_service = LLMEvaluationService(
+            llm_service,
+            evaluation_result_repo,
+            cascade=_create_evaluation_cascade(local_classifier, small_llm_service),
+            incremental=llm_config.EVALUATION_INCREMENTAL,
+            content_version=llm_config.PROMPT_TEMPLATE_VERSION,
+            write_batch_size=llm_config.EVALUATION_WRITE_BATCH_SIZE,
+            write_interval=llm_config.EVALUATION_WRITE_INTERVAL_SECONDS
+        )
         email_service = SMTPEmailService()
 
         # 서비스들을 컨테이너에 저장
@@ -70,7 +210,14 @@ class Container:
             "newsletter_service": newsletter_service,
             "template_service": template_service,
             "llm_service": llm_service,
+            "local_classifier": local_classifier,
+            "llm_schedulers": schedulers,
+            "small_llm_service": small_llm_service,
+            "evaluation_service": evaluation_service,
             "email_service": email_service,
+            
+            # 크롤러 레지스트리 (크롤러 모듈은 처음 사용할 때 import)
+            "crawler_registry": get_crawler_registry(),
         }
 
         self._initialized = True
@@ -111,10 +258,40 @@ class Container:
         """LLM 서비스를 가져옵니다."""
         return self._services["llm_service"]
 
+    def get_local_classifier(self) -> Optional[LocalClassifierService]:
+        """로컬 분류기 서비스를 가져옵니다 (학습된 모델이 없으면 None)."""
+        return self._services["local_classifier"]
+
+    def get_evaluation_service(self) -> LLMEvaluationService:
+        """LLM 평가 서비스를 가져옵니다 (1단계 모델이 있으면 캐스케이드 평가)."""
+        return self._services["evaluation_service"]
+
+    def get_evaluate_posts_use_case(self) -> EvaluatePostsUseCase:
+        """게시글 평가 유즈케이스를 가져옵니다 (배치 작업 모드 지원)."""
+        return EvaluatePostsUseCase(
+            self.get_evaluation_service(),
+            self.get_evaluation_session_repository(),
+            poll_interval=llm_config.BATCH_JOB_POLL_SECONDS,
+            job_timeout=llm_config.BATCH_JOB_TIMEOUT_SECONDS,
+            usage_tracker=track_usage
+        )
+
+    def get_llm_usage(self) -> Dict[str, Any]:
+        """프로세스 전체 LLM 호출 사용량 (토큰, 비용, 지연 백분위, 템플릿별 합계)을 반환합니다."""
+        return get_usage_registry().snapshot()
+
+    def get_llm_scheduler_stats(self) -> Dict[str, Any]:
+        """제공자 계정별 LLM 요청 스케줄러 통계 (우선순위 등급별 대기/배정)를 반환합니다."""
+        return {name: scheduler.scheduler_stats() for name, scheduler in self._services["llm_schedulers"].items()}
+
     def get_email_service(self):
         """이메일 서비스를 가져옵니다."""
         return self._services["email_service"]
 
+    def get_crawler_registry(self) -> CrawlerRegistry:
+        """크롤러 레지스트리를 가져옵니다."""
+        return self._services["crawler_registry"]
+
     def get_daily_newsletter_use_case(self) -> DailyNewsletterUseCase:
         """일일 뉴스레터 유즈케이스를 가져옵니다."""
         # TODO: 실제 크롤링 유즈케이스들 구현 후 연결
@@ -127,6 +304,9 @@ class Container:
         crawl_government_use_case = None  # CrawlGovernmentUseCase()
         evaluate_posts_use_case = None  # EvaluatePostsUseCase()
         
+        # 크롤링할 소스가 설정된 경우에만 레지스트리 사용 (미구현 크롤러 대신 Mock 데이터 유지)
+        sources = [source.strip() for source in crawling_config.ENABLED_CRAWL_SOURCES.split(",") if source.strip()]
+        
         return DailyNewsletterUseCase(
             newsletter_service=self.get_newsletter_service(),
             template_service=self.get_template_service(),
@@ -134,14 +314,41 @@ class Container:
             crawl_news_use_case=crawl_news_use_case,
             crawl_government_use_case=crawl_government_use_case,
             evaluate_posts_use_case=evaluate_posts_use_case,
-            email_sender=self.get_email_service()
+            email_sender=self.get_email_service(),
+            crawler_registry=self.get_crawler_registry() if sources else None,
+            sources=sources or None,
+            story_clusterer=StoryClusterer(),
+            crawled_post_repository=self.get_crawled_post_repository(),
+            llm_service=self.get_llm_service()
         )
 
+    async def warm_up_llm_services(self) -> None:
+        """LLM 제공자 클라이언트를 만들고 API 호스트 연결을 미리 열어 둡니다 (첫 평가의 DNS/TLS/SDK 초기화 비용 제거)."""
+        if not llm_config.LLM_WARMUP_ENABLED:
+            return
+        for service in self._llm_services():
+            try:
+                await service.warm_up()
+            except Exception as e:
+                logger.warning(f"LLM 서비스 {getattr(service, 'name', service)} 예열 실패: {e}")
+
+    def _llm_services(self) -> List[Any]:
+        """컨테이너가 만든 LLM 서비스들 (소형 모델 포함)."""
+        services = [self._services.get("llm_service"), self._services.get("small_llm_service")]
+        return [service for service in services if service is not None]
+
     async def shutdown_resources(self) -> None:
         """컨테이너 리소스를 정리합니다."""
         if not self._initialized:
             return
 
+        # LLM 클라이언트 연결 풀 종료
+        for service in self._llm_services():
+            try:
+                await service.close()
+            except Exception as e:
+                logger.warning(f"LLM 서비스 {getattr(service, 'name', service)} 종료 실패: {e}")
+
         # 데이터베이스 연결 종료
         from app.infrastructure.database.database import close_database
         await close_database()
@@ -2,9 +2,15 @@
 
 from .interfaces import ILLMProvider, ITextProcessor, IContentAnalyzer, IContentGenerator
 from .base import BaseLLMService
+from .structured import StructuredOutputError
+from .scheduler import LLMScheduler, request_priority
+from .cache import CachedLLMService, MongoLLMCacheStore
 from .mock import MockLLM
+from .simulated import SimulatedLLM, SimulatedAPIError
 from .openai import OpenAIService
 from .claude import ClaudeService
+from .router import RoutingLLMService
+from .local_classifier import LocalClassifierService
 
 __all__ = [
     "ILLMProvider",
@@ -12,8 +18,17 @@ __all__ = [
     "IContentAnalyzer",
     "IContentGenerator",
     "BaseLLMService",
+    "StructuredOutputError",
+    "LLMScheduler",
+    "request_priority",
+    "CachedLLMService",
+    "MongoLLMCacheStore",
     "MockLLM",
+    "SimulatedLLM",
+    "SimulatedAPIError",
     "OpenAIService",
     "ClaudeService",
+    "RoutingLLMService",
+    "LocalClassifierService",
 ]
 
@@ -2,8 +2,30 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import json
+import logging
+import re
+import string
+import time
+from typing import List, Dict, Any, Optional, Awaitable, Callable, Tuple
+from app.infrastructure.config.llm_config import llm_config
+from app.modules.evaluation.keywords import DEFAULT_KEYWORDS, get_keyword_matcher
+from .instrumentation import LLMCallRecord, record_llm_call
 from .interfaces import ILLMProvider, ITextProcessor, IContentAnalyzer, IContentGenerator
+from .prompts import evaluation_system_prompt
+from .scheduler import LLMScheduler
+from .similarity import deduplicate_indices
+from .structured import StructuredOutputError, extract_json, validate
+from .summarization import MapReduceSummarizer
+from .tokens import estimate_tokens, keyword_excerpt
+
+logger = logging.getLogger(__name__)
+
+# 제한 분류 모드에서 라벨을 얻지 못했거나 신뢰도가 낮을 때 사용하는 카테고리
+FALLBACK_CATEGORY = "OTHER"
+
+_JSON_ARRAY_PATTERN = re.compile(r"\[.*\]", re.DOTALL)
 
 
 class BaseLLMService(ILLMProvider, ITextProcessor, IContentAnalyzer, IContentGenerator):
@@ -13,6 +35,38 @@ class BaseLLMService(ILLMProvider, ITextProcessor, IContentAnalyzer, IContentGen
         self.name = name
         self.config = config or {}
         self._initialized = False
+        
+        # 일괄 평가 설정
+        self.batch_max_posts = self.config.get("batch_max_posts", llm_config.BATCH_MAX_POSTS)
+        self.batch_max_input_tokens = self.config.get("batch_max_input_tokens", llm_config.BATCH_MAX_INPUT_TOKENS)
+        self.batch_output_tokens_per_post = self.config.get("batch_output_tokens_per_post", llm_config.BATCH_OUTPUT_TOKENS_PER_POST)
+        self.batch_post_chars = self.config.get("batch_post_chars", llm_config.BATCH_POST_CHARS)
+        
+        # 작업별 입력 토큰 한도 (긴 본문은 앞부분 + 키워드 주변 구간만 전송)
+        self.input_token_limits = {
+            "relevance": self.config.get("relevance_input_tokens", llm_config.RELEVANCE_INPUT_TOKENS),
+            "classify": self.config.get("classify_input_tokens", llm_config.CLASSIFY_INPUT_TOKENS),
+            "analysis": self.config.get("analysis_input_tokens", llm_config.ANALYSIS_INPUT_TOKENS),
+        }
+        self.summary_chunk_tokens = self.config.get("summary_chunk_tokens", llm_config.SUMMARY_CHUNK_TOKENS)
+        self._summarizer: Optional[MapReduceSummarizer] = None
+        
+        # 요청 스케줄러 (여러 서비스가 한 계정 한도를 나눠 쓰면 config["scheduler"]로 공유)
+        self.scheduler: LLMScheduler = self.config.get("scheduler") or LLMScheduler.from_config()
+        
+        # 제공자 프롬프트 캐시 (평가 공통 시스템 프롬프트를 캐시 접두부로 사용)
+        self.prompt_cache_enabled = self.config.get("prompt_cache", llm_config.PROMPT_CACHE_ENABLED)
+        self.prompt_cache = {"requests": 0, "input_tokens": 0, "cache_read_tokens": 0, "cache_write_tokens": 0}
+        
+        # HTTP 연결 설정 (연결 풀 크기는 스케줄러 동시성 한도에 맞춤)
+        self.request_timeout = self.config.get("timeout", llm_config.REQUEST_TIMEOUT)
+        self.keepalive_expiry = self.config.get("keepalive_expiry", llm_config.HTTP_KEEPALIVE_EXPIRY)
+        self.http_client = None
+        
+        # 카테고리 분류 모드 (제한 모드: 한 글자 라벨, 최대 출력 토큰 수 제한)
+        self.classify_constrained = self.config.get("classify_constrained", llm_config.CLASSIFY_CONSTRAINED)
+        self.classify_max_tokens = self.config.get("classify_max_tokens", llm_config.CLASSIFY_MAX_TOKENS)
+        self.classify_min_confidence = self.config.get("classify_min_confidence", llm_config.CLASSIFY_MIN_CONFIDENCE)
     
     async def initialize(self) -> None:
         """LLM 서비스를 초기화합니다."""
@@ -25,32 +79,719 @@ class BaseLLMService(ILLMProvider, ITextProcessor, IContentAnalyzer, IContentGen
         # 서브클래스에서 오버라이드
         pass
     
+    async def warm_up(self) -> None:
+        """클라이언트를 만들고 API 호스트에 연결을 미리 열어 둡니다.
+        
+        첫 평가 요청이 DNS 조회, TLS 핸드셰이크, SDK 초기화 비용을 내지 않도록 시작 시 한 번 호출합니다.
+        연결에 실패해도 예외를 던지지 않습니다 (첫 요청에서 다시 연결).
+        """
+        await self.initialize()
+        base_url = getattr(getattr(self, "client", None), "base_url", None)
+        if self.http_client is None or base_url is None:
+            return
+        try:
+            await self.http_client.head(str(base_url))
+        except Exception as e:
+            logger.warning(f"LLM 제공자 {self.name} 연결 예열 실패: {e}")
+    
+    async def close(self) -> None:
+        """클라이언트와 연결 풀을 닫습니다 (다음 요청에서 다시 초기화)."""
+        if self._initialized:
+            await self._close_provider()
+            self._initialized = False
+    
+    async def _close_provider(self) -> None:
+        """LLM 제공자 클라이언트를 닫습니다."""
+        # 서브클래스에서 오버라이드
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+    
+    def _create_http_client(self, sdk: Any):
+        """스케줄러 동시성 한도에 맞춘 keep-alive 연결 풀과 REQUEST_TIMEOUT을 가진 SDK HTTP 클라이언트를 만듭니다.
+        
+        SDK의 DefaultAsyncHttpxClient(SDK 기본 전송 설정 유지)를 사용하며,
+        SDK가 이를 제공하지 않으면 None을 반환하여 SDK 기본 클라이언트를 사용합니다.
+        
+        Args:
+            sdk: 제공자 SDK 모듈 (anthropic, openai)
+        """
+        client_class = getattr(sdk, "DefaultAsyncHttpxClient", None)
+        default_limits = getattr(sdk, "DEFAULT_CONNECTION_LIMITS", None)
+        if client_class is None or default_limits is None:
+            return None
+        connections = self.scheduler.max_concurrency
+        return client_class(
+            limits=type(default_limits)(
+                max_connections=connections,
+                max_keepalive_connections=connections,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            timeout=self.request_timeout
+        )
+    
+    async def _dispatch(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        prompt: str,
+        max_tokens: int,
+        usage: Optional[Callable[[Any], Optional[int]]] = None,
+        template: str = "generate_text"
+    ) -> Any:
+        """제공자 API 호출을 스케줄러의 RPM/TPM 예산 안에서 실행하고, 호출 계측 기록을 남깁니다.
+        
+        Args:
+            call: 제공자 API를 호출하는 코루틴 함수
+            prompt: 입력 프롬프트 (토큰 추정용)
+            max_tokens: 최대 출력 토큰 수
+            usage: 응답에서 실제 사용 토큰 수를 꺼내는 함수
+            template: 계측용 프롬프트 템플릿 이름
+        """
+        attempts = 0
+        
+        async def attempt() -> Any:
+            nonlocal attempts
+            attempts += 1
+            return await call()
+        
+        started = time.perf_counter()
+        try:
+            response = await self.scheduler.run(attempt, self._estimate_tokens(prompt) + max_tokens, usage)
+        except Exception as e:
+            self._record_call(
+                template,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                retries=max(attempts - 1, 0),
+                error=type(e).__name__
+            )
+            raise
+        
+        input_tokens, output_tokens, cached_input_tokens = (
+            self._token_usage(response) or (self._estimate_tokens(prompt), 0, 0)
+        )
+        self._record_call(
+            template,
+            input_tokens,
+            output_tokens,
+            cached_input_tokens,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            retries=attempts - 1
+        )
+        return response
+    
+    def _token_usage(self, response: Any) -> Optional[Tuple[int, int, int]]:
+        """응답의 (입력, 출력, 캐시 읽기 입력) 토큰 수 (서브클래스에서 오버라이드, 없으면 입력을 추정)."""
+        return None
+    
+    def _record_call(
+        self,
+        template: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cached_input_tokens: int = 0,
+        latency_ms: Optional[float] = None,
+        retries: int = 0,
+        error: Optional[str] = None
+    ) -> None:
+        """LLM 호출 하나의 계측 기록을 레지스트리와 현재 세션 집계에 추가합니다."""
+        record_llm_call(LLMCallRecord(
+            provider=self.name,
+            model=getattr(self, "model", None),
+            template=template,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cached_input_tokens=cached_input_tokens,
+            latency_ms=latency_ms,
+            retries=retries,
+            error=error
+        ))
+    
+    def _record_prompt_cache(self, input_tokens: int, cache_read_tokens: int = 0, cache_write_tokens: int = 0) -> None:
+        """요청 하나의 입력 토큰 중 캐시에서 읽은/캐시에 기록한 토큰 수를 기록합니다.
+        
+        Args:
+            input_tokens: 전체 입력 토큰 수 (캐시 읽기/기록 포함)
+            cache_read_tokens: 캐시 적중으로 읽은 입력 토큰 수
+            cache_write_tokens: 새로 캐시에 기록한 입력 토큰 수
+        """
+        self.prompt_cache["requests"] += 1
+        self.prompt_cache["input_tokens"] += input_tokens
+        self.prompt_cache["cache_read_tokens"] += cache_read_tokens
+        self.prompt_cache["cache_write_tokens"] += cache_write_tokens
+    
+    def prompt_cache_stats(self) -> Dict[str, Any]:
+        """제공자 프롬프트 캐시 통계 (캐시 읽기/기록 토큰과 입력 토큰 중 캐시 읽기 비율)를 반환합니다."""
+        input_tokens = self.prompt_cache["input_tokens"]
+        read_ratio = self.prompt_cache["cache_read_tokens"] / input_tokens if input_tokens else 0.0
+        return dict(self.prompt_cache, enabled=self.prompt_cache_enabled, cache_read_ratio=round(read_ratio, 4))
+    
+    # ILLMProvider 구현
+    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """JSON 스키마를 지시한 프롬프트로 생성하고, 응답을 스키마로 검증하여 반환합니다.
+        
+        응답이 스키마를 만족하지 않으면 오류 내용을 덧붙여 schema_retries회(기본 1회) 다시 요청합니다.
+        
+        Raises:
+            StructuredOutputError: 재시도 후에도 유효한 JSON을 얻지 못한 경우
+        """
+        retries = kwargs.pop("schema_retries", 1)
+        base_prompt = self._structured_prompt(prompt, schema)
+        request = base_prompt
+        
+        for _ in range(retries + 1):
+            response = await self.generate_text(request, **kwargs)
+            try:
+                value = extract_json(response)
+                errors = validate(value, schema)
+            except StructuredOutputError as e:
+                errors = [str(e)]
+            if not errors:
+                return value
+            request = (
+                f"{base_prompt}\n\n"
+                f"이전 응답이 스키마를 만족하지 않았습니다: {'; '.join(errors[:5])}\n"
+                f"스키마에 맞는 JSON만 다시 답변해주세요."
+            )
+        
+        raise StructuredOutputError(f"{self.name}: 스키마에 맞는 응답을 받지 못했습니다 ({'; '.join(errors[:5])})")
+    
+    def _structured_prompt(self, prompt: str, schema: Dict[str, Any]) -> str:
+        """프롬프트에 JSON 스키마 지시를 덧붙입니다."""
+        return (
+            f"{prompt}\n\n"
+            f"다음 JSON Schema를 만족하는 JSON 객체 하나만 답변해주세요. 다른 설명은 쓰지 마세요.\n"
+            f"{json.dumps(schema, ensure_ascii=False)}"
+        )
+    
     # ILLMService 구현
     async def is_relevant(self, text: str) -> bool:
         """콘텐츠의 관련성을 확인합니다."""
         return await self.is_relevant(text, self._get_default_criteria())
     
-    async def deduplicate(self, items: List[str]) -> List[int]:
-        """항목에서 중복을 제거합니다."""
-        return await self.deduplicate(items, threshold=0.8)
-    
-    async def classify_category(self, text: str) -> str:
-        """콘텐츠를 카테고리로 분류합니다."""
-        return await self.classify_category(text, self._get_default_categories())
+    async def deduplicate(self, items: List[str], threshold: float = 0.8) -> List[int]:
+        """트라이그램 코사인 유사도가 threshold 이상인 중복 항목을 제거하고 남길 인덱스를 반환합니다 (LLM 호출 없음)."""
+        return await asyncio.to_thread(deduplicate_indices, items, threshold)
     
     async def summarize(self, text: str, sentences: int = 3) -> str:
         """콘텐츠를 요약합니다."""
         return await self.summarize(text, sentences, "neutral")
     
+    # ITextProcessor 공통 구현
+    async def clean_text(self, text: str) -> str:
+        """여분의 공백을 제거하여 텍스트를 정리합니다."""
+        return " ".join(text.split())
+    
+    async def extract_keywords(self, text: str, count: int = 10) -> List[str]:
+        """LLM으로 핵심 키워드를 추출합니다."""
+        prompt = f"""
+        다음 텍스트의 핵심 키워드를 최대 {count}개 추출해주세요.
+        쉼표로 구분된 키워드만 답변해주세요.
+        
+        텍스트: {self._fit_input(text, "classify")}
+        """
+        
+        response = await self.generate_text(prompt, max_tokens=20 * count, template="keywords")
+        return [keyword.strip() for keyword in response.split(",") if keyword.strip()][:count]
+    
+    async def detect_language(self, text: str) -> str:
+        """한글 비율로 언어를 감지합니다 ("ko" 또는 "en")."""
+        letters = [char for char in text if char.isalpha()]
+        hangul = sum(1 for char in letters if "가" <= char <= "힣")
+        return "ko" if letters and hangul / len(letters) >= 0.3 else "en"
+    
+    # IContentAnalyzer 공통 구현
+    async def classify_category(self, text: str, categories: Optional[List[str]] = None) -> str:
+        """LLM으로 콘텐츠를 카테고리 목록 중 하나로 분류합니다 (목록에 없는 답변은 OTHER)."""
+        return (await self.classify_category_scored(text, categories))["category"]
+    
+    async def classify_category_scored(self, text: str, categories: Optional[List[str]] = None) -> Dict[str, Any]:
+        """카테고리와 신뢰도를 함께 분류합니다.
+        
+        제한 모드(CLASSIFY_CONSTRAINED)에서는 카테고리마다 한 글자 라벨(A, B, ...)을 붙여 라벨 하나만
+        답하게 하고 출력을 classify_max_tokens로 제한합니다. 제공자가 logprobs를 지원하면 라벨 확률을
+        신뢰도로 사용하며, 신뢰도가 classify_min_confidence 미만이거나 목록에 없는 답변은 OTHER로 처리합니다.
+        
+        Returns:
+            {"category": 카테고리, "confidence": 라벨 확률 (logprobs 미지원이면 None)}
+        """
+        categories = categories or self._get_default_categories()
+        if not self.classify_constrained:
+            system, prompt = self._classify_prompt(text, categories)
+            response = (await self.generate_text(prompt, system=system, template="classify")).strip()
+            return {"category": response if response in categories else FALLBACK_CATEGORY, "confidence": None}
+        
+        labels = self._category_labels(categories)
+        system, prompt = self._constrained_classify_prompt(text, categories, labels)
+        label, confidence = await self._generate_label(prompt, system, list(labels))
+        category = labels.get(label, FALLBACK_CATEGORY)
+        if confidence is not None and confidence < self.classify_min_confidence:
+            category = FALLBACK_CATEGORY
+        return {"category": category, "confidence": confidence}
+    
+    async def _generate_label(self, prompt: str, system: str, labels: List[str]) -> Tuple[Optional[str], Optional[float]]:
+        """라벨 하나를 생성하고 (라벨, 신뢰도)를 반환합니다 (logprobs를 지원하는 제공자에서 오버라이드)."""
+        response = await self.generate_text(
+            prompt,
+            system=system,
+            max_tokens=self.classify_max_tokens,
+            temperature=0,
+            template="classify"
+        )
+        return self._parse_label(response, labels), None
+    
+    def _parse_label(self, response: str, labels: List[str]) -> Optional[str]:
+        """응답의 첫 글자를 라벨로 읽습니다 (라벨이 아니면 None)."""
+        label = response.strip()[:1].upper()
+        return label if label in labels else None
+    
+    def _category_labels(self, categories: List[str]) -> Dict[str, str]:
+        """카테고리마다 한 토큰짜리 라벨(A, B, ...)을 붙입니다."""
+        if len(categories) > len(string.ascii_uppercase):
+            raise ValueError(f"Constrained classification supports up to {len(string.ascii_uppercase)} categories")
+        return dict(zip(string.ascii_uppercase, categories))
+    
+    async def analyze_sentiment(self, text: str) -> Dict[str, Any]:
+        """LLM으로 감정을 분석합니다."""
+        result = await self.generate_structured(
+            f"다음 텍스트의 감정을 분석해주세요.\n\n텍스트: {self._fit_input(text, 'classify')}",
+            {
+                "type": "object",
+                "properties": {
+                    "sentiment": {"type": "string", "enum": ["positive", "negative", "neutral"]},
+                    "score": {"type": "number", "minimum": -1.0, "maximum": 1.0},
+                },
+                "required": ["sentiment", "score"],
+            },
+            max_tokens=50,
+            template="sentiment"
+        )
+        return {"sentiment": result["sentiment"], "score": float(result["score"])}
+    
+    # IContentGenerator 공통 구현
+    async def generate_title(self, content: str, style: str = "news") -> str:
+        """LLM으로 제목을 생성합니다."""
+        prompt = f"""
+        다음 내용에 어울리는 제목 하나를 만들어주세요.
+        스타일: {style}
+        
+        내용: {self._fit_input(content, "classify")}
+        
+        제목만 답변해주세요.
+        """
+        
+        return (await self.generate_text(prompt, max_tokens=100, template="title")).strip()
+    
+    async def generate_outline(self, topic: str, sections: int = 5) -> List[str]:
+        """LLM으로 개요를 생성합니다."""
+        prompt = f"""
+        다음 주제의 개요를 {sections}개 항목으로 작성해주세요.
+        한 줄에 한 항목씩, 항목 제목만 답변해주세요.
+        
+        주제: {topic}
+        """
+        
+        response = await self.generate_text(prompt, max_tokens=60 * sections, template="outline")
+        return [line.strip(" -*0123456789.") for line in response.splitlines() if line.strip()][:sections]
+    
+    async def rewrite(self, text: str, style: str = "professional") -> str:
+        """LLM으로 텍스트를 다른 스타일로 다시 씁니다."""
+        prompt = f"""
+        다음 텍스트를 {style} 스타일로 다시 써주세요.
+        
+        텍스트: {text}
+        """
+        
+        return await self.generate_text(prompt, template="rewrite")
+    
+    # 통합 분석
+    async def analyze_post(
+        self,
+        text: str,
+        criteria: Optional[Dict[str, Any]] = None,
+        categories: Optional[List[str]] = None,
+        sentences: int = 3
+    ) -> Dict[str, Any]:
+        """관련성, 관련성 점수, 카테고리, 요약을 한 번의 구조화된 호출로 분석합니다.
+        
+        is_relevant/classify_category/summarize를 따로 호출하면 본문이 세 번 전송되므로,
+        게시글당 한 번의 호출로 입력 토큰을 한 번만 사용합니다.
+        
+        Returns:
+            {"is_relevant", "relevance_score", "category", "summary"} 딕셔너리
+        """
+        criteria = criteria or self._get_default_criteria()
+        categories = categories or self._get_default_categories()
+        text = self._fit_input(text, "analysis")
+        
+        prompt = f"""
+        작업: 다음 텍스트를 분석해주세요.
+        - relevant: 관련성 기준에 따라 관련이 있는지
+        - score: 관련성 점수 (0.0 ~ 1.0)
+        - category: 카테고리 목록 중 가장 적절한 하나
+        - summary: {sentences}문장 요약
+        
+        텍스트: {text}
+        """
+        
+        result = await self.generate_structured(
+            prompt,
+            self._analysis_schema(categories),
+            max_tokens=150 + 120 * sentences,
+            system=self._evaluation_system_prompt(criteria, categories),
+            template="analysis"
+        )
+        return {
+            "is_relevant": result["relevant"],
+            "relevance_score": float(result["score"]),
+            "category": result["category"],
+            "summary": result["summary"].strip(),
+        }
+    
+    def _analysis_schema(self, categories: List[str]) -> Dict[str, Any]:
+        """analyze_post 응답 스키마를 반환합니다."""
+        return {
+            "type": "object",
+            "properties": {
+                "relevant": {"type": "boolean"},
+                "score": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                "category": {"type": "string", "enum": list(categories)},
+                "summary": {"type": "string", "maxLength": 1000},
+            },
+            "required": ["relevant", "score", "category", "summary"],
+        }
+    
+    # 일괄 평가
+    async def evaluate_batch(
+        self,
+        posts: List[Dict[str, Any]],
+        criteria: Optional[Dict[str, Any]] = None,
+        categories: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """여러 게시글을 하나의 구조화된 프롬프트로 묶어 관련성과 카테고리를 평가합니다.
+        
+        배치 크기는 토큰 추정치와 batch_max_posts로 정해지며, 응답을 파싱하지 못한 배치는
+        절반으로 나누어 다시 요청합니다. 게시글 하나까지 나누어도 실패하면
+        analyze_post로 개별 평가합니다.
+        
+        Args:
+            posts: id, title, content를 가진 게시글 딕셔너리들
+            criteria: 관련성 기준 (기본: _get_default_criteria)
+            categories: 분류 카테고리 (기본: _get_default_categories)
+        
+        Returns:
+            입력 순서를 따르는 {"id", "is_relevant", "category", "relevance_score", "batch_size"}
+            딕셔너리 목록 (개별 평가까지 실패한 게시글은 제외)
+        """
+        criteria = criteria or self._get_default_criteria()
+        categories = categories or self._get_default_categories()
+        
+        chunks = await asyncio.gather(
+            *(self._evaluate_chunk(batch, criteria, categories) for batch in self._plan_batches(posts, criteria, categories))
+        )
+        evaluated = {item["id"]: item for chunk in chunks for item in chunk}
+        return [evaluated[str(post["id"])] for post in posts if str(post["id"]) in evaluated]
+    
+    def _plan_batches(
+        self,
+        posts: List[Dict[str, Any]],
+        criteria: Dict[str, Any],
+        categories: List[str]
+    ) -> List[List[Dict[str, Any]]]:
+        """입력/출력 토큰 한도에 맞춰 게시글들을 배치로 나눕니다."""
+        max_posts = max(1, min(self.batch_max_posts, self._max_output_tokens() // self.batch_output_tokens_per_post))
+        budget = self.batch_max_input_tokens - self._estimate_tokens(
+            self._evaluation_system_prompt(criteria, categories) + self._build_batch_prompt([])
+        )
+        
+        batches: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        used = 0
+        for post in posts:
+            cost = self._estimate_tokens(self._format_batch_post(len(current) + 1, post))
+            if current and (len(current) >= max_posts or used + cost > budget):
+                batches.append(current)
+                current, used = [], 0
+            current.append(post)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+    
+    async def _evaluate_chunk(
+        self,
+        posts: List[Dict[str, Any]],
+        criteria: Dict[str, Any],
+        categories: List[str]
+    ) -> List[Dict[str, Any]]:
+        """배치 하나를 평가하고, 응답에서 빠진 게시글은 나누어 다시 평가합니다."""
+        parsed: Dict[int, Dict[str, Any]] = {}
+        try:
+            response = await self.generate_text(
+                self._build_batch_prompt(posts),
+                max_tokens=self.batch_output_tokens_per_post * len(posts) + 100,
+                system=self._evaluation_system_prompt(criteria, categories),
+                template="batch_evaluation"
+            )
+            parsed = self._parse_batch_response(response, len(posts), categories)
+        except Exception as e:
+            if len(posts) == 1:
+                return await self._evaluate_single(posts[0], criteria, categories, e)
+        
+        results = [
+            dict(parsed[n], id=str(post["id"]), batch_size=len(posts))
+            for n, post in enumerate(posts, 1) if n in parsed
+        ]
+        missing = [post for n, post in enumerate(posts, 1) if n not in parsed]
+        if not missing:
+            return results
+        
+        if len(missing) == 1 and len(posts) == 1:
+            return await self._evaluate_single(missing[0], criteria, categories)
+        
+        # 응답에서 빠졌거나 파싱에 실패한 게시글은 절반씩 나누어 재시도
+        half = (len(missing) + 1) // 2 if len(missing) == len(posts) else len(missing)
+        retries = await asyncio.gather(
+            *(self._evaluate_chunk(missing[i:i + half], criteria, categories) for i in range(0, len(missing), half))
+        )
+        return results + [item for chunk in retries for item in chunk]
+    
+    async def _evaluate_single(
+        self,
+        post: Dict[str, Any],
+        criteria: Dict[str, Any],
+        categories: List[str],
+        error: Optional[Exception] = None
+    ) -> List[Dict[str, Any]]:
+        """배치 평가에 실패한 게시글을 개별 구조화 호출로 평가합니다."""
+        text = f"{post['title']}\n{post['content']}"
+        try:
+            analysis = await self.analyze_post(text, criteria, categories, sentences=1)
+        except Exception as e:
+            logger.warning(f"게시글 {post['id']} 평가 실패: {error or e}")
+            return []
+        
+        return [{
+            "id": str(post["id"]),
+            "is_relevant": analysis["is_relevant"],
+            "category": analysis["category"],
+            "relevance_score": analysis["relevance_score"],
+            "batch_size": 1,
+        }]
+    
+    def _build_batch_prompt(self, posts: List[Dict[str, Any]]) -> str:
+        """번호가 매겨진 게시글들을 하나의 평가 프롬프트로 만듭니다 (기준은 시스템 프롬프트)."""
+        body = "\n\n".join(self._format_batch_post(n, post) for n, post in enumerate(posts, 1))
+        return f"""
+        작업: 다음은 번호가 매겨진 게시글 {len(posts)}개입니다.
+        각 게시글의 관련성을 판단하고, 카테고리 목록 중 하나로 분류해주세요.
+        
+        {body}
+        
+        게시글마다 객체 하나씩, 번호 순서대로 JSON 배열만 답변해주세요. 다른 설명은 쓰지 마세요.
+        형식: [{{"n": 1, "relevant": true, "score": 0.9, "category": "SKT"}}]
+        score는 관련성 점수(0.0 ~ 1.0)입니다.
+        """
+    
+    def _format_batch_post(self, number: int, post: Dict[str, Any]) -> str:
+        """배치 프롬프트에 들어갈 게시글 하나를 포맷합니다."""
+        content = (post.get("content") or "")[:self.batch_post_chars]
+        return f"[{number}] 제목: {post.get('title', '')}\n본문: {content}"
+    
+    def _parse_batch_response(self, response: str, count: int, categories: List[str]) -> Dict[int, Dict[str, Any]]:
+        """배치 응답의 JSON 배열을 번호별 평가 결과로 파싱합니다."""
+        match = _JSON_ARRAY_PATTERN.search(response or "")
+        if not match:
+            return {}
+        try:
+            items = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return {}
+        
+        parsed: Dict[int, Dict[str, Any]] = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                number = int(item.get("n"))
+            except (TypeError, ValueError):
+                continue
+            if not 1 <= number <= count or not isinstance(item.get("relevant"), bool):
+                continue
+            
+            is_relevant = item["relevant"]
+            try:
+                score = min(max(float(item.get("score")), 0.0), 1.0)
+            except (TypeError, ValueError):
+                score = 0.8 if is_relevant else 0.2
+            category = str(item.get("category", "")).strip()
+            parsed[number] = {
+                "is_relevant": is_relevant,
+                "category": category if category in categories else "OTHER",
+                "relevance_score": score,
+            }
+        return parsed
+    
+    # 제공자 배치 작업 (결과를 나중에 받는 저렴한 비동기 일괄 처리 API)
+    @property
+    def supports_batch_jobs(self) -> bool:
+        """제공자 배치 작업 API를 지원하는지 여부 (서브클래스에서 오버라이드)."""
+        return False
+    
+    async def submit_evaluation_job(
+        self,
+        posts: List[Dict[str, Any]],
+        criteria: Optional[Dict[str, Any]] = None,
+        categories: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """게시글들을 evaluate_batch와 같은 배치 프롬프트로 나누어 하나의 제공자 배치 작업으로 제출합니다.
+        
+        Returns:
+            {"id": 작업 ID, "provider": 제공자 이름, "chunks": {요청 ID: [게시글 ID, ...]}}
+            (JSON으로 저장할 수 있으며 collect_evaluation_job에 그대로 전달)
+        """
+        criteria = criteria or self._get_default_criteria()
+        categories = categories or self._get_default_categories()
+        system = self._evaluation_system_prompt(criteria, categories)
+        
+        chunks: Dict[str, List[str]] = {}
+        requests = []
+        for number, batch in enumerate(self._plan_batches(posts, criteria, categories)):
+            custom_id = f"chunk-{number}"
+            chunks[custom_id] = [str(post["id"]) for post in batch]
+            requests.append({
+                "custom_id": custom_id,
+                "system": system,
+                "prompt": self._build_batch_prompt(batch),
+                "max_tokens": self.batch_output_tokens_per_post * len(batch) + 100,
+            })
+        
+        job_id = await self._submit_batch_requests(requests)
+        return {"id": job_id, "provider": self.name, "chunks": chunks}
+    
+    async def collect_evaluation_job(
+        self,
+        job: Dict[str, Any],
+        categories: Optional[List[str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """제출한 배치 작업의 결과를 가져옵니다.
+        
+        Returns:
+            작업이 아직 끝나지 않았으면 None, 끝났으면 evaluate_batch와 같은 형식의 평가 목록
+            (응답이 없거나 파싱에 실패한 게시글은 제외)
+        """
+        responses = await self._fetch_batch_results(job["id"])
+        if responses is None:
+            return None
+        
+        categories = categories or self._get_default_categories()
+        results = []
+        for custom_id, post_ids in job["chunks"].items():
+            parsed = self._parse_batch_response(responses.get(custom_id, ""), len(post_ids), categories)
+            results.extend(
+                dict(parsed[n], id=post_id, batch_size=len(post_ids))
+                for n, post_id in enumerate(post_ids, 1) if n in parsed
+            )
+        return results
+    
+    async def _submit_batch_requests(self, requests: List[Dict[str, Any]]) -> str:
+        """{"custom_id", "system", "prompt", "max_tokens"} 요청들을 배치 작업으로 제출하고 작업 ID를 반환합니다."""
+        raise NotImplementedError(f"{self.name} does not support batch jobs")
+    
+    async def _fetch_batch_results(self, job_id: str) -> Optional[Dict[str, str]]:
+        """배치 작업이 끝났으면 요청 ID별 응답 텍스트를, 진행 중이면 None을 반환합니다."""
+        raise NotImplementedError(f"{self.name} does not support batch jobs")
+    
+    def _max_output_tokens(self) -> int:
+        """한 요청의 최대 출력 토큰 수를 반환합니다."""
+        return self.config.get("max_tokens", 4000)
+    
+    def _estimate_tokens(self, text: str) -> int:
+        """텍스트의 토큰 수를 추정합니다 (tokens.estimate_tokens)."""
+        return estimate_tokens(text)
+    
+    def _fit_input(self, text: str, task: str) -> str:
+        """작업별 입력 토큰 한도에 맞춰 본문을 줄입니다 (앞부분 + 키워드 주변 구간).
+        
+        Args:
+            text: 원문
+            task: "relevance", "classify", "analysis" 중 하나
+        """
+        limit = self.input_token_limits[task]
+        if self._estimate_tokens(text) <= limit:
+            return text
+        positions = [p for keyword_positions in get_keyword_matcher().match(text).positions.values() for p in keyword_positions]
+        return keyword_excerpt(text, limit, positions)
+    
+    async def _summarize_chunks(self, text: str, sentences: int, style: str) -> str:
+        """summary_chunk_tokens보다 긴 본문을 맵리듀스로 요약합니다 (조각 요약은 조각 해시로 캐시)."""
+        if self._summarizer is None:
+            self._summarizer = MapReduceSummarizer(
+                self,
+                chunk_tokens=self.summary_chunk_tokens,
+                store=self.config.get("cache_store")
+            )
+        return await self._summarizer.summarize(text, sentences, style)
+    
+    async def _summarize_prompt(self, text: str, sentences: int, style: str) -> str:
+        """요약 프롬프트 하나를 보냅니다."""
+        prompt = f"""
+        다음 텍스트를 {sentences}문장으로 요약해주세요.
+        스타일: {style}
+        
+        텍스트: {text}
+        """
+        
+        return await self.generate_text(prompt, template="summary")
+    
     # 헬퍼 메서드
+    def _evaluation_system_prompt(self, criteria: Dict[str, Any], categories: List[str]) -> str:
+        """평가 작업 공통 시스템 프롬프트를 만듭니다 (같은 기준이면 항상 같은 문자열 - 캐시 접두부)."""
+        groups = get_keyword_matcher().groups
+        keyword_groups = {keyword: groups.get(keyword, [keyword]) for keyword in criteria.get("keywords", [])}
+        return evaluation_system_prompt(keyword_groups, categories)
+    
+    def _relevance_prompt(self, text: str, criteria: Dict[str, Any]) -> Tuple[str, str]:
+        """관련성 판단의 (시스템 프롬프트, 사용자 메시지)를 만듭니다."""
+        prompt = f"""
+        작업: 다음 텍스트가 관련성 기준에 따라 관련이 있는지 판단해주세요.
+        
+        텍스트: {self._fit_input(text, "relevance")}
+        
+        관련성이 있으면 'YES', 없으면 'NO'로 답변해주세요.
+        """
+        return self._evaluation_system_prompt(criteria, self._get_default_categories()), prompt
+    
+    def _classify_prompt(self, text: str, categories: List[str]) -> Tuple[str, str]:
+        """카테고리 분류의 (시스템 프롬프트, 사용자 메시지)를 만듭니다."""
+        prompt = f"""
+        작업: 다음 텍스트를 카테고리 목록 중 하나로 분류해주세요.
+        
+        텍스트: {self._fit_input(text, "classify")}
+        
+        가장 적절한 카테고리명만 답변해주세요.
+        """
+        return self._evaluation_system_prompt(self._get_default_criteria(), categories), prompt
+    
+    def _constrained_classify_prompt(self, text: str, categories: List[str], labels: Dict[str, str]) -> Tuple[str, str]:
+        """제한 분류 모드의 (시스템 프롬프트, 사용자 메시지)를 만듭니다 (라벨 표는 사용자 메시지에 두어 캐시 접두부 유지)."""
+        label_lines = "\n        ".join(f"{label}: {category}" for label, category in labels.items())
+        prompt = f"""
+        작업: 다음 텍스트를 카테고리 목록 중 하나로 분류해주세요.
+        
+        텍스트: {self._fit_input(text, "classify")}
+        
+        가장 적절한 카테고리의 라벨 한 글자만 답변해주세요.
+        {label_lines}
+        """
+        return self._evaluation_system_prompt(self._get_default_criteria(), categories), prompt
+    
     def _get_default_criteria(self) -> Dict[str, Any]:
         """기본 관련성 기준을 가져옵니다."""
         return {
-            "keywords": ["통신", "5G", "이통", "KT", "SKT", "LGU", "방통위", "KAIT"],
+            "keywords": list(DEFAULT_KEYWORDS),
             "min_length": 10
         }
     
     def _get_default_categories(self) -> List[str]:
         """분류를 위한 기본 카테고리를 가져옵니다."""
         return ["SKT", "KT", "LGU", "방통위", "KAIT", "이통시장여론", "OTHER"]
-
@@ -0,0 +1,356 @@
+"""LLM 응답 캐시 - 정규화된 입력 해시 기반 2단계(프로세스 내 LRU + MongoDB TTL) 캐시.
+
+재크롤링, 재게시, 실패한 일일 작업의 재실행으로 같은 텍스트가 다시 평가될 때
+LLM을 호출하지 않고 캐시에서 응답합니다. 캐시 키는 (제공자, 모델, 프롬프트 템플릿 버전,
+메서드, 정규화된 입력, 호출 인자)의 SHA-256 해시입니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.infrastructure.config.llm_config import llm_config
+from .instrumentation import LLMCallRecord, record_llm_call
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# 캐시 메서드별 계측 템플릿 이름 (제공자 호출의 template과 같은 이름으로 집계)
+_CACHE_TEMPLATES = {
+    "is_relevant": "relevance",
+    "classify_category": "classify",
+    "classify_category_scored": "classify",
+    "analyze_sentiment": "sentiment",
+    "summarize": "summary",
+    "generate_title": "title",
+    "analyze_post": "analysis",
+}
+
+
+def normalize_cache_text(text: str) -> str:
+    """캐시 키용으로 텍스트를 정규화합니다 (NFKC, 공백 정리)."""
+    return " ".join(unicodedata.normalize("NFKC", text or "").split())
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중/실패 통계."""
+    memory_hits: int = 0      # 프로세스 내 LRU 적중
+    store_hits: int = 0       # MongoDB 캐시 적중
+    misses: int = 0           # LLM 호출
+    store_errors: int = 0     # MongoDB 캐시 조회/저장 오류
+
+    @property
+    def requests(self) -> int:
+        return self.memory_hits + self.store_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.memory_hits + self.store_hits) / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "store_errors": self.store_errors,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class LRUCache:
+    """프로세스 내 LRU 캐시 (1단계)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """값을 반환합니다 (없으면 _MISSING)."""
+        value = self._entries.get(key, _MISSING)
+        if value is not _MISSING:
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class MongoLLMCacheStore:
+    """MongoDB 캐시 저장소 (2단계) - ``llm_cache`` 컬렉션의 TTL 인덱스로 만료됩니다."""
+
+    async def get(self, key: str) -> Any:
+        """값을 반환합니다 (없거나 만료되었으면 _MISSING)."""
+        from app.infrastructure.database.models.llm_models import LLMCacheDocument
+
+        doc = await LLMCacheDocument.find_one(LLMCacheDocument.key == key)
+        # TTL 모니터는 주기적으로 실행되므로 만료 시간을 직접 확인
+        if doc is None or doc.expires_at <= datetime.utcnow():
+            return _MISSING
+        return doc.value
+
+    async def set(self, key: str, value: Any, provider: str, model: Optional[str], method: str, ttl_seconds: int) -> None:
+        """값을 저장합니다 (같은 키가 있으면 덮어씀)."""
+        from app.infrastructure.database.models.llm_models import LLMCacheDocument
+
+        now = datetime.utcnow()
+        await LLMCacheDocument.get_motor_collection().update_one(
+            {"key": key},
+            {"$set": {
+                "provider": provider,
+                "model": model,
+                "method": method,
+                "value": value,
+                "created_at": now,
+                "expires_at": now + timedelta(seconds=ttl_seconds),
+            }},
+            upsert=True,
+        )
+
+
+class CachedLLMService:
+    """LLM 서비스 캐시 데코레이터.
+
+    ``generate_text``/``generate_structured``(ILLMProvider), 분석 메서드(IContentAnalyzer),
+    생성 메서드(IContentGenerator), ``analyze_post``, ``evaluate_batch``(게시글 단위)를 캐시하고,
+    나머지 속성은 감싼 서비스에 위임합니다. 같은 키의 동시 요청은 LLM 호출 하나를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        inner,
+        store: Optional[MongoLLMCacheStore] = None,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        template_version: Optional[str] = None,
+    ):
+        self.inner = inner
+        self.store = store
+        self.memory = LRUCache(max_entries or llm_config.CACHE_MAX_ENTRIES)
+        self.ttl_seconds = ttl_seconds or llm_config.CACHE_TTL_SECONDS
+        self.template_version = template_version or llm_config.PROMPT_TEMPLATE_VERSION
+        self.stats = CacheStats()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._store_warned = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    @property
+    def model(self) -> Optional[str]:
+        return getattr(self.inner, "model", None)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """캐시 통계를 반환합니다."""
+        return dict(self.stats.as_dict(), memory_entries=len(self.memory), persistent=self.store is not None)
+
+    def cache_key(self, method: str, text: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """(제공자, 모델, 템플릿 버전, 메서드, 정규화된 입력, 인자)의 해시 키를 만듭니다."""
+        payload = json.dumps(
+            [self.inner.name, self.model, self.template_version, method, normalize_cache_text(text), params or {}],
+            ensure_ascii=False, sort_keys=True, default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _cached(
+        self,
+        method: str,
+        text: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+        template: Optional[str] = None
+    ) -> Any:
+        """캐시에서 값을 찾고, 없으면 compute로 계산하여 두 단계 모두에 저장합니다."""
+        key = self.cache_key(method, text, params)
+        template = template or _CACHE_TEMPLATES.get(method, method)
+
+        value = self.memory.get(key)
+        if value is not _MISSING:
+            self.stats.memory_hits += 1
+            self._record_hit(template)
+            return copy.deepcopy(value)
+
+        if key in self._inflight:
+            # 같은 키를 계산 중인 요청의 결과를 공유 (LLM 호출 없음)
+            self.stats.memory_hits += 1
+            self._record_hit(template)
+            return copy.deepcopy(await asyncio.shield(self._inflight[key]))
+
+        # 계산은 별도 작업으로 실행하여 대기자들이 공유 (첫 요청이 취소되어도 다른 대기자는 결과를 받음)
+        task = asyncio.ensure_future(self._compute(key, method, template, compute))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._compute_done(key, done))
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _compute(self, key: str, method: str, template: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """MongoDB 캐시를 확인하고, 없으면 compute로 계산하여 두 단계 모두에 저장합니다."""
+        value = await self._store_get(key)
+        if value is not _MISSING:
+            self.stats.store_hits += 1
+            self._record_hit(template)
+        else:
+            self.stats.misses += 1
+            value = await compute()
+            await self._store_set(key, value, method)
+        self.memory.set(key, value)
+        return value
+
+    def _compute_done(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # 대기자가 모두 취소되어도 경고가 나지 않도록 예외를 소비
+
+    async def _store_get(self, key: str) -> Any:
+        if self.store is None:
+            return _MISSING
+        try:
+            return await self.store.get(key)
+        except Exception as e:
+            self._store_failed(e)
+            return _MISSING
+
+    async def _store_set(self, key: str, value: Any, method: str) -> None:
+        if self.store is None:
+            return
+        try:
+            await self.store.set(key, value, self.inner.name, self.model, method, self.ttl_seconds)
+        except Exception as e:
+            self._store_failed(e)
+
+    def _record_hit(self, template: str) -> None:
+        """캐시 적중(제공자 호출 없음)을 LLM 호출 계측에 기록합니다."""
+        record_llm_call(LLMCallRecord(provider=self.inner.name, model=self.model, template=template, cache_hit=True))
+
+    def _store_failed(self, error: Exception) -> None:
+        self.stats.store_errors += 1
+        if not self._store_warned:
+            logger.warning(f"LLM 캐시 저장소를 사용할 수 없어 메모리 캐시만 사용합니다: {error}")
+            self._store_warned = True
+
+    # ILLMProvider
+    async def generate_text(self, prompt: str, **kwargs) -> str:
+        # 계측용 template은 캐시 키에서 제외 (같은 프롬프트는 템플릿 이름과 관계없이 같은 응답)
+        params = {name: value for name, value in kwargs.items() if name != "template"}
+        return await self._cached(
+            "generate_text", prompt, params, lambda: self.inner.generate_text(prompt, **kwargs),
+            template=kwargs.get("template")
+        )
+
+    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        params = {name: value for name, value in kwargs.items() if name != "template"}
+        return await self._cached(
+            "generate_structured", prompt, dict(params, schema=schema),
+            lambda: self.inner.generate_structured(prompt, schema, **kwargs),
+            template=kwargs.get("template")
+        )
+
+    # IContentAnalyzer
+    async def is_relevant(self, text: str, criteria: Optional[Dict[str, Any]] = None) -> bool:
+        return await self._cached("is_relevant", text, {"criteria": criteria}, lambda: self.inner.is_relevant(text, criteria))
+
+    async def classify_category(self, text: str, categories: Optional[List[str]] = None) -> str:
+        return await self._cached(
+            "classify_category", text, {"categories": categories},
+            lambda: self.inner.classify_category(text, categories)
+        )
+
+    async def classify_category_scored(self, text: str, categories: Optional[List[str]] = None) -> Dict[str, Any]:
+        return await self._cached(
+            "classify_category_scored", text, {"categories": categories},
+            lambda: self.inner.classify_category_scored(text, categories)
+        )
+
+    async def analyze_sentiment(self, text: str) -> Dict[str, Any]:
+        return await self._cached("analyze_sentiment", text, {}, lambda: self.inner.analyze_sentiment(text))
+
+    # IContentGenerator
+    async def summarize(self, text: str, sentences: int = 3, style: str = "neutral") -> str:
+        return await self._cached(
+            "summarize", text, {"sentences": sentences, "style": style},
+            lambda: self.inner.summarize(text, sentences, style)
+        )
+
+    async def generate_title(self, content: str, style: str = "news") -> str:
+        return await self._cached("generate_title", content, {"style": style}, lambda: self.inner.generate_title(content, style))
+
+    # 통합 분석 / 일괄 평가
+    async def analyze_post(
+        self,
+        text: str,
+        criteria: Optional[Dict[str, Any]] = None,
+        categories: Optional[List[str]] = None,
+        sentences: int = 3
+    ) -> Dict[str, Any]:
+        return await self._cached(
+            "analyze_post", text, {"criteria": criteria, "categories": categories, "sentences": sentences},
+            lambda: self.inner.analyze_post(text, criteria, categories, sentences)
+        )
+
+    async def evaluate_batch(
+        self,
+        posts: List[Dict[str, Any]],
+        criteria: Optional[Dict[str, Any]] = None,
+        categories: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """게시글 단위로 캐시를 확인하고, 캐시에 없는 게시글만 배치로 평가합니다."""
+        params = {"criteria": criteria, "categories": categories}
+        keys = {
+            str(post["id"]): self.cache_key("evaluate_post", f"{post['title']}\n{post['content']}", params)
+            for post in posts
+        }
+        cached: Dict[str, Dict[str, Any]] = {}
+        misses: Dict[str, Dict[str, Any]] = {}   # 키별 대표 게시글 (배치 내 같은 텍스트는 한 번만 평가)
+
+        for post in posts:
+            post_id = str(post["id"])
+            value = self.memory.get(keys[post_id])
+            if value is not _MISSING:
+                self.stats.memory_hits += 1
+                self._record_hit("batch_evaluation")
+            else:
+                value = await self._store_get(keys[post_id])
+                if value is not _MISSING:
+                    self.stats.store_hits += 1
+                    self._record_hit("batch_evaluation")
+                    self.memory.set(keys[post_id], value)
+            if value is _MISSING:
+                if keys[post_id] in misses:
+                    self.stats.memory_hits += 1
+                    self._record_hit("batch_evaluation")
+                misses.setdefault(keys[post_id], post)
+            else:
+                cached[keys[post_id]] = value
+
+        if misses:
+            self.stats.misses += len(misses)
+            for evaluation in await self.inner.evaluate_batch(list(misses.values()), criteria, categories):
+                key = keys[evaluation["id"]]
+                self.memory.set(key, evaluation)
+                await self._store_set(key, evaluation, "evaluate_post")
+                cached[key] = evaluation
+
+        return [
+            dict(cached[keys[str(post["id"])]], id=str(post["id"]))
+            for post in posts if keys[str(post["id"])] in cached
+        ]
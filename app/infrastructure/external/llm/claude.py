@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 try:
     import anthropic
 except ImportError:
@@ -10,6 +10,14 @@ except ImportError:
 from .base import BaseLLMService
 
 
+def _usage_tokens(response) -> Optional[int]:
+    """응답의 실제 사용 토큰 수 (입력 + 캐시 기록 + 출력, 캐시 읽기는 제외)."""
+    usage = getattr(response, "usage", None)
+    if not usage:
+        return None
+    return usage.input_tokens + (getattr(usage, "cache_creation_input_tokens", None) or 0) + usage.output_tokens
+
+
 class ClaudeService(BaseLLMService):
     """Claude LLM 서비스 구현."""
     
@@ -17,6 +25,7 @@ class ClaudeService(BaseLLMService):
         super().__init__("claude", config)
         self.api_key = self.config.get("api_key")
         self.model = self.config.get("model", "claude-3-sonnet-20240229")
+        self.base_url = self.config.get("base_url")
         self.client = None
     
     async def _setup_provider(self) -> None:
@@ -24,7 +33,20 @@ class ClaudeService(BaseLLMService):
         if not self.api_key:
             raise ValueError("Claude API key is required")
         
-        self.client = anthropic.AsyncAnthropic(api_key=self.api_key)
+        self.http_client = self._create_http_client(anthropic)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=self.request_timeout,
+            http_client=self.http_client
+        )
+    
+    async def _close_provider(self) -> None:
+        """Claude 클라이언트와 연결 풀을 닫습니다."""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+        self.http_client = None
     
     # ILLMProvider 구현
     async def generate_text(self, prompt: str, **kwargs) -> str:
@@ -32,64 +54,104 @@ class ClaudeService(BaseLLMService):
         if not self.client:
             await self.initialize()
         
-        response = await self.client.messages.create(
-            model=self.model,
-            max_tokens=kwargs.get("max_tokens", 1000),
-            messages=[{"role": "user", "content": prompt}],
-            **kwargs
+        max_tokens = kwargs.pop("max_tokens", self.config.get("max_tokens", 1000))
+        system = kwargs.pop("system", None)
+        template = kwargs.pop("template", "generate_text")
+        if system:
+            kwargs["system"] = self._system_blocks(system)
+        
+        response = await self._dispatch(
+            lambda: self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+                **kwargs
+            ),
+            f"{system}\n{prompt}" if system else prompt,
+            max_tokens,
+            usage=_usage_tokens,
+            template=template
         )
         
+        self._record_usage(getattr(response, "usage", None))
         return response.content[0].text
     
-    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
-        """Claude API를 사용하여 구조화된 데이터를 생성합니다."""
-        # 구조화된 생성 구현
-        response = await self.generate_text(prompt, **kwargs)
-        # 스키마에 따라 응답 파싱
-        return {"generated": response}
+    def _system_blocks(self, system: str) -> List[Dict[str, Any]]:
+        """시스템 프롬프트를 프롬프트 캐시 접두부로 표시한 블록으로 만듭니다 (최소 길이 미만이면 제공자가 무시)."""
+        block: Dict[str, Any] = {"type": "text", "text": system}
+        if self.prompt_cache_enabled:
+            block["cache_control"] = {"type": "ephemeral"}
+        return [block]
     
-    # IContentAnalyzer 구현
-    async def is_relevant(self, text: str, criteria: Optional[Dict[str, Any]] = None) -> bool:
-        """Claude를 사용하여 관련성을 확인합니다."""
-        criteria = criteria or self._get_default_criteria()
-        keywords = criteria.get("keywords", [])
-        
-        prompt = f"""
-        다음 텍스트가 통신/IT 관련 주제와 관련이 있는지 판단해주세요.
-        관련 키워드: {', '.join(keywords)}
-        
-        텍스트: {text}
-        
-        관련성이 있으면 'YES', 없으면 'NO'로 답변해주세요.
-        """
-        
-        response = await self.generate_text(prompt)
-        return "YES" in response.upper()
+    def _token_usage(self, response) -> Optional[Tuple[int, int, int]]:
+        """응답의 (입력, 출력, 캐시 읽기 입력) 토큰 수 - 입력은 캐시 읽기/기록을 포함합니다."""
+        usage = getattr(response, "usage", None)
+        if not usage:
+            return None
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        return usage.input_tokens + cache_read + cache_write, usage.output_tokens, cache_read
     
-    async def classify_category(self, text: str, categories: Optional[List[str]] = None) -> str:
-        """Claude를 사용하여 콘텐츠를 분류합니다."""
-        categories = categories or self._get_default_categories()
-        
-        prompt = f"""
-        다음 텍스트를 다음 카테고리 중 하나로 분류해주세요:
-        {', '.join(categories)}
+    def _record_usage(self, usage) -> None:
+        """응답 사용량의 캐시 읽기/기록 토큰을 기록합니다."""
+        if not usage:
+            return
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        self._record_prompt_cache(usage.input_tokens + cache_read + cache_write, cache_read, cache_write)
+    
+    # 제공자 배치 작업 (Message Batches API)
+    @property
+    def supports_batch_jobs(self) -> bool:
+        return anthropic is not None
+    
+    async def _submit_batch_requests(self, requests: List[Dict[str, Any]]) -> str:
+        """Message Batches API로 요청들을 제출합니다."""
+        if not self.client:
+            await self.initialize()
         
-        텍스트: {text}
+        batch = await self.client.messages.batches.create(requests=[
+            {
+                "custom_id": request["custom_id"],
+                "params": {
+                    "model": self.model,
+                    "max_tokens": request["max_tokens"],
+                    "system": self._system_blocks(request["system"]),
+                    "messages": [{"role": "user", "content": request["prompt"]}],
+                },
+            }
+            for request in requests
+        ])
+        return batch.id
+    
+    async def _fetch_batch_results(self, job_id: str) -> Optional[Dict[str, str]]:
+        """배치가 끝났으면 성공한 요청의 응답 텍스트를 가져옵니다 (실패/만료된 요청은 제외)."""
+        if not self.client:
+            await self.initialize()
         
-        가장 적절한 카테고리명만 답변해주세요.
-        """
+        batch = await self.client.messages.batches.retrieve(job_id)
+        if batch.processing_status != "ended":
+            return None
         
-        response = await self.generate_text(prompt)
-        return response.strip()
+        responses = {}
+        async for entry in await self.client.messages.batches.results(job_id):
+            if entry.result.type == "succeeded":
+                responses[entry.custom_id] = entry.result.message.content[0].text
+                self._record_usage(entry.result.message.usage)
+                self._record_call("batch_job", *(self._token_usage(entry.result.message) or (0, 0, 0)))
+        return responses
+    
+    # IContentAnalyzer 구현
+    async def is_relevant(self, text: str, criteria: Optional[Dict[str, Any]] = None) -> bool:
+        """Claude를 사용하여 관련성을 확인합니다."""
+        system, prompt = self._relevance_prompt(text, criteria or self._get_default_criteria())
+        response = await self.generate_text(prompt, system=system, template="relevance")
+        return "YES" in response.upper()
     
     async def summarize(self, text: str, sentences: int = 3, style: str = "neutral") -> str:
         """Claude를 사용하여 요약을 생성합니다."""
-        prompt = f"""
-        다음 텍스트를 {sentences}문장으로 요약해주세요.
-        스타일: {style}
-        
-        텍스트: {text}
-        """
-        
-        return await self.generate_text(prompt)
+        if self._estimate_tokens(text) > self.summary_chunk_tokens:
+            # 긴 본문은 조각별로 요약한 뒤 합침
+            return await self._summarize_chunks(text, sentences, style)
+        return await self._summarize_prompt(text, sentences, style)
 
@@ -0,0 +1,200 @@
+"""LLM 호출 계측 - 호출마다 제공자, 모델, 프롬프트 템플릿, 토큰, 지연, 재시도, 캐시 적중을 기록합니다.
+
+기록은 프로세스 전체 레지스트리(``get_usage_registry()``)와, ``track_usage()``로 연 현재 작업
+(예: 평가 세션)의 집계에 함께 더해집니다. 현재 작업 집계는 ContextVar로 전달되므로
+``asyncio.gather``로 나뉜 하위 작업의 호출도 같은 세션에 합산됩니다.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app.infrastructure.config.llm_config import llm_config
+from .latency import LatencyTracker
+
+# 모델별 100만 토큰당 가격 (USD, 입력/출력) - 모델 이름 접두어로 찾음, LLM_PRICES로 재정의
+DEFAULT_PRICES: Dict[str, Tuple[float, float]] = {
+    "claude-3-opus": (15.0, 75.0),
+    "claude-3-sonnet": (3.0, 15.0),
+    "claude-3-5-sonnet": (3.0, 15.0),
+    "claude-3-haiku": (0.25, 1.25),
+    "claude-3-5-haiku": (0.8, 4.0),
+    "gpt-4o-mini": (0.15, 0.6),
+    "gpt-4o": (2.5, 10.0),
+    "gpt-3.5-turbo": (0.5, 1.5),
+}
+
+# 캐시에서 읽은 입력 토큰의 가격 비율 (제공자 프롬프트 캐시 할인)
+CACHED_INPUT_PRICE_RATIO = 0.1
+
+
+def parse_prices(spec: str) -> Dict[str, Tuple[float, float]]:
+    """"모델=입력/출력,모델=입력/출력" 형식의 가격 설정을 파싱합니다."""
+    prices = {}
+    for item in filter(None, (part.strip() for part in (spec or "").split(","))):
+        model, _, values = item.partition("=")
+        input_price, _, output_price = values.partition("/")
+        prices[model.strip()] = (float(input_price), float(output_price or 0))
+    return prices
+
+
+@functools.lru_cache(maxsize=4)
+def _price_table(spec: str) -> Dict[str, Tuple[float, float]]:
+    """기본 가격에 LLM_PRICES 재정의를 더한 가격표 (설정 문자열별로 한 번만 파싱)."""
+    return dict(DEFAULT_PRICES, **parse_prices(spec))
+
+
+def model_prices(model: Optional[str]) -> Tuple[float, float]:
+    """모델의 (입력, 출력) 100만 토큰당 가격 - 가장 긴 접두어가 일치하는 항목을 사용합니다."""
+    prices = _price_table(llm_config.LLM_PRICES)
+    matches = [prefix for prefix in prices if model and model.startswith(prefix)]
+    return prices[max(matches, key=len)] if matches else (0.0, 0.0)
+
+
+@dataclass
+class LLMCallRecord:
+    """LLM 호출 하나의 계측 기록."""
+    provider: str
+    model: Optional[str]
+    template: str                     # 프롬프트 템플릿 (relevance, classify, analysis, batch_evaluation 등)
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0      # 제공자 프롬프트 캐시에서 읽은 입력 토큰
+    latency_ms: Optional[float] = None  # 배치 작업처럼 호출 지연이 없는 기록은 None
+    retries: int = 0
+    cache_hit: bool = False           # 응답 캐시 적중 (제공자 호출 없음)
+    error: Optional[str] = None
+
+    @property
+    def cost_usd(self) -> float:
+        """토큰 수와 모델 가격으로 계산한 비용."""
+        input_price, output_price = model_prices(self.model)
+        uncached = self.input_tokens - self.cached_input_tokens
+        return (
+            uncached * input_price
+            + self.cached_input_tokens * input_price * CACHED_INPUT_PRICE_RATIO
+            + self.output_tokens * output_price
+        ) / 1_000_000
+
+
+class UsageAggregate:
+    """LLM 호출 기록의 합계와 지연 백분위."""
+
+    def __init__(self, latency_window: int = 10000):
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cached_input_tokens = 0
+        self.cost_usd = 0.0
+        self.latency = LatencyTracker(window=latency_window)
+
+    def add(self, record: LLMCallRecord) -> None:
+        self.calls += 1
+        self.errors += record.error is not None
+        self.cache_hits += record.cache_hit
+        self.retries += record.retries
+        self.input_tokens += record.input_tokens
+        self.output_tokens += record.output_tokens
+        self.cached_input_tokens += record.cached_input_tokens
+        self.cost_usd += record.cost_usd
+        if record.latency_ms is not None and not record.cache_hit:
+            self.latency.record(record.latency_ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        def percentile(q: float) -> Optional[float]:
+            value = self.latency.percentile(q)
+            return round(value, 1) if value is not None else None
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "retries": self.retries,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cached_input_tokens": self.cached_input_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "latency_p50_ms": percentile(0.5),
+            "latency_p95_ms": percentile(0.95),
+            "latency_p99_ms": percentile(0.99),
+        }
+
+
+class UsageBreakdown:
+    """전체 합계와 (제공자, 모델, 템플릿)별 합계."""
+
+    def __init__(self):
+        self.total = UsageAggregate()
+        self.by_key: Dict[Tuple[str, str, str], UsageAggregate] = {}
+
+    def add(self, record: LLMCallRecord) -> None:
+        self.total.add(record)
+        key = (record.provider, record.model or "", record.template)
+        self.by_key.setdefault(key, UsageAggregate(latency_window=1000)).add(record)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(
+            self.total.as_dict(),
+            by_template=[
+                dict(aggregate.as_dict(), provider=provider, model=model or None, template=template)
+                for (provider, model, template), aggregate in sorted(self.by_key.items())
+            ],
+        )
+
+
+class LLMUsageRegistry:
+    """프로세스 전체 LLM 사용량 레지스트리."""
+
+    def __init__(self):
+        self.usage = UsageBreakdown()
+
+    def record(self, record: LLMCallRecord) -> None:
+        """기록을 레지스트리와 현재 작업 집계(track_usage)에 더합니다."""
+        self.usage.add(record)
+        current = _current_usage.get()
+        if current is not None:
+            current.add(record)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return self.usage.as_dict()
+
+    def reset(self) -> None:
+        self.usage = UsageBreakdown()
+
+
+_current_usage: contextvars.ContextVar[Optional[UsageBreakdown]] = contextvars.ContextVar("llm_usage", default=None)
+_registry = LLMUsageRegistry()
+
+
+def get_usage_registry() -> LLMUsageRegistry:
+    """프로세스 전체 LLM 사용량 레지스트리를 반환합니다."""
+    return _registry
+
+
+def record_llm_call(record: LLMCallRecord) -> None:
+    """LLM 호출 기록을 추가합니다."""
+    _registry.record(record)
+
+
+@contextmanager
+def track_usage() -> Iterator[UsageBreakdown]:
+    """이 블록(과 그 안에서 만든 하위 작업)의 LLM 호출을 따로 집계합니다.
+
+    Example:
+        with track_usage() as usage:
+            await service.evaluate_posts_batch(posts)
+        session.llm_usage = usage.as_dict()
+    """
+    usage = UsageBreakdown()
+    token = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(token)
@@ -0,0 +1,27 @@
+"""지연 시간 백분위 - 라우터의 헤지 지연과 호출 계측의 지연 집계가 함께 사용합니다."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Deque, Optional
+
+
+class LatencyTracker:
+    """최근 응답 시간으로 백분위 지연 시간을 계산합니다."""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q 백분위 지연 시간 (표본이 없으면 None)."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
@@ -0,0 +1,444 @@
+"""로컬 관련성/카테고리 분류기 - 지난 LLM 평가 결과로 학습한 해시 문자 n-gram 선형 모델.
+
+저장된 평가 결과(LLM 판정)와 게시글 본문으로 CPU에서 로지스틱 회귀를 학습하고,
+검증 데이터로 신뢰도를 보정합니다. ``LocalClassifierService``는 보정된 신뢰도가
+임계값 이상인 게시글만 로컬에서 판정하고, 나머지는 실제 LLM에 넘깁니다.
+
+학습:
+    python -m app.infrastructure.external.llm.local_classifier --output models/local_classifier.npz
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import unicodedata
+import zlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from app.infrastructure.config.llm_config import llm_config
+from .interfaces import IContentAnalyzer
+from .similarity import deduplicate_indices
+
+logger = logging.getLogger(__name__)
+
+# 학습 레이블로 쓰는 평가 방식 (키워드 사전 필터/로컬 분류기 자신의 판정은 제외)
+LLM_EVALUATION_METHODS = ("llm", "llm_structured", "llm_batch", "hybrid")
+
+# (텍스트, 관련성, 카테고리 - 없으면 None)
+Example = Tuple[str, bool, Optional[str]]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for the local classifier")
+
+
+class HashedNgramVectorizer:
+    """문자 n-gram을 고정 크기 해시 공간의 희소 벡터(로그 TF, L2 정규화)로 바꿉니다."""
+
+    def __init__(self, n_features: int = 1 << 18, ngram_min: int = 2, ngram_max: int = 4):
+        self.n_features = n_features
+        self.ngram_min = ngram_min
+        self.ngram_max = ngram_max
+
+    def features(self, text: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        """텍스트 하나의 (특성 인덱스, 값) 배열을 반환합니다."""
+        text = " ".join(unicodedata.normalize("NFKC", text or "").lower().split())
+        counts: Dict[int, int] = {}
+        for n in range(self.ngram_min, self.ngram_max + 1):
+            for i in range(len(text) - n + 1):
+                index = zlib.crc32(text[i:i + n].encode("utf-8")) % self.n_features
+                counts[index] = counts.get(index, 0) + 1
+        if not counts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        values = np.log1p(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+        return indices, values / np.linalg.norm(values)
+
+    def transform(self, texts: Sequence[str]) -> "SparseRows":
+        """텍스트들을 CSR 형태의 희소 행렬로 바꿉니다."""
+        rows = [self.features(text) for text in texts]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(indices) for indices, _ in rows])
+        indices = np.concatenate([r[0] for r in rows]) if rows else np.zeros(0, dtype=np.int64)
+        values = np.concatenate([r[1] for r in rows]) if rows else np.zeros(0, dtype=np.float32)
+        return SparseRows(indptr, indices, values)
+
+
+class SparseRows:
+    """CSR 희소 행렬 (행 = 문서) - 선형 모델 학습/예측에 필요한 연산만 제공합니다."""
+
+    def __init__(self, indptr: "np.ndarray", indices: "np.ndarray", values: "np.ndarray"):
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+        self._row_ids = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def take(self, rows: "np.ndarray") -> "SparseRows":
+        """일부 행만 골라 새 행렬을 만듭니다."""
+        starts, ends = self.indptr[rows], self.indptr[rows + 1]
+        picks = np.concatenate([np.arange(s, e) for s, e in zip(starts, ends)]) if len(rows) else np.zeros(0, dtype=np.int64)
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(ends - starts)
+        return SparseRows(indptr, self.indices[picks], self.values[picks])
+
+    def dot(self, weights: "np.ndarray") -> "np.ndarray":
+        """X @ W (W: 특성 수 × 출력 수)."""
+        out = np.zeros((len(self), weights.shape[1]), dtype=np.float64)
+        np.add.at(out, self._row_ids, self.values[:, None] * weights[self.indices])
+        return out
+
+    def gradient(self, errors: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """X^T @ E를 0이 아닌 특성 행에 대해서만 계산합니다.
+
+        Returns:
+            (특성 인덱스, 해당 행의 기울기)
+        """
+        grad = errors[self._row_ids] * self.values[:, None]
+        unique, inverse = np.unique(self.indices, return_inverse=True)
+        summed = np.zeros((len(unique), errors.shape[1]), dtype=np.float64)
+        np.add.at(summed, inverse, grad)
+        return unique, summed
+
+
+def _softmax(logits: "np.ndarray") -> "np.ndarray":
+    shifted = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return shifted / shifted.sum(axis=1, keepdims=True)
+
+
+def _sigmoid(logits: "np.ndarray") -> "np.ndarray":
+    return 1.0 / (1.0 + np.exp(-np.clip(logits, -30, 30)))
+
+
+def _fit_linear(
+    X: SparseRows,
+    targets: "np.ndarray",
+    n_features: int,
+    multiclass: bool,
+    epochs: int,
+    learning_rate: float,
+    l2: float,
+    batch_size: int,
+    seed: int,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """미니배치 SGD로 로지스틱(이진) 또는 소프트맥스(다중) 회귀를 학습합니다."""
+    outputs = targets.shape[1]
+    weights = np.zeros((n_features, outputs), dtype=np.float64)
+    bias = np.zeros(outputs, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+
+    for epoch in range(epochs):
+        rate = learning_rate / (1 + epoch)
+        order = rng.permutation(len(X))
+        for start in range(0, len(order), batch_size):
+            rows = order[start:start + batch_size]
+            batch = X.take(rows)
+            logits = batch.dot(weights) + bias
+            probs = _softmax(logits) if multiclass else _sigmoid(logits)
+            errors = (probs - targets[rows]) / len(rows)
+            indices, grad = batch.gradient(errors)
+            weights[indices] -= rate * (grad + l2 * weights[indices])
+            bias -= rate * errors.sum(axis=0)
+    return weights, bias
+
+
+def _fit_temperature(logits: "np.ndarray", targets: "np.ndarray", multiclass: bool) -> float:
+    """검증 데이터의 로그 손실이 가장 작은 온도(신뢰도 보정 계수)를 찾습니다."""
+    best, best_loss = 1.0, math.inf
+    for temperature in np.exp(np.linspace(math.log(0.25), math.log(4.0), 41)):
+        scaled = logits / temperature
+        if multiclass:
+            probs = _softmax(scaled)
+            loss = -np.mean(np.log(np.clip((probs * targets).sum(axis=1), 1e-9, 1.0)))
+        else:
+            probs = np.clip(_sigmoid(scaled), 1e-9, 1 - 1e-9)
+            loss = -np.mean(targets * np.log(probs) + (1 - targets) * np.log(1 - probs))
+        if loss < best_loss:
+            best, best_loss = float(temperature), loss
+    return best
+
+
+class LocalClassifierModel:
+    """학습된 관련성(이진) + 카테고리(다중) 선형 모델."""
+
+    def __init__(
+        self,
+        vectorizer: HashedNgramVectorizer,
+        relevance_weights: "np.ndarray",
+        relevance_bias: "np.ndarray",
+        relevance_temperature: float,
+        categories: List[str],
+        category_weights: Optional["np.ndarray"] = None,
+        category_bias: Optional["np.ndarray"] = None,
+        category_temperature: float = 1.0,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self.vectorizer = vectorizer
+        self.relevance_weights = relevance_weights
+        self.relevance_bias = relevance_bias
+        self.relevance_temperature = relevance_temperature
+        self.categories = categories
+        self.category_weights = category_weights
+        self.category_bias = category_bias
+        self.category_temperature = category_temperature
+        self.metadata = metadata or {}
+
+    def predict(self, text: str) -> Dict[str, Any]:
+        """관련성/카테고리와 보정된 신뢰도를 예측합니다.
+
+        Returns:
+            {"is_relevant", "relevance_probability", "relevance_confidence",
+             "category", "category_confidence"} 딕셔너리 (카테고리 모델이 없으면 category는 None)
+        """
+        X = self.vectorizer.transform([text])
+        probability = float(_sigmoid(
+            (X.dot(self.relevance_weights) + self.relevance_bias) / self.relevance_temperature
+        )[0, 0])
+        result = {
+            "is_relevant": probability >= 0.5,
+            "relevance_probability": probability,
+            "relevance_confidence": max(probability, 1 - probability),
+            "category": None,
+            "category_confidence": 0.0,
+        }
+        if self.category_weights is not None and self.categories:
+            probs = _softmax((X.dot(self.category_weights) + self.category_bias) / self.category_temperature)[0]
+            best = int(probs.argmax())
+            result.update(category=self.categories[best], category_confidence=float(probs[best]))
+        return result
+
+    def save(self, path: str) -> None:
+        """모델을 .npz 파일로 저장합니다."""
+        arrays = {
+            "relevance_weights": self.relevance_weights.astype(np.float32),
+            "relevance_bias": self.relevance_bias,
+        }
+        if self.category_weights is not None:
+            arrays.update(category_weights=self.category_weights.astype(np.float32), category_bias=self.category_bias)
+        meta = dict(
+            self.metadata,
+            n_features=self.vectorizer.n_features,
+            ngram_min=self.vectorizer.ngram_min,
+            ngram_max=self.vectorizer.ngram_max,
+            relevance_temperature=self.relevance_temperature,
+            category_temperature=self.category_temperature,
+            categories=self.categories,
+        )
+        np.savez_compressed(path, meta=np.array(json.dumps(meta, ensure_ascii=False)), **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "LocalClassifierModel":
+        """save로 저장한 모델을 불러옵니다."""
+        _require_numpy()
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            arrays = {name: data[name].astype(np.float64) for name in data.files if name != "meta"}
+        return cls(
+            vectorizer=HashedNgramVectorizer(meta["n_features"], meta["ngram_min"], meta["ngram_max"]),
+            relevance_weights=arrays["relevance_weights"],
+            relevance_bias=arrays["relevance_bias"],
+            relevance_temperature=meta["relevance_temperature"],
+            categories=meta["categories"],
+            category_weights=arrays.get("category_weights"),
+            category_bias=arrays.get("category_bias"),
+            category_temperature=meta["category_temperature"],
+            metadata=meta,
+        )
+
+
+def train_local_classifier(
+    examples: Sequence[Example],
+    n_features: int = 1 << 18,
+    epochs: int = 5,
+    learning_rate: float = 2.0,
+    l2: float = 1e-6,
+    batch_size: int = 64,
+    validation_ratio: float = 0.2,
+    seed: int = 1,
+) -> LocalClassifierModel:
+    """(텍스트, 관련성, 카테고리) 예제들로 로컬 분류기를 학습합니다.
+
+    검증용으로 떼어 둔 validation_ratio 비율의 예제로 신뢰도 보정(온도)과 정확도를 계산하고,
+    보정 후에는 전체 예제로 다시 학습합니다.
+    """
+    _require_numpy()
+    if len(examples) < 10:
+        raise ValueError("At least 10 labeled examples are required")
+
+    vectorizer = HashedNgramVectorizer(n_features)
+    X = vectorizer.transform([text for text, _, _ in examples])
+    relevance = np.array([[1.0 if relevant else 0.0] for _, relevant, _ in examples])
+
+    categorized = [i for i, (_, _, category) in enumerate(examples) if category]
+    categories = sorted({examples[i][2] for i in categorized})
+    category_targets = np.zeros((len(examples), len(categories)))
+    for i in categorized:
+        category_targets[i, categories.index(examples[i][2])] = 1.0
+
+    order = list(range(len(examples)))
+    random.Random(seed).shuffle(order)
+    split = max(1, int(len(order) * validation_ratio))
+    valid, train = np.array(order[:split]), np.array(order[split:])
+    fit = dict(epochs=epochs, learning_rate=learning_rate, l2=l2, batch_size=batch_size, seed=seed)
+
+    # 관련성 - 검증 데이터로 온도 보정 후 전체 데이터로 재학습
+    weights, bias = _fit_linear(X.take(train), relevance[train], n_features, False, **fit)
+    valid_logits = X.take(valid).dot(weights) + bias
+    relevance_temperature = _fit_temperature(valid_logits, relevance[valid], False)
+    relevance_accuracy = float(np.mean((valid_logits[:, 0] >= 0) == (relevance[valid, 0] == 1)))
+    relevance_weights, relevance_bias = _fit_linear(X, relevance, n_features, False, **fit)
+
+    # 카테고리 - 카테고리가 둘 이상일 때만 학습
+    category_weights = category_bias = None
+    category_temperature, category_accuracy = 1.0, None
+    if len(categories) >= 2:
+        labeled = set(categorized)
+        cat_train = np.array([i for i in train if i in labeled], dtype=np.int64)
+        cat_valid = np.array([i for i in valid if i in labeled], dtype=np.int64)
+        weights, bias = _fit_linear(X.take(cat_train), category_targets[cat_train], n_features, True, **fit)
+        if len(cat_valid):
+            valid_logits = X.take(cat_valid).dot(weights) + bias
+            category_temperature = _fit_temperature(valid_logits, category_targets[cat_valid], True)
+            category_accuracy = float(np.mean(valid_logits.argmax(axis=1) == category_targets[cat_valid].argmax(axis=1)))
+        cat_all = np.array(categorized, dtype=np.int64)
+        category_weights, category_bias = _fit_linear(X.take(cat_all), category_targets[cat_all], n_features, True, **fit)
+
+    return LocalClassifierModel(
+        vectorizer=vectorizer,
+        relevance_weights=relevance_weights,
+        relevance_bias=relevance_bias,
+        relevance_temperature=relevance_temperature,
+        categories=categories,
+        category_weights=category_weights,
+        category_bias=category_bias,
+        category_temperature=category_temperature,
+        metadata={
+            "trained_at": datetime.utcnow().isoformat(),
+            "examples": len(examples),
+            "validation_relevance_accuracy": relevance_accuracy,
+            "validation_category_accuracy": category_accuracy,
+        },
+    )
+
+
+async def load_training_examples(result_repo, post_repo, limit: int = 50000) -> List[Example]:
+    """저장된 LLM 평가 결과와 게시글 본문으로 학습 예제를 만듭니다.
+
+    Args:
+        result_repo: EvaluationResultRepository
+        post_repo: CrawledPostRepository
+        limit: 최근 평가 결과 최대 개수
+    """
+    results = [
+        result for result in await result_repo.list_recent(limit)
+        if result.details.get("evaluation_method") in LLM_EVALUATION_METHODS
+    ]
+    posts = {post.id: post for post in await post_repo.get_many([result.post_id for result in results])}
+
+    examples: List[Example] = []
+    for result in results:
+        post = posts.get(result.post_id)
+        if post is None:
+            continue
+        # RelevanceEvaluationService 결과의 category는 실제 카테고리가 아님
+        category = result.category if result.category not in ("relevance_check", "") else None
+        examples.append((f"{post.title}\n{post.content}", result.is_relevant, category))
+    return examples
+
+
+class LocalClassifierService(IContentAnalyzer):
+    """로컬 분류기 기반 IContentAnalyzer - 신뢰도가 낮은 게시글만 실제 LLM에 넘깁니다."""
+
+    name = "local_classifier"
+
+    def __init__(self, model: LocalClassifierModel, fallback=None, threshold: Optional[float] = None):
+        """서비스를 만듭니다.
+
+        Args:
+            model: 학습된 로컬 분류기
+            fallback: 신뢰도가 낮을 때 사용할 LLM 서비스 (없으면 로컬 판정을 그대로 사용)
+            threshold: 로컬 판정을 사용할 최소 신뢰도 (기본: LOCAL_CLASSIFIER_THRESHOLD)
+        """
+        self.model = model
+        self.fallback = fallback
+        self.threshold = threshold if threshold is not None else llm_config.LOCAL_CLASSIFIER_THRESHOLD
+        self.stats = {"local": 0, "fallback": 0}
+
+    @classmethod
+    def from_path(cls, path: str, fallback=None, threshold: Optional[float] = None) -> "LocalClassifierService":
+        return cls(LocalClassifierModel.load(path), fallback, threshold)
+
+    def predict(self, text: str) -> Dict[str, Any]:
+        """보정된 신뢰도를 포함한 로컬 예측 (LocalClassifierModel.predict)."""
+        return self.model.predict(text)
+
+    async def is_relevant(self, text: str, criteria: Optional[Dict[str, Any]] = None) -> bool:
+        prediction = self.predict(text)
+        if prediction["relevance_confidence"] >= self.threshold or self.fallback is None:
+            self.stats["local"] += 1
+            return prediction["is_relevant"]
+        self.stats["fallback"] += 1
+        return await self.fallback.is_relevant(text, criteria)
+
+    async def classify_category(self, text: str, categories: Optional[List[str]] = None) -> str:
+        prediction = self.predict(text)
+        allowed = prediction["category"] is not None and (not categories or prediction["category"] in categories)
+        if allowed and (prediction["category_confidence"] >= self.threshold or self.fallback is None):
+            self.stats["local"] += 1
+            return prediction["category"]
+        if self.fallback is None:
+            return "OTHER"
+        self.stats["fallback"] += 1
+        return await self.fallback.classify_category(text, categories)
+
+    async def analyze_sentiment(self, text: str) -> Dict[str, Any]:
+        if self.fallback is None:
+            raise NotImplementedError("local classifier does not analyze sentiment")
+        return await self.fallback.analyze_sentiment(text)
+
+    async def deduplicate(self, items: List[str], threshold: float = 0.8) -> List[int]:
+        return await asyncio.to_thread(deduplicate_indices, items, threshold)
+
+
+async def _train_from_database(output: str, limit: int) -> None:
+    from app.infrastructure.database.database import close_database, init_database
+    from app.infrastructure.database.repositories import CrawledPostRepositoryImpl, EvaluationResultRepositoryImpl
+
+    await init_database()
+    try:
+        examples = await load_training_examples(EvaluationResultRepositoryImpl(), CrawledPostRepositoryImpl(), limit)
+    finally:
+        await close_database()
+
+    print(f"학습 예제 {len(examples)}개")
+    model = train_local_classifier(examples)
+    model.save(output)
+    print(json.dumps(model.metadata, ensure_ascii=False, indent=2))
+    print(f"모델 저장: {output}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="지난 LLM 평가 결과로 로컬 분류기를 학습합니다.")
+    parser.add_argument("--output", default=llm_config.LOCAL_CLASSIFIER_PATH or "local_classifier.npz")
+    parser.add_argument("--limit", type=int, default=50000, help="사용할 최근 평가 결과 최대 개수")
+    args = parser.parse_args()
+    asyncio.run(_train_from_database(args.output, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import List, Dict, Any, Optional
+from app.modules.evaluation.keywords import DEFAULT_KEYWORDS, KeywordMatcher, get_keyword_matcher
 from .base import BaseLLMService
 
 
@@ -37,10 +38,13 @@ class MockLLM(BaseLLMService):
     
     # IContentAnalyzer 구현
     async def is_relevant(self, text: str, criteria: Optional[Dict[str, Any]] = None) -> bool:
-        """키워드 매칭을 사용하여 관련성을 확인합니다."""
-        criteria = criteria or self._get_default_criteria()
-        keywords = criteria.get("keywords", [])
-        return any(keyword in text for keyword in keywords)
+        """키워드 매칭을 사용하여 관련성을 확인합니다 (기본 키워드는 별칭까지 매칭)."""
+        keywords = (criteria or {}).get("keywords", DEFAULT_KEYWORDS)
+        if list(keywords) == DEFAULT_KEYWORDS:
+            matcher = get_keyword_matcher()
+        else:
+            matcher = KeywordMatcher.from_keywords(keywords)
+        return matcher.match(text).total > 0
     
     async def classify_category(self, text: str, categories: Optional[List[str]] = None) -> str:
         """키워드 매핑을 사용하여 분류합니다."""
@@ -63,6 +67,10 @@ class MockLLM(BaseLLMService):
         
         return "OTHER"
     
+    async def classify_category_scored(self, text: str, categories: Optional[List[str]] = None) -> Dict[str, Any]:
+        """키워드 매핑으로 분류합니다 (신뢰도 없음)."""
+        return {"category": await self.classify_category(text, categories), "confidence": None}
+    
     async def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """감정을 분석합니다 (Mock 구현)."""
         positive_words = ["좋", "긍정", "성공", "향상"]
@@ -78,18 +86,41 @@ class MockLLM(BaseLLMService):
         else:
             return {"sentiment": "neutral", "score": 0.0}
     
-    async def deduplicate(self, items: List[str], threshold: float = 0.8) -> List[int]:
-        """간단한 문자열 매칭을 사용하여 중복을 제거합니다."""
-        seen = {}
-        keep = []
-        
-        for idx, item in enumerate(items):
-            key = item.strip().lower()
-            if key not in seen:
-                seen[key] = idx
-                keep.append(idx)
-        
-        return keep
+    async def analyze_post(
+        self,
+        text: str,
+        criteria: Optional[Dict[str, Any]] = None,
+        categories: Optional[List[str]] = None,
+        sentences: int = 3
+    ) -> Dict[str, Any]:
+        """키워드 매칭과 잘라내기 요약으로 게시글을 분석합니다."""
+        is_relevant = await self.is_relevant(text, criteria)
+        return {
+            "is_relevant": is_relevant,
+            "relevance_score": 0.8 if is_relevant else 0.2,
+            "category": await self.classify_category(text, categories),
+            "summary": await self.summarize(text, sentences),
+        }
+    
+    async def evaluate_batch(
+        self,
+        posts: List[Dict[str, Any]],
+        criteria: Optional[Dict[str, Any]] = None,
+        categories: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """키워드 매칭으로 게시글들을 일괄 평가합니다 (배치 프롬프트 없이)."""
+        results = []
+        for post in posts:
+            text = f"{post['title']}\n{post['content']}"
+            is_relevant = await self.is_relevant(text, criteria)
+            results.append({
+                "id": str(post["id"]),
+                "is_relevant": is_relevant,
+                "category": await self.classify_category(text, categories),
+                "relevance_score": 0.8 if is_relevant else 0.2,
+                "batch_size": len(posts),
+            })
+        return results
     
     # IContentGenerator 구현
     async def summarize(self, text: str, sentences: int = 3, style: str = "neutral") -> str:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+import json
+import math
+from typing import List, Dict, Any, Optional, Tuple
 try:
     import openai
 except ImportError:
@@ -10,6 +12,12 @@ except ImportError:
 from .base import BaseLLMService
 
 
+def _usage_tokens(response) -> Optional[int]:
+    """응답의 실제 사용 토큰 수 (입력 + 출력)."""
+    usage = getattr(response, "usage", None)
+    return usage.total_tokens if usage else None
+
+
 class OpenAIService(BaseLLMService):
     """OpenAI LLM 서비스 구현."""
     
@@ -17,6 +25,7 @@ class OpenAIService(BaseLLMService):
         super().__init__("openai", config)
         self.api_key = self.config.get("api_key")
         self.model = self.config.get("model", "gpt-3.5-turbo")
+        self.base_url = self.config.get("base_url")
         self.client = None
     
     async def _setup_provider(self) -> None:
@@ -24,72 +33,181 @@ class OpenAIService(BaseLLMService):
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
         
-        self.client = openai.AsyncOpenAI(api_key=self.api_key)
+        self.http_client = self._create_http_client(openai)
+        self.client = openai.AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=self.request_timeout,
+            http_client=self.http_client
+        )
+    
+    async def _close_provider(self) -> None:
+        """OpenAI 클라이언트와 연결 풀을 닫습니다."""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+        self.http_client = None
     
     # ILLMProvider 구현
     async def generate_text(self, prompt: str, **kwargs) -> str:
         """OpenAI API를 사용하여 텍스트를 생성합니다."""
+        response = await self._complete(prompt, **kwargs)
+        return response.choices[0].message.content
+    
+    async def _complete(self, prompt: str, **kwargs):
+        """Chat Completions API를 호출하고 응답 객체를 반환합니다."""
         if not self.client:
             await self.initialize()
         
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            **kwargs
+        max_tokens = kwargs.pop("max_tokens", self.config.get("max_tokens", 1000))
+        system = kwargs.pop("system", None)
+        template = kwargs.pop("template", "generate_text")
+        messages = self._messages(prompt, system)
+        
+        response = await self._dispatch(
+            lambda: self.client.chat.completions.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=messages,
+                **kwargs
+            ),
+            f"{system}\n{prompt}" if system else prompt,
+            max_tokens,
+            usage=_usage_tokens,
+            template=template
         )
         
-        return response.choices[0].message.content
+        usage = getattr(response, "usage", None)
+        if usage:
+            details = getattr(usage, "prompt_tokens_details", None)
+            self._record_prompt_cache(usage.prompt_tokens, getattr(details, "cached_tokens", None) or 0)
+        
+        return response
     
-    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
-        """OpenAI API를 사용하여 구조화된 데이터를 생성합니다."""
-        # 구조화된 생성 구현
-        # 함수 호출 또는 JSON 모드를 사용
-        response = await self.generate_text(prompt, **kwargs)
-        # 스키마에 따라 응답 파싱
-        return {"generated": response}
+    async def _generate_label(self, prompt: str, system: str, labels: List[str]) -> Tuple[Optional[str], Optional[float]]:
+        """라벨 하나를 생성하고, 첫 토큰의 상위 logprobs에서 가장 확률이 높은 라벨과 그 확률을 반환합니다."""
+        response = await self._complete(
+            prompt,
+            system=system,
+            max_tokens=self.classify_max_tokens,
+            temperature=0,
+            logprobs=True,
+            top_logprobs=min(len(labels), 20),
+            template="classify"
+        )
+        choice = response.choices[0]
+        content = getattr(getattr(choice, "logprobs", None), "content", None)
+        if content:
+            scores: Dict[str, float] = {}
+            for candidate in content[0].top_logprobs or []:
+                label = candidate.token.strip().upper()
+                if label in labels:
+                    scores[label] = scores.get(label, 0.0) + math.exp(candidate.logprob)
+            if scores:
+                label = max(scores, key=scores.get)
+                return label, scores[label]
+        return self._parse_label(choice.message.content or "", labels), None
     
-    # IContentAnalyzer 구현
-    async def is_relevant(self, text: str, criteria: Optional[Dict[str, Any]] = None) -> bool:
-        """OpenAI를 사용하여 관련성을 확인합니다."""
-        criteria = criteria or self._get_default_criteria()
-        keywords = criteria.get("keywords", [])
-        
-        prompt = f"""
-        다음 텍스트가 통신/IT 관련 주제와 관련이 있는지 판단해주세요.
-        관련 키워드: {', '.join(keywords)}
-        
-        텍스트: {text}
+    def _token_usage(self, response) -> Optional[Tuple[int, int, int]]:
+        """응답의 (입력, 출력, 캐시 읽기 입력) 토큰 수."""
+        usage = getattr(response, "usage", None)
+        if not usage:
+            return None
+        details = getattr(usage, "prompt_tokens_details", None)
+        return usage.prompt_tokens, usage.completion_tokens, getattr(details, "cached_tokens", None) or 0
+    
+    def _messages(self, prompt: str, system: Optional[str] = None) -> List[Dict[str, str]]:
+        """채팅 메시지 목록을 만듭니다.
         
-        관련성이 있으면 'YES', 없으면 'NO'로 답변해주세요.
+        OpenAI는 동일한 접두부(1024토큰 이상)를 자동으로 캐시하므로 고정 시스템 프롬프트를 맨 앞에 둡니다.
         """
-        
-        response = await self.generate_text(prompt)
-        return "YES" in response.upper()
+        messages = [{"role": "user", "content": prompt}]
+        if system:
+            messages.insert(0, {"role": "system", "content": system})
+        return messages
     
-    async def classify_category(self, text: str, categories: Optional[List[str]] = None) -> str:
-        """OpenAI를 사용하여 콘텐츠를 분류합니다."""
-        categories = categories or self._get_default_categories()
-        
-        prompt = f"""
-        다음 텍스트를 다음 카테고리 중 하나로 분류해주세요:
-        {', '.join(categories)}
+    # 제공자 배치 작업 (Batch API)
+    @property
+    def supports_batch_jobs(self) -> bool:
+        return openai is not None
+    
+    async def _submit_batch_requests(self, requests: List[Dict[str, Any]]) -> str:
+        """요청들을 JSONL 파일로 올리고 Batch API 작업을 만듭니다."""
+        if not self.client:
+            await self.initialize()
         
-        텍스트: {text}
+        lines = [
+            json.dumps({
+                "custom_id": request["custom_id"],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "max_tokens": request["max_tokens"],
+                    "messages": self._messages(request["prompt"], request["system"]),
+                },
+            }, ensure_ascii=False)
+            for request in requests
+        ]
+        batch_file = await self.client.files.create(
+            file=("evaluation_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+    
+    async def _fetch_batch_results(self, job_id: str) -> Optional[Dict[str, str]]:
+        """작업이 끝났으면 결과 파일에서 성공한 요청의 응답 텍스트를 가져옵니다."""
+        if not self.client:
+            await self.initialize()
         
-        가장 적절한 카테고리명만 답변해주세요.
-        """
+        batch = await self.client.batches.retrieve(job_id)
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"OpenAI batch {job_id} {batch.status}")
+        if batch.status != "completed":
+            return None
+        if not batch.output_file_id:
+            return {}
         
-        response = await self.generate_text(prompt)
-        return response.strip()
+        content = await self.client.files.content(batch.output_file_id)
+        responses = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                body = response["body"]
+                responses[entry["custom_id"]] = body["choices"][0]["message"]["content"]
+                usage = body.get("usage") or {}
+                self._record_call(
+                    "batch_job",
+                    usage.get("prompt_tokens", 0),
+                    usage.get("completion_tokens", 0),
+                    (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+                )
+        return responses
+    
+    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """OpenAI JSON 모드를 사용하여 구조화된 데이터를 생성합니다."""
+        kwargs.setdefault("response_format", {"type": "json_object"})
+        return await super().generate_structured(prompt, schema, **kwargs)
+    
+    # IContentAnalyzer 구현
+    async def is_relevant(self, text: str, criteria: Optional[Dict[str, Any]] = None) -> bool:
+        """OpenAI를 사용하여 관련성을 확인합니다."""
+        system, prompt = self._relevance_prompt(text, criteria or self._get_default_criteria())
+        response = await self.generate_text(prompt, system=system, template="relevance")
+        return "YES" in response.upper()
     
     async def summarize(self, text: str, sentences: int = 3, style: str = "neutral") -> str:
         """OpenAI를 사용하여 요약을 생성합니다."""
-        prompt = f"""
-        다음 텍스트를 {sentences}문장으로 요약해주세요.
-        스타일: {style}
-        
-        텍스트: {text}
-        """
-        
-        return await self.generate_text(prompt)
+        if self._estimate_tokens(text) > self.summary_chunk_tokens:
+            # 긴 본문은 조각별로 요약한 뒤 합침
+            return await self._summarize_chunks(text, sentences, style)
+        return await self._summarize_prompt(text, sentences, style)
 
@@ -0,0 +1,66 @@
+"""평가 프롬프트 - 모든 평가 작업이 공유하는 시스템 프롬프트(고정 접두부)를 만듭니다.
+
+관련성 판단, 카테고리 분류, 통합 분석, 일괄 평가는 같은 기준(키워드와 별칭, 카테고리 정의)을
+사용하므로, 기준을 바이트 단위로 동일한 시스템 프롬프트 하나에 모으고 게시글 본문과 작업 지시만
+사용자 메시지로 보냅니다. 제공자의 프롬프트 캐시(Anthropic ``cache_control``, OpenAI 자동 접두부 캐시)가
+이 접두부를 재사용하므로 평가 호출마다 반복되는 입력 토큰 비용과 첫 토큰 지연이 줄어듭니다.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, Optional, Sequence
+
+# 카테고리 정의 (목록에 없는 카테고리는 이름만 표시)
+CATEGORY_GUIDE: Dict[str, str] = {
+    "SKT": "SK텔레콤, SK브로드밴드의 요금제, 서비스, 네트워크, 실적, 사건·사고",
+    "KT": "KT, KT스카이라이프의 요금제, 서비스, 네트워크, 실적, 사건·사고",
+    "LGU": "LG유플러스의 요금제, 서비스, 네트워크, 실적, 사건·사고",
+    "방통위": "방송통신위원회의 정책, 규제, 제재, 고시, 위원회 의결",
+    "KAIT": "한국정보통신진흥협회의 사업, 발표, 통계, 공지",
+    "이통시장여론": "특정 사업자보다 이동통신 시장 전반(단말기 지원금, 알뜰폰, 번호이동, 요금 수준)에 대한 이용자 반응과 여론",
+    "OTHER": "통신과 관련은 있지만 위 카테고리 어디에도 해당하지 않는 내용",
+}
+
+RELEVANCE_GUIDE = (
+    "관련 있음: 통신 사업자, 통신 요금과 서비스, 통신 네트워크(5G/LTE 등), 단말기 유통, 통신 정책과 규제를 "
+    "직접 다루는 글.\n"
+    "관련 없음: 키워드가 비유나 광고 문구로만 등장하거나, 통신과 무관한 일상/연예/스포츠/일반 IT 제품 이야기인 글."
+)
+
+
+def evaluation_system_prompt(
+    keyword_groups: Mapping[str, Sequence[str]],
+    categories: Sequence[str],
+    category_guide: Optional[Mapping[str, str]] = None
+) -> str:
+    """평가 작업 공통 시스템 프롬프트를 만듭니다.
+
+    같은 키워드/카테고리로 만들면 항상 같은 문자열이 나오므로 프롬프트 캐시 접두부로 사용할 수 있습니다.
+
+    Args:
+        keyword_groups: 대표 키워드 -> 별칭 목록
+        categories: 분류 카테고리 (순서 유지)
+        category_guide: 카테고리 정의 (기본: CATEGORY_GUIDE)
+    """
+    guide = CATEGORY_GUIDE if category_guide is None else category_guide
+    keyword_lines: List[str] = []
+    for keyword, aliases in keyword_groups.items():
+        others = [alias for alias in aliases if alias != keyword]
+        keyword_lines.append(f"- {keyword}" + (f" (별칭: {', '.join(others)})" if others else ""))
+    category_lines = [
+        f"- {category}: {guide[category]}" if category in guide else f"- {category}"
+        for category in categories
+    ]
+    return (
+        "당신은 한국 통신 업계 뉴스레터의 편집자입니다. 커뮤니티 게시글, 뉴스 기사, 정부 문서를 읽고 "
+        "통신/IT 관련 주제와의 관련성을 판단하고 카테고리를 분류합니다.\n\n"
+        "## 관련성 기준\n"
+        f"{RELEVANCE_GUIDE}\n\n"
+        "## 관련 키워드\n"
+        + "\n".join(keyword_lines) + "\n\n"
+        "## 카테고리\n"
+        + "\n".join(category_lines) + "\n\n"
+        "## 답변 규칙\n"
+        "- 사용자 메시지의 작업 지시와 답변 형식을 정확히 따르고, 다른 설명은 쓰지 마세요.\n"
+        "- 카테고리는 위 목록의 이름을 그대로 사용하세요."
+    )
@@ -0,0 +1,284 @@
+"""LLM 제공자 라우팅 - 여러 제공자(Claude, OpenAI 등)를 하나의 LLM 서비스로 묶습니다.
+
+- 장애 전환: 우선 제공자가 실패하면 다음 제공자로 다시 요청합니다.
+- 헤지 요청: 응답이 메서드별 p95 지연 시간보다 늦으면 다음 제공자에 같은 요청을 보내고
+  먼저 도착한 응답을 사용합니다 (느린 쪽은 취소).
+- 서킷 브레이커: 연속으로 실패한 제공자는 일정 시간 동안 요청에서 제외합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.infrastructure.config.llm_config import llm_config
+from .interfaces import ILLMProvider, ITextProcessor, IContentAnalyzer, IContentGenerator
+from .latency import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """제공자별 서킷 브레이커 (closed → open → half_open → closed)."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 확인합니다 (half_open이면 시험 요청 허용)."""
+        return self.state != self.OPEN
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            # 시험 요청이 실패하면 다시 reset_seconds 동안 차단
+            self.opened_at = time.monotonic()
+
+
+class RoutingLLMService(ILLMProvider, ITextProcessor, IContentAnalyzer, IContentGenerator):
+    """여러 LLM 제공자에 장애 전환, 헤지 요청, 서킷 브레이커를 적용하는 LLM 서비스.
+
+    providers 순서가 우선순위이며, 나머지 속성은 첫 번째 제공자에 위임합니다.
+    """
+
+    def __init__(
+        self,
+        providers: List[Any],
+        hedge: Optional[bool] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 20,
+        hedge_default_delay: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        reset_seconds: Optional[float] = None,
+    ):
+        """라우터를 만듭니다.
+
+        Args:
+            providers: 우선순위 순의 LLM 서비스들
+            hedge: 헤지 요청 사용 여부 (기본: HEDGE_ENABLED)
+            hedge_percentile: 헤지 요청을 보낼 지연 백분위 (기본: HEDGE_PERCENTILE)
+            hedge_min_samples: 백분위 대신 hedge_default_delay를 쓰는 최소 표본 수
+            hedge_default_delay: 표본이 부족할 때의 헤지 지연 (기본: HEDGE_DEFAULT_DELAY)
+            failure_threshold: 서킷을 여는 연속 실패 수 (기본: CIRCUIT_FAILURE_THRESHOLD)
+            reset_seconds: 서킷이 열린 뒤 시험 요청까지의 시간 (기본: CIRCUIT_RESET_SECONDS)
+        """
+        if not providers:
+            raise ValueError("At least one LLM provider is required")
+        self.providers = list(providers)
+        self.name = "router:" + ",".join(provider.name for provider in self.providers)
+        self.hedge = llm_config.HEDGE_ENABLED if hedge is None else hedge
+        self.hedge_percentile = hedge_percentile or llm_config.HEDGE_PERCENTILE
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_default_delay = hedge_default_delay or llm_config.HEDGE_DEFAULT_DELAY
+        self.breakers = {
+            provider.name: CircuitBreaker(
+                failure_threshold or llm_config.CIRCUIT_FAILURE_THRESHOLD,
+                reset_seconds or llm_config.CIRCUIT_RESET_SECONDS,
+            )
+            for provider in self.providers
+        }
+        self._latency: Dict[Tuple[str, str], LatencyTracker] = {}
+        self.stats = {"requests": 0, "failovers": 0, "hedged": 0, "hedge_wins": 0, "errors": 0}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.providers[0], name)
+
+    @property
+    def model(self) -> Optional[str]:
+        return getattr(self.providers[0], "model", None)
+
+    async def initialize(self) -> None:
+        """모든 제공자를 초기화합니다 (실패한 제공자는 서킷을 엽니다)."""
+        for provider in self.providers:
+            try:
+                await provider.initialize()
+            except Exception as e:
+                logger.warning(f"LLM 제공자 {provider.name} 초기화 실패: {e}")
+                self.breakers[provider.name].opened_at = time.monotonic()
+
+    async def warm_up(self) -> None:
+        """모든 제공자의 클라이언트를 만들고 연결을 미리 열어 둡니다 (실패한 제공자는 서킷을 엽니다)."""
+        for provider in self.providers:
+            try:
+                await provider.warm_up()
+            except Exception as e:
+                logger.warning(f"LLM 제공자 {provider.name} 초기화 실패: {e}")
+                self.breakers[provider.name].opened_at = time.monotonic()
+
+    async def close(self) -> None:
+        """모든 제공자의 클라이언트를 닫습니다."""
+        for provider in self.providers:
+            await provider.close()
+
+    def routing_stats(self) -> Dict[str, Any]:
+        """라우팅 통계와 제공자별 서킷 상태, p95 지연을 반환합니다."""
+        providers = {}
+        for provider in self.providers:
+            trackers = {method: tracker for (name, method), tracker in self._latency.items() if name == provider.name}
+            providers[provider.name] = {
+                "circuit": self.breakers[provider.name].state,
+                "failures": self.breakers[provider.name].failures,
+                "p95_seconds": {method: round(tracker.percentile(0.95), 3) for method, tracker in trackers.items()},
+            }
+        return dict(self.stats, providers=providers)
+
+    def prompt_cache_stats(self) -> Dict[str, Any]:
+        """제공자별 프롬프트 캐시 통계를 반환합니다."""
+        return {
+            provider.name: provider.prompt_cache_stats()
+            for provider in self.providers if hasattr(provider, "prompt_cache_stats")
+        }
+
+    def _hedge_delay(self, provider, method: str) -> float:
+        tracker = self._latency.get((provider.name, method))
+        if tracker is None or len(tracker) < self.hedge_min_samples:
+            return self.hedge_default_delay
+        return tracker.percentile(self.hedge_percentile)
+
+    def _record_latency(self, provider, method: str, seconds: float) -> None:
+        self._latency.setdefault((provider.name, method), LatencyTracker()).record(seconds)
+
+    async def _timed(self, provider, method: str, args: tuple, kwargs: dict) -> Tuple[Any, float]:
+        started = time.monotonic()
+        result = await getattr(provider, method)(*args, **kwargs)
+        return result, time.monotonic() - started
+
+    async def _route(self, method: str, *args, **kwargs) -> Any:
+        """method를 우선 제공자로 호출하고, 실패하면 다음 제공자로, 늦으면 헤지 요청을 보냅니다."""
+        self.stats["requests"] += 1
+        # 서킷이 열린 제공자는 제외 (모두 열려 있으면 전부 시도)
+        candidates = [p for p in self.providers if self.breakers[p.name].allow()] or list(self.providers)
+        waiting = deque(candidates)
+        pending: Dict[asyncio.Task, Any] = {}
+        last_error: Optional[BaseException] = None
+        hedged = False
+
+        def launch() -> None:
+            provider = waiting.popleft()
+            pending[asyncio.ensure_future(self._timed(provider, method, args, kwargs))] = provider
+
+        launch()
+        try:
+            while pending:
+                timeout = None
+                if self.hedge and not hedged and waiting and len(pending) == 1:
+                    timeout = self._hedge_delay(next(iter(pending.values())), method)
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # 우선 제공자가 p95보다 늦음 - 다음 제공자에 같은 요청을 보냄
+                    hedged = True
+                    self.stats["hedged"] += 1
+                    launch()
+                    continue
+
+                for task in done:
+                    provider = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        result, seconds = task.result()
+                        self.breakers[provider.name].record_success()
+                        self._record_latency(provider, method, seconds)
+                        if hedged and provider is not candidates[0]:
+                            self.stats["hedge_wins"] += 1
+                        return result
+                    last_error = error
+                    self.breakers[provider.name].record_failure()
+                    logger.warning(f"LLM 제공자 {provider.name}.{method} 실패: {error}")
+
+                if not pending and waiting:
+                    # 진행 중인 요청이 모두 실패 - 다음 제공자로 전환
+                    self.stats["failovers"] += 1
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self.stats["errors"] += 1
+        raise last_error
+
+    # ILLMProvider
+    async def generate_text(self, prompt: str, **kwargs) -> str:
+        return await self._route("generate_text", prompt, **kwargs)
+
+    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        return await self._route("generate_structured", prompt, schema, **kwargs)
+
+    # ITextProcessor
+    async def clean_text(self, text: str) -> str:
+        return await self.providers[0].clean_text(text)
+
+    async def extract_keywords(self, text: str, count: int = 10) -> List[str]:
+        return await self._route("extract_keywords", text, count)
+
+    async def detect_language(self, text: str) -> str:
+        return await self.providers[0].detect_language(text)
+
+    # IContentAnalyzer
+    async def is_relevant(self, text: str, criteria: Optional[Dict[str, Any]] = None) -> bool:
+        return await self._route("is_relevant", text, criteria)
+
+    async def classify_category(self, text: str, categories: Optional[List[str]] = None) -> str:
+        return await self._route("classify_category", text, categories)
+
+    async def classify_category_scored(self, text: str, categories: Optional[List[str]] = None) -> Dict[str, Any]:
+        return await self._route("classify_category_scored", text, categories)
+
+    async def analyze_sentiment(self, text: str) -> Dict[str, Any]:
+        return await self._route("analyze_sentiment", text)
+
+    async def deduplicate(self, items: List[str], threshold: float = 0.8) -> List[int]:
+        return await self.providers[0].deduplicate(items, threshold)
+
+    # IContentGenerator
+    async def summarize(self, text: str, sentences: int = 3, style: str = "neutral") -> str:
+        return await self._route("summarize", text, sentences, style)
+
+    async def generate_title(self, content: str, style: str = "news") -> str:
+        return await self._route("generate_title", content, style)
+
+    async def generate_outline(self, topic: str, sections: int = 5) -> List[str]:
+        return await self._route("generate_outline", topic, sections)
+
+    async def rewrite(self, text: str, style: str = "professional") -> str:
+        return await self._route("rewrite", text, style)
+
+    # 통합 분석 / 일괄 평가
+    async def analyze_post(
+        self,
+        text: str,
+        criteria: Optional[Dict[str, Any]] = None,
+        categories: Optional[List[str]] = None,
+        sentences: int = 3
+    ) -> Dict[str, Any]:
+        return await self._route("analyze_post", text, criteria, categories, sentences)
+
+    async def evaluate_batch(
+        self,
+        posts: List[Dict[str, Any]],
+        criteria: Optional[Dict[str, Any]] = None,
+        categories: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        return await self._route("evaluate_batch", posts, criteria, categories)
@@ -0,0 +1,394 @@
+"""LLM 요청 스케줄러 - RPM/TPM 예산과 동시성 한도 안에서 요청을 동시에 실행합니다.
+
+요청마다 토큰 수를 미리 추정하여 분당 요청 수(RPM)와 분당 토큰 수(TPM) 토큰 버킷에서
+차감한 뒤 실행합니다. 제공자가 429를 반환하면 Retry-After 동안 모든 요청을 멈추고
+요청 속도를 절반으로 낮춘 뒤, 성공이 이어지면 서서히 원래 속도로 되돌립니다.
+
+요청은 우선순위 등급(interactive, daily, backfill)별 대기열에 들어가고, 디스패처가
+등급 가중치로 가중 공정 큐잉(start-time fair queueing)하여 동시성 슬롯과 예산을 배정합니다.
+관리자 화면 같은 대화형 요청은 대량 평가 중에도 다음 슬롯을 받고, backfill은 다른 등급이
+대기 중이면 배정되지 않습니다. 등급은 ``request_priority()``로 지정합니다 (기본 daily).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, Optional, TypeVar
+
+from app.infrastructure.config.llm_config import LLMConfig, llm_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 429 이후 속도 조절 범위와 회복 폭
+_MIN_RATE_FACTOR = 0.1
+_RECOVERY_STEP = 0.05
+
+# 요청 우선순위 등급
+PRIORITY_INTERACTIVE = "interactive"   # 관리자 테스트 등 사람이 기다리는 요청
+PRIORITY_DAILY = "daily"               # 일일 파이프라인 평가 (기본값)
+PRIORITY_BACKFILL = "backfill"         # 재평가/백필 작업 (다른 등급이 대기 중이면 양보)
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_DAILY, PRIORITY_BACKFILL)
+PREEMPTIBLE_PRIORITIES = frozenset({PRIORITY_BACKFILL})
+
+_current_priority: contextvars.ContextVar[str] = contextvars.ContextVar("llm_priority", default=PRIORITY_DAILY)
+
+
+@contextmanager
+def request_priority(priority: str) -> Iterator[None]:
+    """이 블록(과 그 안에서 만든 하위 작업)의 LLM 요청 우선순위 등급을 지정합니다.
+
+    Example:
+        with request_priority(PRIORITY_INTERACTIVE):
+            await llm_service.is_relevant(text)
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown LLM request priority: {priority}")
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> str:
+    """현재 작업의 LLM 요청 우선순위 등급을 반환합니다."""
+    return _current_priority.get()
+
+
+def parse_priority_weights(spec: str) -> Dict[str, float]:
+    """"등급=가중치,..." 형식의 가중치 설정을 파싱합니다."""
+    weights = {}
+    for item in filter(None, (part.strip() for part in (spec or "").split(","))):
+        name, _, value = item.partition("=")
+        if name.strip() not in PRIORITIES:
+            raise ValueError(f"Unknown LLM request priority: {name.strip()}")
+        weights[name.strip()] = float(value)
+    return weights
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """제공자의 429(요청 한도 초과) 오류인지 확인합니다."""
+    return getattr(error, "status_code", None) == 429 or "RateLimit" in type(error).__name__
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """오류 응답의 Retry-After 헤더 값을 초 단위로 반환합니다 (없으면 None)."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """분당 한도를 초 단위로 채우는 토큰 버킷."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.rate_factor = 1.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate * self.rate_factor)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount를 꺼내려면 기다려야 하는 시간(초)을 반환합니다."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self._tokens >= amount:
+            return 0.0
+        return (amount - self._tokens) / (self.rate * self.rate_factor)
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float) -> None:
+        """추정치와 실제 사용량의 차이를 돌려주거나(양수) 더 차감합니다(음수)."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + amount)
+
+
+@dataclass
+class SchedulerStats:
+    """스케줄러 통계."""
+    requests: int = 0            # 완료된 요청 수
+    rate_limited: int = 0        # 429 응답 수
+    retries: int = 0             # 재시도 수
+    estimated_tokens: int = 0    # 디스패치 전에 추정한 토큰 합계
+    actual_tokens: int = 0       # 응답으로 확인한 실제 토큰 합계
+    waited_seconds: float = 0.0  # 예산을 기다린 시간 합계
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "estimated_tokens": self.estimated_tokens,
+            "actual_tokens": self.actual_tokens,
+            "waited_seconds": round(self.waited_seconds, 3),
+        }
+
+
+@dataclass
+class PriorityStats:
+    """우선순위 등급별 배정 통계."""
+    dispatched: int = 0             # 슬롯과 예산을 배정받은 요청 수 (재시도 포함)
+    waited_seconds: float = 0.0     # 대기열에서 기다린 시간 합계
+    max_wait_seconds: float = 0.0   # 가장 오래 기다린 시간
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "dispatched": self.dispatched,
+            "avg_wait_seconds": round(self.waited_seconds / self.dispatched, 3) if self.dispatched else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+
+
+@dataclass
+class _Waiter:
+    """대기열의 요청 하나."""
+    priority: str
+    tag: float                  # 가중 공정 큐잉 완료 태그 (작을수록 먼저)
+    estimated_tokens: int
+    future: asyncio.Future
+    queued_at: float
+
+
+class LLMScheduler:
+    """RPM/TPM 토큰 버킷, 동시성 한도, 우선순위 등급별 가중 공정 큐잉으로 LLM 요청을 조절하는 스케줄러."""
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        priority_weights: Optional[Dict[str, float]] = None,
+        reserved_slots: int = 1,
+    ):
+        """
+        Args:
+            priority_weights: 등급별 가중치 (모든 등급이 밀려 있을 때 배정 비율)
+            reserved_slots: interactive 요청만 쓸 수 있도록 남겨 두는 동시성 슬롯 수
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.priority_weights = dict({PRIORITY_INTERACTIVE: 8.0, PRIORITY_DAILY: 1.0, PRIORITY_BACKFILL: 1.0}, **(priority_weights or {}))
+        self.reserved_slots = reserved_slots
+        self.stats = SchedulerStats()
+        self.priority_stats: Dict[str, PriorityStats] = {priority: PriorityStats() for priority in PRIORITIES}
+        self._paused_until = 0.0
+        self._queues: Dict[str, Deque[_Waiter]] = {priority: deque() for priority in PRIORITIES}
+        self._finish_tags: Dict[str, float] = {priority: 0.0 for priority in PRIORITIES}
+        self._virtual_time = 0.0
+        self._in_flight = 0
+        # 이벤트 루프에 묶이는 객체는 첫 요청에서 생성
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_config(cls, config: Optional[LLMConfig] = None) -> "LLMScheduler":
+        """LLMConfig의 RATE_LIMIT_* / MAX_RETRIES / RETRY_DELAY / 우선순위 설정으로 스케줄러를 만듭니다."""
+        config = config or llm_config
+        return cls(
+            requests_per_minute=config.RATE_LIMIT_RPM,
+            tokens_per_minute=config.RATE_LIMIT_TPM,
+            max_concurrency=config.MAX_CONCURRENT_REQUESTS,
+            max_retries=config.MAX_RETRIES,
+            retry_delay=config.RETRY_DELAY,
+            priority_weights=parse_priority_weights(config.LLM_PRIORITY_WEIGHTS),
+            reserved_slots=config.INTERACTIVE_RESERVED_SLOTS,
+        )
+
+    @property
+    def rate_factor(self) -> float:
+        """현재 속도 비율 (429 이후 1.0보다 작아짐)."""
+        return self.requests.rate_factor
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        estimated_tokens: int,
+        actual_tokens: Optional[Callable[[T], Optional[int]]] = None,
+    ) -> T:
+        """예산이 허락할 때 call을 실행합니다. 429 응답은 속도를 낮춰 재시도합니다.
+
+        요청 우선순위 등급은 현재 작업의 ``request_priority()`` 값을 사용합니다.
+
+        Args:
+            call: 제공자 API를 호출하는 코루틴 함수
+            estimated_tokens: 요청의 예상 토큰 수 (입력 + 최대 출력)
+            actual_tokens: 응답에서 실제 사용 토큰 수를 꺼내는 함수 (예산 보정용)
+        """
+        priority = current_priority()
+        attempt = 0
+        while True:
+            await self._acquire(priority, estimated_tokens)
+            try:
+                response = await call()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                self._on_rate_limited(e, attempt)
+            else:
+                self._on_success(estimated_tokens, response, actual_tokens)
+                return response
+            finally:
+                self._release()
+            attempt += 1
+            self.stats.retries += 1
+
+    def scheduler_stats(self) -> Dict[str, Any]:
+        """스케줄러 통계와 등급별 대기 요청 수, 가중치, 배정 대기 시간을 반환합니다."""
+        return dict(
+            self.stats.as_dict(),
+            rate_factor=round(self.rate_factor, 3),
+            in_flight=self._in_flight,
+            priorities={
+                priority: dict(
+                    self.priority_stats[priority].as_dict(),
+                    queued=sum(1 for waiter in self._queues[priority] if not waiter.future.done()),
+                    weight=self.priority_weights[priority],
+                )
+                for priority in PRIORITIES
+            },
+        )
+
+    async def _acquire(self, priority: str, estimated_tokens: int) -> None:
+        """등급 대기열에서 차례가 오면 동시성 슬롯 1개와 요청 1개, estimated_tokens만큼의 예산을 배정받습니다."""
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+
+        # start-time fair queueing: 등급의 이전 태그 이후, 가중치에 반비례하는 간격으로 태그 부여
+        start = max(self._virtual_time, self._finish_tags[priority])
+        self._finish_tags[priority] = start + 1.0 / self.priority_weights[priority]
+        waiter = _Waiter(
+            priority=priority,
+            tag=self._finish_tags[priority],
+            estimated_tokens=estimated_tokens,
+            future=asyncio.get_running_loop().create_future(),
+            queued_at=time.monotonic(),
+        )
+        self._queues[priority].append(waiter)
+        self._wake()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 배정 직후 취소됨 - 슬롯 반환
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wakeup.set()
+
+    def _wake(self) -> None:
+        """디스패처를 깨우고, 실행 중이 아니면 시작합니다."""
+        self._wakeup.set()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch_loop())
+
+    def _slot_limit(self, priority: str) -> int:
+        """등급이 쓸 수 있는 동시성 슬롯 수 (interactive 외 등급은 예약 슬롯 제외)."""
+        if priority == PRIORITY_INTERACTIVE:
+            return self.max_concurrency
+        return max(1, self.max_concurrency - self.reserved_slots)
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        """슬롯을 쓸 수 있는 등급 중 태그가 가장 작은 대기 요청 (backfill은 다른 등급이 대기 중이면 제외)."""
+        for queue in self._queues.values():
+            while queue and queue[0].future.done():
+                queue.popleft()  # 대기 중 취소된 요청
+
+        urgent = any(self._queues[priority] for priority in PRIORITIES if priority not in PREEMPTIBLE_PRIORITIES)
+        candidates = [
+            queue[0] for priority, queue in self._queues.items()
+            if queue
+            and self._in_flight < self._slot_limit(priority)
+            and not (urgent and priority in PREEMPTIBLE_PRIORITIES)
+        ]
+        return min(candidates, key=lambda waiter: waiter.tag) if candidates else None
+
+    async def _dispatch_loop(self) -> None:
+        """대기열이 빌 때까지 차례대로 슬롯과 예산을 배정합니다."""
+        while True:
+            self._wakeup.clear()
+            waiter = self._next_waiter()
+            if waiter is None:
+                if not any(self._queues.values()):
+                    return
+                await self._wakeup.wait()  # 슬롯 반환 대기
+                continue
+
+            wait = max(
+                self._paused_until - time.monotonic(),
+                self.requests.wait_time(1),
+                self.tokens.wait_time(waiter.estimated_tokens),
+            )
+            if wait > 0:
+                # 예산 대기 중 더 급한 요청이 들어오면 다시 선택
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            self._queues[waiter.priority].popleft()
+            self.requests.take(1)
+            self.tokens.take(waiter.estimated_tokens)
+            self._in_flight += 1
+            self._virtual_time = waiter.tag
+
+            waited = time.monotonic() - waiter.queued_at
+            self.stats.estimated_tokens += waiter.estimated_tokens
+            self.stats.waited_seconds += waited
+            stats = self.priority_stats[waiter.priority]
+            stats.dispatched += 1
+            stats.waited_seconds += waited
+            stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+            waiter.future.set_result(None)
+
+    def _on_rate_limited(self, error: BaseException, attempt: int) -> None:
+        """429 응답 - 모든 요청을 잠시 멈추고 속도를 절반으로 낮춥니다."""
+        self.stats.rate_limited += 1
+        delay = retry_after_seconds(error)
+        if delay is None:
+            delay = self.retry_delay * (2 ** attempt) * (1 + random.random() * 0.25)
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+        factor = max(_MIN_RATE_FACTOR, self.requests.rate_factor / 2)
+        self.requests.rate_factor = self.tokens.rate_factor = factor
+        logger.warning(f"LLM 요청 한도 초과(429) - {delay:.1f}초 대기, 속도 {factor:.0%}로 조정")
+
+    def _on_success(self, estimated_tokens: int, response: Any, actual_tokens: Optional[Callable[[Any], Optional[int]]]) -> None:
+        self.stats.requests += 1
+        if self.requests.rate_factor < 1.0:
+            factor = min(1.0, self.requests.rate_factor + _RECOVERY_STEP)
+            self.requests.rate_factor = self.tokens.rate_factor = factor
+
+        used = actual_tokens(response) if actual_tokens else None
+        if used is not None:
+            self.stats.actual_tokens += used
+            self.tokens.refund(estimated_tokens - used)
@@ -0,0 +1,105 @@
+"""유사 중복 제거 - 해시 문자 트라이그램 벡터의 코사인 유사도로 중복 항목을 찾습니다.
+
+LLM 호출 없이 ``IContentAnalyzer.deduplicate(items, threshold)``를 구현합니다.
+항목 수가 많아도 유사도 행렬 전체를 만들지 않고 블록 단위로 계산하므로
+메모리 사용량은 ``block_size × block_size``와 임베딩 행렬 크기로 제한됩니다.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+import zlib
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NGRAM = 3
+DEFAULT_FEATURES = 1 << 12
+DEFAULT_BLOCK_SIZE = 1024
+# float32 내적 오차로 동일 문장의 유사도가 1.0보다 약간 작게 나오는 경우 보정
+_EPSILON = 1e-5
+
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화, 소문자 변환, 공백 정리."""
+    return " ".join(unicodedata.normalize("NFKC", text or "").lower().split())
+
+
+def embed_trigrams(items: Sequence[str], n_features: int = DEFAULT_FEATURES) -> "np.ndarray":
+    """항목들을 L2 정규화된 해시 문자 트라이그램 벡터(항목 수 × n_features, float32)로 바꿉니다.
+
+    트라이그램보다 짧은 항목은 문자열 전체를 하나의 특성으로 사용합니다.
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for similarity deduplication")
+
+    vectors = np.zeros((len(items), n_features), dtype=np.float32)
+    for row, item in enumerate(items):
+        text = normalize_text(item)
+        grams = [text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)] or ([text] if text else [])
+        if not grams:
+            continue
+        indices = np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) % n_features for gram in grams),
+            dtype=np.int64,
+            count=len(grams)
+        )
+        np.add.at(vectors[row], indices, 1.0)
+        vectors[row] /= np.linalg.norm(vectors[row])
+    return vectors
+
+
+def deduplicate_indices(
+    items: Sequence[str],
+    threshold: float = 0.8,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    n_features: int = DEFAULT_FEATURES
+) -> List[int]:
+    """앞에서부터 남긴 항목과 코사인 유사도가 threshold 이상인 항목을 제거하고, 남길 인덱스를 반환합니다.
+
+    Args:
+        items: 비교할 텍스트들 (순서가 우선순위 - 먼저 나온 항목을 남김)
+        threshold: 중복으로 볼 최소 코사인 유사도 (0.0 ~ 1.0)
+        block_size: 한 번에 계산할 유사도 블록의 행/열 수
+        n_features: 트라이그램 해시 공간 크기
+    """
+    if not items:
+        return []
+    if np is None:
+        # NumPy가 없으면 정규화된 문자열이 같은 항목만 제거
+        seen = set()
+        keep = []
+        for index, item in enumerate(items):
+            key = normalize_text(item)
+            if key not in seen:
+                seen.add(key)
+                keep.append(index)
+        return keep
+
+    vectors = embed_trigrams(items, n_features)
+    cutoff = threshold - _EPSILON
+    kept = np.zeros(len(items), dtype=bool)
+
+    for start in range(0, len(items), block_size):
+        end = min(start + block_size, len(items))
+        block = vectors[start:end]
+        duplicate = np.zeros(end - start, dtype=bool)
+
+        # 이전 블록들에서 남긴 항목과 비교
+        for other in range(0, start, block_size):
+            columns = np.flatnonzero(kept[other:other + block_size]) + other
+            if len(columns):
+                duplicate |= (block @ vectors[columns].T >= cutoff).any(axis=1)
+
+        # 블록 안에서는 앞에서부터 남긴 항목이 뒤의 유사 항목을 제거
+        similarities = block @ block.T
+        later = np.arange(end - start)
+        for row in range(end - start):
+            if not duplicate[row]:
+                duplicate |= (similarities[row] >= cutoff) & (later > row)
+        kept[start:end] = ~duplicate
+
+    return np.flatnonzero(kept).tolist()
@@ -0,0 +1,267 @@
+"""부하 테스트용 LLM 시뮬레이터 - 실제 API 없이 지연, 오류, 요청 한도를 재현합니다.
+
+MockLLM은 즉시 응답하므로 동시성 버그나 처리량 한계를 드러내지 못합니다. SimulatedLLM은
+작업(프롬프트 템플릿)별 지연 분포에서 응답 시간을 뽑고, 설정한 비율로 429/5xx 오류를 내며,
+시뮬레이션 서버 측 RPM/TPM 한도를 넘는 요청은 Retry-After와 함께 429로 거절합니다.
+호출은 실제 제공자와 같이 ``_dispatch``를 거치므로 스케줄러의 예산/재시도/우선순위와
+호출 계측이 그대로 적용되고, 응답은 템플릿별 실제 형식(YES/NO, 라벨, JSON 배열 등)으로
+만들어 배치 분할, 구조화 출력 검증 같은 파싱 경로도 실행됩니다.
+
+지연과 오류는 (시드, 템플릿, 프롬프트, 같은 프롬프트의 호출 순번)으로 만든 난수로 뽑으므로
+동시 실행 순서와 관계없이 같은 요청은 같은 결과를 냅니다 (RPM/TPM 거절은 실제 시간에 따름).
+
+설정 (LLM_PROVIDERS=simulated):
+    SIMULATED_LATENCY="default=lognormal:800:0.5,relevance=lognormal:400:0.4"
+    SIMULATED_RATE_LIMIT_ERROR_RATE=0.01 SIMULATED_SERVER_ERROR_RATE=0.005
+    SIMULATED_RPM=500 SIMULATED_TPM=200000 SIMULATED_SEED=42
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.infrastructure.config.llm_config import llm_config
+from .base import BaseLLMService
+from .mock import MockLLM
+from .scheduler import TokenBucket
+
+# 5xx 오류로 낼 상태 코드 (529: 과부하)
+SERVER_ERROR_STATUSES = (500, 502, 503, 529)
+
+_TEXT_PATTERN = re.compile(r"텍스트:\s*(.*?)(?:\n\s*\n|\Z)", re.DOTALL)
+_LABEL_PATTERN = re.compile(r"^\s*([A-Z]): (.+?)\s*$", re.MULTILINE)
+_BATCH_POST_PATTERN = re.compile(r"\[(\d+)\] 제목: ")
+
+
+@dataclass
+class LatencyDistribution:
+    """응답 지연 분포 (ms).
+
+    kind별 매개변수:
+        fixed: a=지연
+        uniform: a=최소, b=최대
+        normal: a=평균, b=표준편차
+        lognormal: a=중앙값, b=로그 표준편차 (긴 꼬리)
+    """
+    kind: str
+    a: float
+    b: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            value = self.a
+        elif self.kind == "uniform":
+            value = rng.uniform(self.a, self.b)
+        elif self.kind == "normal":
+            value = rng.gauss(self.a, self.b)
+        elif self.kind == "lognormal":
+            value = rng.lognormvariate(math.log(max(self.a, 1e-3)), self.b)
+        else:
+            raise ValueError(f"Unknown latency distribution: {self.kind}")
+        return max(value, 0.0)
+
+
+def parse_latency_spec(spec: str) -> Dict[str, LatencyDistribution]:
+    """"템플릿=분포:a:b,..." 형식의 지연 설정을 파싱합니다 (default는 나머지 템플릿에 사용)."""
+    distributions = {}
+    for item in filter(None, (part.strip() for part in (spec or "").split(","))):
+        template, _, value = item.partition("=")
+        kind, *params = value.strip().split(":")
+        numbers = [float(param) for param in params] or [0.0]
+        distributions[template.strip()] = LatencyDistribution(kind.strip().lower(), *numbers[:2])
+    return distributions
+
+
+class SimulatedAPIError(Exception):
+    """시뮬레이션한 제공자 API 오류 (status_code와 Retry-After 헤더를 가진 응답 포함)."""
+
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(f"{status_code} {message}")
+        self.status_code = status_code
+        headers = {"retry-after": f"{retry_after:.3f}"} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=status_code, headers=headers)
+
+
+@dataclass
+class SimulatedResponse:
+    """시뮬레이션 응답."""
+    text: str
+    input_tokens: int
+    output_tokens: int
+
+
+@dataclass
+class SimulationStats:
+    """시뮬레이터 통계."""
+    requests: int = 0            # 성공한 요청 수
+    input_tokens: int = 0
+    output_tokens: int = 0
+    injected_rate_limits: int = 0  # rate_limit_error_rate로 낸 429
+    limit_rejections: int = 0      # 시뮬레이션 RPM/TPM 한도 초과로 낸 429
+    server_errors: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+
+class SimulatedLLM(BaseLLMService):
+    """지연 분포, 429/5xx 오류, RPM/TPM 한도를 시뮬레이션하는 부하 테스트용 LLM."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__("simulated", config)
+        # 가격이 있는 모델 이름으로 설정하면 계측의 비용 추정에 반영됨
+        self.model = self.config.get("model", llm_config.SIMULATED_MODEL)
+        self.seed = self.config.get("seed", llm_config.SIMULATED_SEED)
+        self.latency = parse_latency_spec(self.config.get("latency", llm_config.SIMULATED_LATENCY))
+        self.rate_limit_error_rate = self.config.get("rate_limit_error_rate", llm_config.SIMULATED_RATE_LIMIT_ERROR_RATE)
+        self.server_error_rate = self.config.get("server_error_rate", llm_config.SIMULATED_SERVER_ERROR_RATE)
+        self.retry_after = self.config.get("retry_after", llm_config.SIMULATED_RETRY_AFTER_SECONDS)
+
+        # 시뮬레이션 서버 측 한도 (0이면 제한 없음)
+        rpm = self.config.get("rpm", llm_config.SIMULATED_RPM)
+        tpm = self.config.get("tpm", llm_config.SIMULATED_TPM)
+        self.request_limit = TokenBucket(rpm) if rpm else None
+        self.token_limit = TokenBucket(tpm) if tpm else None
+
+        self.stats = SimulationStats()
+        # 응답 내용은 키워드 매칭으로 결정
+        self._oracle = MockLLM()
+        self._calls: Dict[str, int] = {}
+
+    # ILLMProvider 구현
+    async def generate_text(self, prompt: str, **kwargs) -> str:
+        """템플릿별 지연/오류를 시뮬레이션하고 템플릿 형식의 응답을 생성합니다."""
+        max_tokens = kwargs.pop("max_tokens", self.config.get("max_tokens", 1000))
+        system = kwargs.pop("system", None)
+        template = kwargs.pop("template", "generate_text")
+        full_prompt = f"{system}\n{prompt}" if system else prompt
+
+        response = await self._dispatch(
+            lambda: self._complete(template, prompt, full_prompt, max_tokens),
+            full_prompt,
+            max_tokens,
+            usage=lambda response: response.input_tokens + response.output_tokens,
+            template=template
+        )
+        return response.text
+
+    def _token_usage(self, response: SimulatedResponse) -> Optional[Tuple[int, int, int]]:
+        return response.input_tokens, response.output_tokens, 0
+
+    async def _complete(self, template: str, prompt: str, full_prompt: str, max_tokens: int) -> SimulatedResponse:
+        """요청 하나를 시뮬레이션합니다 (한도 초과/429는 즉시, 5xx는 지연 후 실패)."""
+        rng = self._rng(template, full_prompt)
+        input_tokens = self._estimate_tokens(full_prompt)
+        self._check_limits(input_tokens + max_tokens)
+
+        roll = rng.random()
+        if roll < self.rate_limit_error_rate:
+            self.stats.injected_rate_limits += 1
+            raise SimulatedAPIError(429, "Too Many Requests (simulated)", self.retry_after)
+
+        await asyncio.sleep(self._latency(template).sample(rng) / 1000)
+        if roll < self.rate_limit_error_rate + self.server_error_rate:
+            self.stats.server_errors += 1
+            raise SimulatedAPIError(rng.choice(SERVER_ERROR_STATUSES), "Server Error (simulated)")
+
+        text = await self._respond(template, prompt)
+        output_tokens = min(self._estimate_tokens(text), max_tokens)
+        self.stats.requests += 1
+        self.stats.input_tokens += input_tokens
+        self.stats.output_tokens += output_tokens
+        return SimulatedResponse(text, input_tokens, output_tokens)
+
+    def _rng(self, template: str, full_prompt: str) -> random.Random:
+        """(시드, 템플릿, 프롬프트, 같은 프롬프트의 호출 순번)으로 만든 난수 생성기 - 재시도는 다른 값을 뽑음."""
+        digest = hashlib.sha1(f"{template}\x00{full_prompt}".encode("utf-8")).hexdigest()
+        attempt = self._calls.get(digest, 0)
+        self._calls[digest] = attempt + 1
+        return random.Random(f"{self.seed}:{digest}:{attempt}")
+
+    def _latency(self, template: str) -> LatencyDistribution:
+        return self.latency.get(template) or self.latency.get("default") or LatencyDistribution("fixed", 0.0)
+
+    def _check_limits(self, tokens: int) -> None:
+        """시뮬레이션 RPM/TPM 한도를 넘으면 필요한 대기 시간을 Retry-After로 담아 429를 냅니다."""
+        waits = [
+            bucket.wait_time(amount)
+            for bucket, amount in ((self.request_limit, 1), (self.token_limit, tokens))
+            if bucket is not None
+        ]
+        if any(waits):
+            self.stats.limit_rejections += 1
+            raise SimulatedAPIError(429, "Rate limit exceeded (simulated)", max(waits))
+        if self.request_limit is not None:
+            self.request_limit.take(1)
+        if self.token_limit is not None:
+            self.token_limit.take(tokens)
+
+    async def _respond(self, template: str, prompt: str) -> str:
+        """템플릿이 기대하는 형식의 응답을 만듭니다."""
+        text = self._prompt_text(prompt)
+        if template == "relevance":
+            return "YES" if await self._oracle.is_relevant(text) else "NO"
+        if template == "classify":
+            category = await self._oracle.classify_category(text)
+            labels = {name: label for label, name in _LABEL_PATTERN.findall(prompt)}
+            return labels.get(category, labels.get("OTHER", category)) if labels else category
+        if template == "batch_evaluation":
+            return json.dumps(await self._batch_verdicts(prompt), ensure_ascii=False)
+        if template == "analysis":
+            analysis = await self._oracle.analyze_post(text, sentences=1)
+            return json.dumps({
+                "relevant": analysis["is_relevant"],
+                "score": analysis["relevance_score"],
+                "category": analysis["category"],
+                "summary": analysis["summary"],
+            }, ensure_ascii=False)
+        if template == "sentiment":
+            return json.dumps(await self._oracle.analyze_sentiment(text), ensure_ascii=False)
+        if template == "keywords":
+            return ", ".join(await self._oracle.extract_keywords(text))
+        return await self._oracle.summarize(text)
+
+    async def _batch_verdicts(self, prompt: str) -> List[Dict[str, Any]]:
+        """배치 평가 프롬프트의 번호별 게시글(제목 + 첫 문단)을 평가합니다."""
+        parts = _BATCH_POST_PATTERN.split(prompt)
+        verdicts = []
+        for number, segment in zip(parts[1::2], parts[2::2]):
+            text = re.split(r"\n\s*\n", segment, maxsplit=1)[0]
+            is_relevant = await self._oracle.is_relevant(text)
+            verdicts.append({
+                "n": int(number),
+                "relevant": is_relevant,
+                "score": 0.8 if is_relevant else 0.2,
+                "category": await self._oracle.classify_category(text),
+            })
+        return verdicts
+
+    def _prompt_text(self, prompt: str) -> str:
+        """프롬프트의 "텍스트:" 부분 (없으면 프롬프트 전체)."""
+        match = _TEXT_PATTERN.search(prompt)
+        return match.group(1).strip() if match else prompt.strip()
+
+    def simulation_stats(self) -> Dict[str, Any]:
+        """시뮬레이터 통계 (성공 요청, 토큰, 주입한 오류 수)를 반환합니다."""
+        return self.stats.as_dict()
+
+    # IContentAnalyzer 구현
+    async def is_relevant(self, text: str, criteria: Optional[Dict[str, Any]] = None) -> bool:
+        """관련성 프롬프트를 시뮬레이션합니다."""
+        system, prompt = self._relevance_prompt(text, criteria or self._get_default_criteria())
+        response = await self.generate_text(prompt, system=system, template="relevance")
+        return "YES" in response.upper()
+
+    async def summarize(self, text: str, sentences: int = 3, style: str = "neutral") -> str:
+        """요약 프롬프트를 시뮬레이션합니다 (긴 본문은 맵리듀스 경로)."""
+        if self._estimate_tokens(text) > self.summary_chunk_tokens:
+            return await self._summarize_chunks(text, sentences, style)
+        return await self._summarize_prompt(text, sentences, style)
@@ -0,0 +1,89 @@
+"""구조화된 LLM 출력 - 응답에서 JSON을 추출하고 JSON Schema(부분집합)로 검증합니다."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, List
+
+_CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+_TYPE_CHECKS = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+class StructuredOutputError(ValueError):
+    """LLM 응답이 JSON이 아니거나 스키마를 만족하지 않을 때 발생합니다."""
+
+
+def extract_json(text: str) -> Any:
+    """LLM 응답 텍스트에서 첫 번째 JSON 객체/배열을 추출합니다 (코드 펜스 허용)."""
+    text = text or ""
+    fenced = _CODE_FENCE_PATTERN.search(text)
+    if fenced:
+        text = fenced.group(1)
+
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        raise StructuredOutputError("응답에 JSON이 없습니다")
+
+    try:
+        value, _ = json.JSONDecoder().raw_decode(text[min(starts):])
+    except json.JSONDecodeError as e:
+        raise StructuredOutputError(f"JSON 파싱 실패: {e}") from None
+    return value
+
+
+def validate(instance: Any, schema: Dict[str, Any], path: str = "$") -> List[str]:
+    """JSON Schema의 부분집합(type, properties, required, enum, minimum, maximum,
+    minLength, maxLength, items, additionalProperties)으로 값을 검증합니다.
+
+    Returns:
+        오류 메시지 목록 (비어 있으면 유효)
+    """
+    errors: List[str] = []
+
+    expected = schema.get("type")
+    if expected:
+        types = expected if isinstance(expected, list) else [expected]
+        if not any(_TYPE_CHECKS[t](instance) for t in types):
+            return [f"{path}: {'/'.join(types)} 타입이어야 합니다"]
+
+    if "enum" in schema and instance not in schema["enum"]:
+        errors.append(f"{path}: {schema['enum']} 중 하나여야 합니다")
+
+    if _TYPE_CHECKS["number"](instance):
+        if "minimum" in schema and instance < schema["minimum"]:
+            errors.append(f"{path}: {schema['minimum']} 이상이어야 합니다")
+        if "maximum" in schema and instance > schema["maximum"]:
+            errors.append(f"{path}: {schema['maximum']} 이하여야 합니다")
+
+    if isinstance(instance, str):
+        if "minLength" in schema and len(instance) < schema["minLength"]:
+            errors.append(f"{path}: 길이가 {schema['minLength']} 이상이어야 합니다")
+        if "maxLength" in schema and len(instance) > schema["maxLength"]:
+            errors.append(f"{path}: 길이가 {schema['maxLength']} 이하여야 합니다")
+
+    if isinstance(instance, dict):
+        properties = schema.get("properties", {})
+        for name in schema.get("required", []):
+            if name not in instance:
+                errors.append(f"{path}.{name}: 필수 항목입니다")
+        for name, value in instance.items():
+            if name in properties:
+                errors.extend(validate(value, properties[name], f"{path}.{name}"))
+            elif schema.get("additionalProperties") is False:
+                errors.append(f"{path}.{name}: 허용되지 않은 항목입니다")
+
+    if isinstance(instance, list) and "items" in schema:
+        for i, item in enumerate(instance):
+            errors.extend(validate(item, schema["items"], f"{path}[{i}]"))
+
+    return errors
@@ -0,0 +1,144 @@
+"""맵리듀스 요약 - 긴 문서를 조각별로 동시에 요약(맵)한 뒤 조각 요약들을 합칩니다(리듀스).
+
+한 번의 호출 지연이 문서 길이가 아니라 조각 크기에 비례하고, 조각 요약은 조각 해시로
+캐시되므로 문서의 한 부분만 바뀌면 그 조각만 다시 요약합니다. 조각 요약을 합친 텍스트가
+여전히 조각 한도보다 길면 한 번 더 나누어 합치는 계층적 리듀스를 수행합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from app.infrastructure.config.llm_config import llm_config
+from .cache import _MISSING, LRUCache, MongoLLMCacheStore, normalize_cache_text
+from .tokens import chunk_text, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# 리듀스 단계 최대 깊이 (조각 요약이 줄어들지 않는 경우 대비)
+_MAX_REDUCE_DEPTH = 3
+
+
+class MapReduceSummarizer:
+    """긴 문서용 맵리듀스 요약기."""
+
+    def __init__(
+        self,
+        llm,
+        chunk_tokens: Optional[int] = None,
+        map_sentences: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        store: Optional[MongoLLMCacheStore] = None,
+        template_version: Optional[str] = None,
+    ):
+        """요약기를 만듭니다.
+
+        Args:
+            llm: generate_text를 제공하는 LLM 서비스
+            chunk_tokens: 조각 하나의 최대 토큰 수 (기본: SUMMARY_CHUNK_TOKENS)
+            map_sentences: 조각 요약 문장 수 (기본: SUMMARY_MAP_SENTENCES)
+            max_entries: 조각 요약 메모리 캐시 최대 항목 수
+            store: 조각 요약 MongoDB 캐시 저장소 (None이면 메모리 캐시만 사용)
+        """
+        self.llm = llm
+        self.chunk_tokens = chunk_tokens or llm_config.SUMMARY_CHUNK_TOKENS
+        self.map_sentences = map_sentences or llm_config.SUMMARY_MAP_SENTENCES
+        self.memory = LRUCache(max_entries or llm_config.CACHE_MAX_ENTRIES)
+        self.store = store
+        self.template_version = template_version or llm_config.PROMPT_TEMPLATE_VERSION
+        self.stats = {"chunks": 0, "cached_chunks": 0, "reduce_calls": 0}
+
+    async def summarize(self, text: str, sentences: int = 3, style: str = "neutral") -> str:
+        """문서를 조각별로 동시에 요약하고 합쳐서 sentences문장 요약을 만듭니다."""
+        chunks = chunk_text(text, self.chunk_tokens)
+        if not chunks:
+            return ""
+        if len(chunks) == 1:
+            return await self._reduce(chunks[0], sentences, style, partial=False)
+
+        # 맵: 조각 요약을 동시에 요청 (요청 속도는 LLM 서비스의 스케줄러가 조절)
+        partials = list(await asyncio.gather(*(self._summarize_chunk(chunk, style) for chunk in chunks)))
+
+        # 리듀스: 조각 요약들이 한 조각에 들어갈 때까지 나누어 합침
+        depth = 0
+        while estimate_tokens("\n".join(partials)) > self.chunk_tokens and depth < _MAX_REDUCE_DEPTH:
+            groups = chunk_text("\n\n".join(partials), self.chunk_tokens)
+            partials = list(await asyncio.gather(
+                *(self._reduce(group, self.map_sentences, style, partial=True) for group in groups)
+            ))
+            depth += 1
+        return await self._reduce("\n".join(partials), sentences, style, partial=True)
+
+    def chunk_key(self, chunk: str, style: str) -> str:
+        """조각 요약 캐시 키 (모델, 템플릿 버전, 정규화된 조각, 요약 인자의 해시)."""
+        payload = json.dumps(
+            [getattr(self.llm, "name", None), getattr(self.llm, "model", None), self.template_version,
+             "summarize_chunk", normalize_cache_text(chunk), self.map_sentences, style],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _summarize_chunk(self, chunk: str, style: str) -> str:
+        """조각 하나를 요약합니다 (조각 해시로 캐시)."""
+        self.stats["chunks"] += 1
+        key = self.chunk_key(chunk, style)
+
+        summary = self.memory.get(key)
+        if summary is _MISSING:
+            summary = await self._store_get(key)
+        if summary is not _MISSING:
+            self.stats["cached_chunks"] += 1
+            self.memory.set(key, summary)
+            return summary
+
+        prompt = f"""
+        다음은 긴 문서의 일부입니다. 이 부분의 핵심 내용을 {self.map_sentences}문장 이내로 요약해주세요.
+        수치, 날짜, 기관명, 사업자명은 그대로 남겨주세요.
+        스타일: {style}
+
+        텍스트: {chunk}
+        """
+        summary = (await self.llm.generate_text(prompt, template="summary_map")).strip()
+        self.memory.set(key, summary)
+        await self._store_set(key, summary)
+        return summary
+
+    async def _reduce(self, text: str, sentences: int, style: str, partial: bool) -> str:
+        """텍스트(또는 조각 요약 모음)를 sentences문장으로 요약합니다."""
+        self.stats["reduce_calls"] += 1
+        source = "문서 각 부분의 요약들입니다. 전체 내용을 종합하여" if partial else "텍스트를"
+        prompt = f"""
+        다음 {source} {sentences}문장으로 요약해주세요.
+        스타일: {style}
+
+        텍스트: {text}
+        """
+        return (await self.llm.generate_text(prompt, template="summary_reduce")).strip()
+
+    async def _store_get(self, key: str) -> Any:
+        if self.store is None:
+            return _MISSING
+        try:
+            return await self.store.get(key)
+        except Exception as e:
+            logger.debug(f"조각 요약 캐시 조회 실패: {e}")
+            return _MISSING
+
+    async def _store_set(self, key: str, summary: str) -> None:
+        if self.store is None:
+            return
+        try:
+            await self.store.set(
+                key, summary, getattr(self.llm, "name", ""), getattr(self.llm, "model", None),
+                "summarize_chunk", llm_config.CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.debug(f"조각 요약 캐시 저장 실패: {e}")
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """조각 요약 캐시 통계를 반환합니다."""
+        return dict(self.stats, memory_entries=len(self.memory))
@@ -0,0 +1,157 @@
+"""토큰 추정과 입력 자르기/나누기 - 긴 본문을 작업별 토큰 한도에 맞춰 프롬프트에 넣습니다.
+
+기본 추정은 한글 1자 ≈ 1토큰, 그 외 4자 ≈ 1토큰의 문자 기반 휴리스틱이며,
+tiktoken이 설치되어 있고 ``TOKENIZER_ENCODING``이 설정되면 정확한 토크나이저를 사용합니다.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import Iterable, List, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+from app.infrastructure.config.llm_config import llm_config
+
+# 자른 구간 사이에 넣는 생략 표시
+ELLIPSIS = "\n…\n"
+
+_PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?。])\s+|\n")
+
+
+def _is_hangul(char: str) -> bool:
+    return "가" <= char <= "힣"
+
+
+@functools.lru_cache(maxsize=4)
+def _get_encoding(name: str):
+    return tiktoken.get_encoding(name)
+
+
+def _encoding(encoding: Optional[str]):
+    """사용할 tiktoken 인코딩 (없으면 None - 휴리스틱 사용)."""
+    name = encoding or llm_config.TOKENIZER_ENCODING
+    if not name or tiktoken is None:
+        return None
+    return _get_encoding(name)
+
+
+def estimate_tokens(text: str, encoding: Optional[str] = None) -> int:
+    """텍스트의 토큰 수를 추정합니다 (tiktoken 인코딩이 있으면 정확한 값)."""
+    text = text or ""
+    enc = _encoding(encoding)
+    if enc is not None:
+        return len(enc.encode(text))
+    hangul = sum(1 for char in text if _is_hangul(char))
+    return hangul + (len(text) - hangul) // 4 + 1
+
+
+def truncate_tokens(text: str, max_tokens: int, encoding: Optional[str] = None) -> str:
+    """텍스트 앞부분을 max_tokens 이내로 자릅니다."""
+    text = text or ""
+    if max_tokens <= 0:
+        return ""
+    enc = _encoding(encoding)
+    if enc is not None:
+        ids = enc.encode(text)
+        return text if len(ids) <= max_tokens else enc.decode(ids[:max_tokens])
+
+    # 휴리스틱: 한글 1토큰, 그 외 0.25토큰씩 누적
+    budget = max_tokens - 1
+    used = 0.0
+    for i, char in enumerate(text):
+        used += 1.0 if _is_hangul(char) else 0.25
+        if used > budget:
+            return text[:i]
+    return text
+
+
+def keyword_excerpt(
+    text: str,
+    max_tokens: int,
+    positions: Iterable[int],
+    head_ratio: float = 0.5,
+    window_chars: int = 150,
+    encoding: Optional[str] = None
+) -> str:
+    """앞부분과 키워드 주변 구간만 남겨 max_tokens 이내로 줄입니다.
+
+    Args:
+        text: 원문
+        max_tokens: 최대 토큰 수
+        positions: 키워드 시작 위치들 (문자 단위)
+        head_ratio: 앞부분에 쓸 토큰 비율 (나머지는 키워드 주변 구간)
+        window_chars: 키워드 앞뒤로 남길 글자 수
+    """
+    text = text or ""
+    if estimate_tokens(text, encoding) <= max_tokens:
+        return text
+
+    head = truncate_tokens(text, int(max_tokens * head_ratio), encoding)
+    parts = [head]
+    used = estimate_tokens(head, encoding)
+
+    # 앞부분 이후의 키워드 주변 구간을 겹치지 않게 합쳐서 순서대로 추가
+    windows: List[List[int]] = []
+    for position in sorted(set(positions)):
+        start, end = max(len(head), position - window_chars), min(len(text), position + window_chars)
+        if start >= end:
+            continue
+        if windows and start <= windows[-1][1]:
+            windows[-1][1] = max(windows[-1][1], end)
+        else:
+            windows.append([start, end])
+
+    separator = estimate_tokens(ELLIPSIS, encoding)
+    for start, end in windows:
+        remaining = max_tokens - used - separator
+        if remaining <= 0:
+            break
+        window = truncate_tokens(text[start:end], remaining, encoding)
+        parts.append(window)
+        used += separator + estimate_tokens(window, encoding)
+
+    return ELLIPSIS.join(part for part in parts if part)
+
+
+def chunk_text(text: str, max_tokens: int, encoding: Optional[str] = None) -> List[str]:
+    """텍스트를 문단/문장 경계에서 max_tokens 이내의 조각들로 나눕니다."""
+    text = (text or "").strip()
+    if not text:
+        return []
+    if estimate_tokens(text, encoding) <= max_tokens:
+        return [text]
+
+    pieces: List[str] = []
+    for paragraph in _PARAGRAPH_PATTERN.split(text):
+        if estimate_tokens(paragraph, encoding) <= max_tokens:
+            pieces.append(paragraph)
+            continue
+        for sentence in _SENTENCE_PATTERN.split(paragraph):
+            # 문장 하나가 한도를 넘으면 강제로 자름
+            while estimate_tokens(sentence, encoding) > max_tokens:
+                head = truncate_tokens(sentence, max_tokens, encoding) or sentence[:1]
+                pieces.append(head)
+                sentence = sentence[len(head):]
+            pieces.append(sentence)
+
+    chunks: List[str] = []
+    current: List[str] = []
+    used = 0
+    for piece in (piece.strip() for piece in pieces):
+        if not piece:
+            continue
+        cost = estimate_tokens(piece, encoding)
+        if current and used + cost > max_tokens:
+            chunks.append("\n".join(current))
+            current, used = [], 0
+        current.append(piece)
+        used += cost
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
@@ -38,6 +38,10 @@ async def lifespan(app: FastAPI):
         await container.init_resources()
         logger.info("✅ 의존성 주입 컨테이너 초기화 완료")
         
+        # LLM 클라이언트 예열 (첫 평가 요청의 연결/초기화 비용을 시작 시 지불)
+        await container.warm_up_llm_services()
+        logger.info("✅ LLM 클라이언트 예열 완료")
+        
         logger.info("✅ 뉴스레터 시스템 시작 완료")
         
     except Exception as e:
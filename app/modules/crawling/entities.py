@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
+import sys
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
@@ -38,6 +39,8 @@ class CrawledPost:
     comments: int              # 댓글 수
     metadata: Dict[str, Any]   # 추가 메타데이터
     crawled_at: datetime       # 크롤링 시간
+    simhash: Optional[int] = None       # 제목+본문 SimHash 지문 (64비트)
+    duplicate_of: Optional[str] = None  # 유사 중복일 경우 원본 게시글 ID
 
 
 @dataclass
@@ -82,3 +85,182 @@ class CrawlSession:
     started_at: datetime       # 시작 시간
     completed_at: Optional[datetime]  # 완료 시간
     error_message: Optional[str]      # 에러 메시지
+
+
+# ---------------------------------------------------------------------------
+# 파이프라인 내부용 압축 표현
+#
+# 대량 크롤링 중에는 수천~수십만 개의 레코드가 메모리에 머뭅니다. 아래 클래스들은
+# __slots__로 인스턴스 __dict__를 없애고, 반복되는 문자열(source, post_type 등)을
+# intern 하며, 비어 있는 metadata는 None으로 저장합니다. to_entity()로 원래 타입과
+# 동일한 값으로 되돌릴 수 있습니다.
+# ---------------------------------------------------------------------------
+
+def _intern(value: Any) -> Any:
+    """문자열이면 intern 하여 같은 값의 문자열이 하나의 객체를 공유하도록 합니다."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _pack_metadata(metadata: Optional[Dict[str, Any]]) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """메타데이터 딕셔너리를 튜플로 압축합니다 (비어 있으면 None)."""
+    if not metadata:
+        return None
+    return tuple((_intern(key), value) for key, value in metadata.items())
+
+
+def _unpack_metadata(packed: Optional[Tuple[Tuple[str, Any], ...]]) -> Dict[str, Any]:
+    """압축된 메타데이터를 딕셔너리로 복원합니다."""
+    return dict(packed) if packed else {}
+
+
+@dataclass
+class CompactCrawledPost:
+    """CrawledPost의 압축 표현 - 파이프라인 메모리 단계 전용."""
+    __slots__ = (
+        "id", "title", "content", "url", "source", "post_type", "author",
+        "views", "likes", "comments", "metadata", "crawled_at",
+        "simhash", "duplicate_of",
+    )
+    id: str
+    title: str
+    content: str
+    url: str
+    source: str                                          # intern 된 문자열
+    post_type: PostType                                  # 열거형 또는 intern 된 문자열
+    author: str                                          # intern 된 문자열
+    views: int
+    likes: int
+    comments: int
+    metadata: Optional[Tuple[Tuple[str, Any], ...]]      # 비어 있으면 None
+    crawled_at: datetime
+    simhash: Optional[int]
+    duplicate_of: Optional[str]
+
+    @classmethod
+    def from_entity(cls, post: CrawledPost) -> "CompactCrawledPost":
+        """CrawledPost를 압축 표현으로 변환합니다."""
+        return cls(
+            post.id, post.title, post.content, post.url,
+            _intern(post.source), _intern(post.post_type), _intern(post.author),
+            post.views, post.likes, post.comments,
+            _pack_metadata(post.metadata), post.crawled_at,
+            post.simhash, post.duplicate_of,
+        )
+
+    def to_entity(self) -> CrawledPost:
+        """원래의 CrawledPost로 복원합니다."""
+        return CrawledPost(
+            id=self.id,
+            title=self.title,
+            content=self.content,
+            url=self.url,
+            source=self.source,
+            post_type=self.post_type,
+            author=self.author,
+            views=self.views,
+            likes=self.likes,
+            comments=self.comments,
+            metadata=_unpack_metadata(self.metadata),
+            crawled_at=self.crawled_at,
+            simhash=self.simhash,
+            duplicate_of=self.duplicate_of,
+        )
+
+
+@dataclass
+class CompactNewsArticle:
+    """NewsArticle의 압축 표현 - 파이프라인 메모리 단계 전용."""
+    __slots__ = (
+        "id", "title", "content", "url", "source", "author",
+        "published_at", "category", "metadata", "crawled_at",
+    )
+    id: str
+    title: str
+    content: str
+    url: str
+    source: str                                          # intern 된 문자열
+    author: str                                          # intern 된 문자열
+    published_at: datetime
+    category: str                                        # intern 된 문자열
+    metadata: Optional[Tuple[Tuple[str, Any], ...]]      # 비어 있으면 None
+    crawled_at: datetime
+
+    @classmethod
+    def from_entity(cls, article: NewsArticle) -> "CompactNewsArticle":
+        """NewsArticle을 압축 표현으로 변환합니다."""
+        return cls(
+            article.id, article.title, article.content, article.url,
+            _intern(article.source), _intern(article.author), article.published_at,
+            _intern(article.category), _pack_metadata(article.metadata), article.crawled_at,
+        )
+
+    def to_entity(self) -> NewsArticle:
+        """원래의 NewsArticle로 복원합니다."""
+        return NewsArticle(
+            id=self.id,
+            title=self.title,
+            content=self.content,
+            url=self.url,
+            source=self.source,
+            author=self.author,
+            published_at=self.published_at,
+            category=self.category,
+            metadata=_unpack_metadata(self.metadata),
+            crawled_at=self.crawled_at,
+        )
+
+
+@dataclass
+class CompactGovernmentDocument:
+    """GovernmentDocument의 압축 표현 - 파이프라인 메모리 단계 전용."""
+    __slots__ = (
+        "id", "title", "content", "url", "department",
+        "published_at", "document_type", "metadata", "crawled_at",
+    )
+    id: str
+    title: str
+    content: str
+    url: str
+    department: str                                      # intern 된 문자열
+    published_at: datetime
+    document_type: str                                   # intern 된 문자열
+    metadata: Optional[Tuple[Tuple[str, Any], ...]]      # 비어 있으면 None
+    crawled_at: datetime
+
+    @classmethod
+    def from_entity(cls, document: GovernmentDocument) -> "CompactGovernmentDocument":
+        """GovernmentDocument를 압축 표현으로 변환합니다."""
+        return cls(
+            document.id, document.title, document.content, document.url,
+            _intern(document.department), document.published_at,
+            _intern(document.document_type), _pack_metadata(document.metadata), document.crawled_at,
+        )
+
+    def to_entity(self) -> GovernmentDocument:
+        """원래의 GovernmentDocument로 복원합니다."""
+        return GovernmentDocument(
+            id=self.id,
+            title=self.title,
+            content=self.content,
+            url=self.url,
+            department=self.department,
+            published_at=self.published_at,
+            document_type=self.document_type,
+            metadata=_unpack_metadata(self.metadata),
+            crawled_at=self.crawled_at,
+        )
+
+
+_COMPACT_TYPES = {
+    CrawledPost: CompactCrawledPost,
+    NewsArticle: CompactNewsArticle,
+    GovernmentDocument: CompactGovernmentDocument,
+}
+
+
+def compact(record: Any) -> Any:
+    """크롤링 엔티티를 대응하는 압축 표현으로 변환합니다."""
+    try:
+        return _COMPACT_TYPES[type(record)].from_entity(record)
+    except KeyError:
+        raise TypeError(f"Unsupported crawl record type: {type(record).__name__}") from None
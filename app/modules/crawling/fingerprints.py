@@ -0,0 +1,133 @@
+"""콘텐츠 지문 - SimHash 기반 유사 중복 게시글 탐지.
+
+같은 뉴스가 여러 커뮤니티에 재게시되거나 여러 언론사 기사로 수집되면 URL은 달라도
+본문은 거의 같습니다. 정규화한 제목+본문의 문자 n-gram으로 64비트 SimHash를 만들고,
+밴드 인덱스로 해밍 거리 ``max_distance`` 이하인 지문을 O(1)에 찾습니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+SIMHASH_BITS = 64
+_MASK64 = (1 << SIMHASH_BITS) - 1
+
+_URL_PATTERN = re.compile(r"https?://\S+")
+_NON_WORD_PATTERN = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """비교용으로 텍스트를 정규화합니다 (NFKC, 소문자, URL/기호 제거, 공백 정리)."""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    text = _URL_PATTERN.sub(" ", text)
+    text = _NON_WORD_PATTERN.sub(" ", text)
+    return " ".join(text.split())
+
+
+def shingles(text: str, size: int = 3) -> Counter:
+    """정규화된 텍스트의 문자 n-gram 빈도를 구합니다 (공백 제외, 한국어에 적합)."""
+    compact = text.replace(" ", "")
+    if len(compact) <= size:
+        return Counter([compact]) if compact else Counter()
+    return Counter(compact[i:i + size] for i in range(len(compact) - size + 1))
+
+
+def _hash64(feature: str) -> int:
+    """특징 문자열의 64비트 해시를 구합니다 (프로세스 간 안정적)."""
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash64(text: str, ngram: int = 3) -> int:
+    """정규화된 텍스트의 64비트 SimHash를 계산합니다."""
+    weights = [0] * SIMHASH_BITS
+    for feature, count in shingles(text, ngram).items():
+        h = _hash64(feature)
+        for bit in range(SIMHASH_BITS):
+            if h >> bit & 1:
+                weights[bit] += count
+            else:
+                weights[bit] -= count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def fingerprint(title: str, content: str) -> int:
+    """게시글 제목+본문의 SimHash 지문을 계산합니다."""
+    return simhash64(normalize_text(f"{title}\n{content}"))
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 해밍 거리를 구합니다."""
+    return bin((a ^ b) & _MASK64).count("1")
+
+
+def to_signed64(value: int) -> int:
+    """부호 없는 64비트 지문을 MongoDB int64에 저장할 수 있는 부호 있는 값으로 변환합니다."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def from_signed64(value: int) -> int:
+    """저장된 부호 있는 int64 값을 부호 없는 64비트 지문으로 복원합니다."""
+    return value & _MASK64
+
+
+class SimHashIndex:
+    """SimHash 밴드 인덱스 - 해밍 거리 max_distance 이하의 지문을 찾습니다.
+
+    64비트를 ``max_distance + 1``개의 밴드로 나누면, 거리가 max_distance 이하인 두 지문은
+    비둘기집 원리에 따라 적어도 한 밴드가 정확히 일치합니다. 따라서 밴드 값으로 후보를
+    찾은 뒤 후보에 대해서만 해밍 거리를 계산합니다.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self.band_count = max_distance + 1
+        self._band_bits = -(-SIMHASH_BITS // self.band_count)
+        self._band_mask = (1 << self._band_bits) - 1
+        self._bands: List[Dict[int, List[Tuple[int, str]]]] = [{} for _ in range(self.band_count)]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _band_values(self, value: int):
+        for band in range(self.band_count):
+            yield band, (value >> (band * self._band_bits)) & self._band_mask
+
+    def add(self, key: str, value: int) -> None:
+        """지문을 인덱스에 추가합니다."""
+        for band, band_value in self._band_values(value):
+            self._bands[band].setdefault(band_value, []).append((value, key))
+        self._size += 1
+
+    def find(self, value: int) -> Optional[Tuple[str, int]]:
+        """가장 가까운 유사 중복 지문을 찾습니다.
+
+        Returns:
+            (원본 키, 해밍 거리) 또는 유사 중복이 없으면 None
+        """
+        best: Optional[Tuple[str, int]] = None
+        for band, band_value in self._band_values(value):
+            for candidate, key in self._bands[band].get(band_value, ()):
+                distance = hamming_distance(value, candidate)
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (key, distance)
+                    if distance == 0:
+                        return best
+        return best
+
+    def check_and_add(self, key: str, value: int) -> Optional[str]:
+        """유사 중복이면 원본 키를 반환하고, 아니면 지문을 추가한 뒤 None을 반환합니다."""
+        match = self.find(value)
+        if match is not None:
+            return match[0]
+        self.add(key, value)
+        return None
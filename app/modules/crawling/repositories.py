@@ -35,6 +35,16 @@ class CrawledPostRepository(ABC):
     async def list_recent(self, limit: int = 100) -> List[CrawledPost]:
         """최근 크롤링된 게시글 목록을 조회합니다."""
         pass
+    
+    @abstractmethod
+    async def list_since(self, since: datetime, limit: int = 5000) -> List[CrawledPost]:
+        """특정 시점 이후 크롤링된 게시글 목록을 조회합니다 (스토리 클러스터링 이력용)."""
+        pass
+    
+    @abstractmethod
+    async def get_many(self, post_ids: List[str]) -> List[CrawledPost]:
+        """여러 ID의 게시글을 한 번에 조회합니다 (없는 ID는 제외)."""
+        pass
 
 
 class CrawlSessionRepository(ABC):
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 from .entities import CrawledPost, CrawlSession, PostType, CrawlStatus
+from .fingerprints import SimHashIndex, fingerprint
 from .repositories import CrawledPostRepository, CrawlSessionRepository
 
 
@@ -57,12 +58,21 @@ class CrawlingService:
 class DataExtractionService:
     """데이터 추출 서비스."""
     
+    def __init__(self, duplicate_index: Optional[SimHashIndex] = None):
+        # 프로세스 내 유사 중복 인덱스 - 여러 소스/유즈케이스가 공유하도록 주입 가능
+        self.duplicate_index = duplicate_index if duplicate_index is not None else SimHashIndex()
+    
     async def extract_post_data(self, raw_data: Dict[str, Any], source: str, post_type: PostType) -> CrawledPost:
-        """원시 데이터에서 게시글 데이터를 추출합니다."""
+        """원시 데이터에서 게시글 데이터를 추출하고 유사 중복 여부를 표시합니다."""
+        post_id = f"post_{datetime.utcnow().timestamp()}"
+        title = raw_data.get("title", "")
+        content = raw_data.get("content", "")
+        simhash = fingerprint(title, content)
+        
         return CrawledPost(
-            id=f"post_{datetime.utcnow().timestamp()}",
-            title=raw_data.get("title", ""),
-            content=raw_data.get("content", ""),
+            id=post_id,
+            title=title,
+            content=content,
             url=raw_data.get("url", ""),
             source=source,
             post_type=post_type,
@@ -71,5 +81,7 @@ class DataExtractionService:
             likes=raw_data.get("likes", 0),
             comments=raw_data.get("comments", 0),
             metadata=raw_data.get("metadata", {}),
-            crawled_at=datetime.utcnow()
+            crawled_at=datetime.utcnow(),
+            simhash=simhash,
+            duplicate_of=self.duplicate_index.check_and_add(post_id, simhash)
         )
@@ -1,20 +1,34 @@
 """Evaluation module - 평가 모듈 (독립적 DDD 구조)."""
 
+from .cascade import CascadeStats, CascadeVerdict, EvaluationCascade
 from .entities import EvaluationResult, EvaluationSession
+from .keywords import KeywordMatcher, KeywordMatch, RelevancePrefilter, get_keyword_matcher
 from .repositories import EvaluationResultRepository, EvaluationSessionRepository
-from .services import LLMEvaluationService, RelevanceEvaluationService
+from .services import EvaluationJob, LLMEvaluationService, RelevanceEvaluationService
 from .use_cases import EvaluatePostsUseCase, EvaluateRelevanceUseCase
+from .writer import ResultWriter
 
 __all__ = [
     # Entities
     "EvaluationResult",
     "EvaluationSession",
+    # Keywords
+    "KeywordMatcher",
+    "KeywordMatch",
+    "RelevancePrefilter",
+    "get_keyword_matcher",
     # Repositories
     "EvaluationResultRepository",
     "EvaluationSessionRepository",
     # Services
     "LLMEvaluationService",
     "RelevanceEvaluationService",
+    "EvaluationJob",
+    "ResultWriter",
+    # Cascade
+    "EvaluationCascade",
+    "CascadeVerdict",
+    "CascadeStats",
     # Use Cases
     "EvaluatePostsUseCase",
     "EvaluateRelevanceUseCase",
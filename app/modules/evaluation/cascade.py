@@ -0,0 +1,149 @@
+"""평가 캐스케이드 - 빠른 1단계 모델(로컬 분류기 또는 소형 LLM)로 먼저 평가하고,
+신뢰도가 낮거나 키워드 사전 필터와 판정이 엇갈리는 게시글만 대형 LLM으로 넘깁니다.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from .keywords import KeywordMatcher, get_keyword_matcher
+
+# 에스컬레이션 사유
+LOW_CONFIDENCE = "low_confidence"
+KEYWORD_DISAGREEMENT = "keyword_disagreement"
+TIER1_ERROR = "tier1_error"
+
+
+@dataclass
+class CascadeVerdict:
+    """1단계 평가 결과."""
+    tier: str                          # 1단계 모델 이름
+    is_relevant: bool = False
+    category: str = "OTHER"
+    relevance_score: float = 0.0
+    confidence: float = 0.0            # 1단계 모델의 신뢰도 (0.0 ~ 1.0)
+    summary: Optional[str] = None
+    keyword_hits: int = 0
+    latency_ms: float = 0.0
+    escalation_reason: Optional[str] = None  # None이면 1단계 판정을 사용
+
+    @property
+    def escalated(self) -> bool:
+        return self.escalation_reason is not None
+
+    def details(self) -> Dict[str, Any]:
+        """EvaluationResult.details["cascade"]에 기록할 정보."""
+        return {
+            "tier1": self.tier,
+            "tier1_latency_ms": round(self.latency_ms, 1),
+            "tier1_confidence": round(self.confidence, 4),
+            "tier1_is_relevant": self.is_relevant,
+            "keyword_hits": self.keyword_hits,
+            "escalated": self.escalated,
+            "escalation_reason": self.escalation_reason,
+        }
+
+
+@dataclass
+class CascadeStats:
+    """캐스케이드 통계 (에스컬레이션 비율, 단계별 평균 지연)."""
+    evaluated: int = 0
+    escalated: int = 0
+    reasons: Dict[str, int] = field(default_factory=dict)
+    tier1_latency_ms: float = 0.0
+    tier2_latency_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "evaluated": self.evaluated,
+            "escalated": self.escalated,
+            "escalation_rate": round(self.escalated / self.evaluated, 4) if self.evaluated else 0.0,
+            "reasons": dict(self.reasons),
+            "tier1_avg_latency_ms": round(self.tier1_latency_ms / self.evaluated, 1) if self.evaluated else 0.0,
+            "tier2_avg_latency_ms": round(self.tier2_latency_ms / self.escalated, 1) if self.escalated else 0.0,
+        }
+
+
+class EvaluationCascade:
+    """1단계 모델 평가와 에스컬레이션 판단을 담당합니다.
+
+    1단계 모델은 ``predict(text)``를 제공하는 로컬 분류기(LocalClassifierService)이거나
+    ``analyze_post``를 제공하는 소형 LLM 서비스입니다.
+    """
+
+    def __init__(
+        self,
+        first_tier,
+        threshold: float = 0.85,
+        strong_keyword_hits: int = 3,
+        matcher: Optional[KeywordMatcher] = None
+    ):
+        """캐스케이드를 만듭니다.
+
+        Args:
+            first_tier: 1단계 모델 (로컬 분류기 또는 소형 LLM 서비스)
+            threshold: 1단계 판정을 그대로 사용할 최소 신뢰도
+            strong_keyword_hits: 1단계가 관련 없음으로 판정해도 이 횟수 이상 키워드가 나오면 에스컬레이션
+            matcher: 키워드 매처 (기본: 공유 매처)
+        """
+        self.first_tier = first_tier
+        self.threshold = threshold
+        self.strong_keyword_hits = strong_keyword_hits
+        self.matcher = matcher or get_keyword_matcher()
+        self.tier_name = getattr(first_tier, "name", type(first_tier).__name__)
+        if getattr(first_tier, "model", None):
+            self.tier_name = f"{self.tier_name}:{first_tier.model}"
+        self.stats = CascadeStats()
+
+    async def first_pass(self, text: str) -> CascadeVerdict:
+        """1단계 모델로 평가하고 에스컬레이션 여부를 정합니다."""
+        verdict = CascadeVerdict(tier=self.tier_name, keyword_hits=self.matcher.match(text).total)
+        started = time.perf_counter()
+        try:
+            if hasattr(self.first_tier, "predict"):
+                self._apply_local_prediction(verdict, self.first_tier.predict(text))
+            else:
+                self._apply_analysis(verdict, await self.first_tier.analyze_post(text, sentences=1))
+        except Exception:
+            verdict.escalation_reason = TIER1_ERROR
+        verdict.latency_ms = (time.perf_counter() - started) * 1000
+
+        if verdict.escalation_reason is None:
+            verdict.escalation_reason = self._escalation_reason(verdict)
+
+        self.stats.evaluated += 1
+        self.stats.tier1_latency_ms += verdict.latency_ms
+        if verdict.escalated:
+            self.stats.escalated += 1
+            self.stats.reasons[verdict.escalation_reason] = self.stats.reasons.get(verdict.escalation_reason, 0) + 1
+        return verdict
+
+    def record_tier2_latency(self, latency_ms: float) -> None:
+        self.stats.tier2_latency_ms += latency_ms
+
+    def _apply_local_prediction(self, verdict: CascadeVerdict, prediction: Dict[str, Any]) -> None:
+        verdict.is_relevant = prediction["is_relevant"]
+        verdict.relevance_score = prediction["relevance_probability"]
+        verdict.category = prediction["category"] or "OTHER"
+        verdict.confidence = prediction["relevance_confidence"]
+        if prediction["category"] is not None:
+            verdict.confidence = min(verdict.confidence, prediction["category_confidence"])
+
+    def _apply_analysis(self, verdict: CascadeVerdict, analysis: Dict[str, Any]) -> None:
+        verdict.is_relevant = analysis["is_relevant"]
+        verdict.relevance_score = analysis["relevance_score"]
+        verdict.category = analysis["category"]
+        verdict.summary = analysis.get("summary")
+        # 소형 LLM은 관련성 점수를 확률로 보고 신뢰도를 계산
+        verdict.confidence = max(verdict.relevance_score, 1 - verdict.relevance_score)
+
+    def _escalation_reason(self, verdict: CascadeVerdict) -> Optional[str]:
+        if verdict.confidence < self.threshold:
+            return LOW_CONFIDENCE
+        if verdict.is_relevant and verdict.keyword_hits == 0:
+            return KEYWORD_DISAGREEMENT
+        if not verdict.is_relevant and verdict.keyword_hits >= self.strong_keyword_hits:
+            return KEYWORD_DISAGREEMENT
+        return None
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -27,6 +27,7 @@ class EvaluationResult:
     confidence: float          # 신뢰도 (0.0 ~ 1.0)
     details: Dict[str, Any]    # 평가 세부 정보
     evaluated_at: datetime     # 평가 시간
+    content_hash: Optional[str] = None  # 평가한 제목+본문의 해시 (증분 평가에서 변경 여부 확인)
 
 
 @dataclass
@@ -41,3 +42,5 @@ class EvaluationSession:
     started_at: datetime       # 시작 시간
     completed_at: Optional[datetime]  # 완료 시간
     error_message: Optional[str]      # 에러 메시지
+    batch_job_id: Optional[str] = None  # 제공자 배치 작업 ID (배치 작업 모드)
+    llm_usage: Dict[str, Any] = field(default_factory=dict)  # LLM 호출 계측 (토큰, 비용, 지연 백분위, 템플릿별 합계)
@@ -0,0 +1,179 @@
+"""키워드 매칭 - 통신 관련 키워드/별칭을 Aho-Corasick 오토마톤으로 한 번에 찾습니다.
+
+키워드마다 ``kw in text``로 본문을 반복 스캔하는 대신, 모든 별칭으로 오토마톤을 한 번 만들고
+텍스트를 한 번만 훑어 키워드별 출현 횟수와 위치를 구합니다. 영문 별칭(예: ``KT``)은
+영숫자 경계에서만 일치하므로 ``SKT``나 ``KTX`` 안의 ``KT``는 세지 않습니다.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# 대표 키워드 -> 별칭 목록 (대표 키워드 자신도 별칭에 포함)
+DEFAULT_KEYWORD_GROUPS: Dict[str, List[str]] = {
+    "통신": ["통신", "통신사", "이동통신"],
+    "5G": ["5G", "LTE", "28GHz"],
+    "이통": ["이통", "이통사", "이통3사", "알뜰폰", "단말기 지원금", "단통법"],
+    "KT": ["KT", "케이티", "KT스카이라이프"],
+    "SKT": ["SKT", "SK텔레콤", "SK 텔레콤", "에스케이텔레콤", "SK브로드밴드"],
+    "LGU": ["LGU", "LGU+", "LG U+", "LG유플러스", "엘지유플러스"],
+    "방통위": ["방통위", "방송통신위원회"],
+    "KAIT": ["KAIT", "한국정보통신진흥협회", "정보통신진흥협회"],
+}
+
+# 관련성 판단에 쓰는 대표 키워드 목록
+DEFAULT_KEYWORDS: List[str] = list(DEFAULT_KEYWORD_GROUPS)
+
+_ASCII_LOWER = {code: code + 32 for code in range(ord("A"), ord("Z") + 1)}
+
+
+def _is_ascii_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+@dataclass
+class KeywordMatch:
+    """텍스트 하나의 키워드 매칭 결과."""
+    counts: Dict[str, int] = field(default_factory=dict)           # 대표 키워드별 출현 횟수
+    positions: Dict[str, List[int]] = field(default_factory=dict)  # 대표 키워드별 시작 위치
+
+    @property
+    def total(self) -> int:
+        """전체 출현 횟수."""
+        return sum(self.counts.values())
+
+    @property
+    def keywords(self) -> List[str]:
+        """출현한 대표 키워드 목록 (처음 나온 순서)."""
+        return sorted(self.positions, key=lambda keyword: self.positions[keyword][0])
+
+
+class KeywordMatcher:
+    """Aho-Corasick 키워드/별칭 매처 - 한 번 만들어 여러 텍스트에 재사용합니다."""
+
+    def __init__(self, groups: Optional[Mapping[str, Sequence[str]]] = None):
+        """매처를 만듭니다.
+
+        Args:
+            groups: 대표 키워드 -> 별칭 목록 (기본: DEFAULT_KEYWORD_GROUPS)
+        """
+        self.groups = {keyword: list(aliases) for keyword, aliases in (groups or DEFAULT_KEYWORD_GROUPS).items()}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, int, bool]]] = [[]]  # (대표 키워드, 별칭 길이, 영문 경계 검사 여부)
+        for keyword, aliases in self.groups.items():
+            for alias in {keyword, *aliases}:
+                self._add(alias, keyword)
+        self._build()
+
+    @classmethod
+    def from_keywords(cls, keywords: Iterable[str]) -> "KeywordMatcher":
+        """별칭 없이 키워드 목록으로 매처를 만듭니다."""
+        return cls({keyword: [keyword] for keyword in keywords})
+
+    @property
+    def keywords(self) -> List[str]:
+        """대표 키워드 목록."""
+        return list(self.groups)
+
+    def _add(self, alias: str, keyword: str) -> None:
+        node = 0
+        for char in alias.translate(_ASCII_LOWER):
+            if char not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][char] = len(self._goto) - 1
+            node = self._goto[node][char]
+        self._output[node].append((keyword, len(alias), alias.isascii()))
+
+    def _build(self) -> None:
+        """BFS로 실패 링크를 만들고 출력 목록을 합칩니다."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0) if node else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def match(self, text: str) -> KeywordMatch:
+        """텍스트를 한 번 훑어 대표 키워드별 출현 횟수와 위치를 구합니다."""
+        result = KeywordMatch()
+        if not text:
+            return result
+
+        # 같은 대표 키워드의 별칭이 겹치면 (예: 이동통신/통신, 이통/이통사) 한 번만 셈
+        seen = set()
+        last_end: Dict[str, int] = {}
+        node = 0
+        for end, char in enumerate(text.translate(_ASCII_LOWER)):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for keyword, length, ascii_alias in self._output[node]:
+                start = end - length + 1
+                if ascii_alias and (
+                    (start > 0 and _is_ascii_word_char(text[start - 1]))
+                    or (end + 1 < len(text) and _is_ascii_word_char(text[end + 1]))
+                ):
+                    continue
+                if (keyword, start) in seen or last_end.get(keyword) == end:
+                    continue
+                seen.add((keyword, start))
+                last_end[keyword] = end
+                result.counts[keyword] = result.counts.get(keyword, 0) + 1
+                result.positions.setdefault(keyword, []).append(start)
+        return result
+
+    def match_many(self, texts: Iterable[str]) -> List[KeywordMatch]:
+        """여러 텍스트를 같은 오토마톤으로 매칭합니다."""
+        return [self.match(text) for text in texts]
+
+
+_default_matcher: Optional[KeywordMatcher] = None
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """기본 키워드 그룹으로 만든 공유 매처를 반환합니다 (처음 호출할 때 한 번 생성)."""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = KeywordMatcher()
+    return _default_matcher
+
+
+def engagement_score(post: Mapping[str, Any]) -> int:
+    """게시글 반응 점수 (조회수 + 좋아요×10 + 댓글×5)."""
+    return (post.get("views") or 0) + (post.get("likes") or 0) * 10 + (post.get("comments") or 0) * 5
+
+
+class RelevancePrefilter:
+    """LLM 호출 전 키워드 사전 필터 - 키워드가 하나도 없고 반응이 낮은 게시글은 LLM 평가를 건너뜁니다."""
+
+    def __init__(self, matcher: Optional[KeywordMatcher] = None, min_engagement: int = 1000):
+        """사전 필터를 만듭니다.
+
+        Args:
+            matcher: 키워드 매처 (기본: 공유 매처)
+            min_engagement: 키워드가 없어도 LLM으로 평가할 최소 반응 점수 (0이면 건너뛰지 않음)
+        """
+        self.matcher = matcher or get_keyword_matcher()
+        self.min_engagement = min_engagement
+
+    def check(self, post: Mapping[str, Any]) -> Tuple[bool, KeywordMatch]:
+        """게시글을 LLM으로 평가해야 하는지 판단합니다.
+
+        Returns:
+            (LLM 평가 필요 여부, 키워드 매칭 결과)
+        """
+        match = self.matcher.match(f"{post.get('title', '')}\n{post.get('content', '')}")
+        return self.needs_llm(match, engagement_score(post)), match
+
+    def needs_llm(self, match: KeywordMatch, engagement: int) -> bool:
+        """키워드가 하나라도 있거나 반응 점수가 min_engagement 이상이면 LLM 평가가 필요합니다."""
+        return match.total > 0 or engagement >= self.min_engagement
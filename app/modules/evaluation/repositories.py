@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from .entities import EvaluationResult, EvaluationSession
 
@@ -16,6 +16,11 @@ class EvaluationResultRepository(ABC):
         """평가 결과를 데이터베이스에 저장합니다."""
         pass
     
+    @abstractmethod
+    async def save_many(self, results: List[EvaluationResult]) -> List[str]:
+        """평가 결과들을 한 번의 순서 없는 일괄 쓰기로 저장합니다."""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, result_id: str) -> Optional[EvaluationResult]:
         """ID로 평가 결과를 조회합니다."""
@@ -35,6 +40,20 @@ class EvaluationResultRepository(ABC):
     async def list_by_category(self, category: str) -> List[EvaluationResult]:
         """특정 카테고리의 평가 결과 목록을 조회합니다."""
         pass
+    
+    @abstractmethod
+    async def list_recent(self, limit: int = 50000) -> List[EvaluationResult]:
+        """최근 평가 결과 목록을 최신순으로 조회합니다."""
+        pass
+    
+    @abstractmethod
+    async def list_by_content_hashes(self, content_hashes: Dict[str, str]) -> List[EvaluationResult]:
+        """게시글 ID별 내용 해시가 일치하는 평가 결과들을 한 번의 조회로 가져옵니다.
+        
+        Args:
+            content_hashes: 게시글 ID → 현재 제목+본문의 해시
+        """
+        pass
 
 
 class EvaluationSessionRepository(ABC):
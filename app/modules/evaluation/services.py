@@ -2,92 +2,509 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from .cascade import CascadeVerdict, EvaluationCascade
 from .entities import EvaluationResult, EvaluationSession, EvaluationStatus
+from .keywords import KeywordMatcher, RelevancePrefilter, engagement_score, get_keyword_matcher
 from .repositories import EvaluationResultRepository, EvaluationSessionRepository
+from .writer import FlushCallback, ResultWriter
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(title: str, content: str, version: str = "") -> str:
+    """공백을 정규화한 제목+본문(과 평가 버전)의 SHA-256 해시."""
+    text = " ".join(f"{title}\n{content}".split())
+    return hashlib.sha256(f"{version}\x00{text}".encode("utf-8")).hexdigest()
+
+
+@dataclass
+class EvaluationJob:
+    """제공자 배치 작업으로 제출한 평가 - collect_evaluation_job으로 결과를 가져옵니다."""
+    job: Optional[Dict[str, Any]]                       # 제공자 배치 작업 (제출할 게시글이 없으면 None)
+    posts: List[Dict[str, Any]]                         # 배치 작업으로 평가하는 게시글
+    results: List[EvaluationResult]                     # 사전 필터/캐스케이드에서 확정된 결과
+    verdicts: Dict[str, CascadeVerdict] = field(default_factory=dict)  # 대형 모델로 넘긴 게시글의 1단계 판정
+    submitted_at: float = field(default_factory=time.time)
 
 
 class LLMEvaluationService:
     """LLM 평가 서비스."""
     
-    def __init__(self, llm_client, result_repo: EvaluationResultRepository):
+    def __init__(
+        self,
+        llm_client,
+        result_repo: EvaluationResultRepository,
+        prefilter: Optional[RelevancePrefilter] = None,
+        cascade: Optional[EvaluationCascade] = None,
+        incremental: bool = True,
+        content_version: str = "",
+        write_batch_size: int = 100,
+        write_interval: float = 1.0
+    ):
         self.llm_client = llm_client
         self.result_repo = result_repo
+        # 키워드가 없고 반응이 낮은 게시글은 LLM 없이 관련 없음으로 처리 (min_engagement=0이면 비활성)
+        self.prefilter = prefilter if prefilter is not None else RelevancePrefilter()
+        # 1단계 모델(로컬 분류기/소형 LLM)로 먼저 평가하고 어려운 게시글만 llm_client로 평가
+        self.cascade = cascade
+        # 제목+본문 해시가 같은 기존 평가 결과가 있으면 다시 평가하지 않음
+        self.incremental = incremental
+        # 프롬프트/모델이 바뀌면 올려서 기존 결과를 무효화 (내용 해시에 포함)
+        self.content_version = content_version
+        # 평가 결과는 write_batch_size개 또는 write_interval초마다 일괄 저장
+        self.write_batch_size = write_batch_size
+        self.write_interval = write_interval
+    
+    def result_writer(self, on_flush: Optional[FlushCallback] = None) -> ResultWriter:
+        """평가 한 번 동안 결과를 모아 일괄 저장하는 writer를 만듭니다."""
+        return ResultWriter(self.result_repo, self.write_batch_size, self.write_interval, on_flush)
     
     async def evaluate_post(self, post_id: str, title: str, content: str) -> EvaluationResult:
-        """게시글을 평가합니다."""
+        """게시글을 평가합니다 (캐스케이드가 있으면 1단계 모델 판정을 먼저 확인)."""
+        writer = self.result_writer()
+        try:
+            verdict = None
+            if self.cascade is not None:
+                verdict = await self.cascade.first_pass(f"{title}\n{content}")
+                if not verdict.escalated:
+                    return await self._save_cascade_result(post_id, title, content, verdict, writer)
+            return await self._evaluate_post_with_llm(post_id, title, content, writer, verdict)
+        finally:
+            await writer.flush()
+    
+    async def _evaluate_post_with_llm(
+        self,
+        post_id: str,
+        title: str,
+        content: str,
+        writer: ResultWriter,
+        verdict: Optional[CascadeVerdict] = None
+    ) -> EvaluationResult:
+        """게시글을 llm_client로 평가합니다."""
         text = f"{title}\n{content}"
+        details = {"text_length": len(text)}
+        started = time.perf_counter()
         
-        # LLM으로 관련성 평가
-        is_relevant = await self.llm_client.is_relevant(text)
+        if hasattr(self.llm_client, "analyze_post"):
+            # 관련성, 점수, 카테고리, 요약을 한 번의 구조화된 호출로 평가
+            analysis = await self.llm_client.analyze_post(text)
+            is_relevant = analysis["is_relevant"]
+            category = analysis["category"]
+            relevance_score = analysis["relevance_score"]
+            details.update(evaluation_method="llm_structured", summary=analysis["summary"])
+        else:
+            # LLM으로 관련성 평가
+            is_relevant = await self.llm_client.is_relevant(text)
+            
+            # LLM으로 카테고리 분류
+            category = await self.llm_client.classify_category(text)
+            
+            # 점수 계산
+            relevance_score = 0.8 if is_relevant else 0.2
+            details["evaluation_method"] = "llm"
         
-        # LLM으로 카테고리 분류
-        category = await self.llm_client.classify_category(text)
-        
-        # 점수 계산
-        relevance_score = 0.8 if is_relevant else 0.2
+        if verdict is not None:
+            details["cascade"] = self._escalated_details(verdict, (time.perf_counter() - started) * 1000)
         
         result = EvaluationResult(
-            id=f"eval_{datetime.utcnow().timestamp()}",
+            id=f"eval_{post_id}_{datetime.utcnow().timestamp()}",
             post_id=post_id,
             is_relevant=is_relevant,
             category=category,
             relevance_score=relevance_score,
             confidence=0.9,
-            details={
-                "text_length": len(text),
-                "evaluation_method": "llm"
-            },
-            evaluated_at=datetime.utcnow()
+            details=details,
+            evaluated_at=datetime.utcnow(),
+            content_hash=self._content_hash(title, content)
         )
         
-        await self.result_repo.save(result)
+        await writer.add(result)
         return result
     
-    async def evaluate_posts_batch(self, posts: List[Dict[str, Any]]) -> List[EvaluationResult]:
-        """게시글들을 일괄 평가합니다."""
-        results = []
+    async def evaluate_posts_batch(
+        self,
+        posts: List[Dict[str, Any]],
+        on_flush: Optional[FlushCallback] = None
+    ) -> List[EvaluationResult]:
+        """게시글들을 일괄 평가합니다.
         
-        for post in posts:
+        제목+본문이 바뀌지 않은 게시글은 기존 평가 결과를 그대로 반환합니다 (incremental).
+        키워드가 없고 반응이 낮은 게시글은 사전 필터에서 LLM 없이 관련 없음으로 처리합니다.
+        LLM 클라이언트가 evaluate_batch를 지원하면 여러 게시글을 하나의 프롬프트로 묶어 평가하고,
+        그렇지 않으면 게시글마다 관련성/카테고리 프롬프트를 동시에 보냅니다.
+        결과는 모아서 일괄 저장하며, 저장할 때마다 on_flush로 저장된 결과들을 알립니다.
+        """
+        writer = self.result_writer(on_flush)
+        try:
+            results, posts, verdicts = await self._screen_posts(posts, writer)
+            return results + await self._evaluate_with_llm(posts, verdicts, writer)
+        finally:
+            await writer.flush()
+    
+    @property
+    def supports_batch_jobs(self) -> bool:
+        """LLM 클라이언트가 제공자 배치 작업 API를 지원하는지 여부."""
+        return bool(getattr(self.llm_client, "supports_batch_jobs", False))
+    
+    async def submit_evaluation_job(
+        self,
+        posts: List[Dict[str, Any]],
+        on_flush: Optional[FlushCallback] = None
+    ) -> EvaluationJob:
+        """사전 필터/캐스케이드를 적용하고 나머지 게시글을 하나의 제공자 배치 작업으로 제출합니다.
+        
+        배치 작업은 요청/응답 경로보다 저렴하고 처리량이 높지만 결과가 늦게 나오므로
+        지연에 민감하지 않은 야간 평가에 사용합니다.
+        """
+        writer = self.result_writer(on_flush)
+        try:
+            results, posts, verdicts = await self._screen_posts(posts, writer)
+        finally:
+            await writer.flush()
+        job = await self.llm_client.submit_evaluation_job(posts) if posts else None
+        return EvaluationJob(job=job, posts=posts, results=results, verdicts=verdicts)
+    
+    async def collect_evaluation_job(
+        self,
+        job: EvaluationJob,
+        on_flush: Optional[FlushCallback] = None
+    ) -> Optional[List[EvaluationResult]]:
+        """배치 작업이 끝났으면 결과를 일괄 저장하고 전체 평가 결과를 반환합니다 (진행 중이면 None).
+        
+        배치 작업 응답에서 빠진 게시글은 요청/응답 경로로 다시 평가합니다.
+        """
+        if job.job is None:
+            return list(job.results)
+        
+        evaluations = await self.llm_client.collect_evaluation_job(job.job)
+        if evaluations is None:
+            return None
+        
+        posts_by_id = {str(post["id"]): post for post in job.posts}
+        latency_ms = (time.time() - job.submitted_at) * 1000
+        results = [
+            self._batch_result(posts_by_id[evaluation["id"]], evaluation, "llm_batch_job", job.verdicts, latency_ms)
+            for evaluation in evaluations if evaluation["id"] in posts_by_id
+        ]
+        writer = self.result_writer(on_flush)
+        try:
+            for result in results:
+                await writer.add(result)
+            
+            evaluated = {str(result.post_id) for result in results}
+            missing = [post for post in job.posts if str(post["id"]) not in evaluated]
+            if missing:
+                results.extend(await self._evaluate_with_llm(missing, job.verdicts, writer))
+        finally:
+            await writer.flush()
+        return job.results + results
+    
+    async def _screen_posts(
+        self,
+        posts: List[Dict[str, Any]],
+        writer: ResultWriter
+    ) -> Tuple[List[EvaluationResult], List[Dict[str, Any]], Dict[str, CascadeVerdict]]:
+        """중복 제외, 기존 평가 재사용, 키워드 사전 필터, 캐스케이드 1단계를 적용합니다.
+        
+        Returns:
+            (LLM 없이 확정된 결과들, 대형 모델로 평가할 게시글들, 넘긴 게시글 ID별 1단계 판정)
+        """
+        # 수집 단계에서 유사 중복으로 표시된 게시글은 원본만 평가
+        posts = [post for post in posts if not post.get("duplicate_of")]
+        
+        results: List[EvaluationResult] = []
+        if self.incremental:
+            results, posts = await self._reuse_existing(posts)
+            await writer.report(results)
+        
+        skipped, posts = await self._apply_prefilter(posts, writer)
+        results.extend(skipped)
+        
+        verdicts: Dict[str, CascadeVerdict] = {}
+        if self.cascade is not None:
+            accepted, posts, verdicts = await self._apply_cascade(posts, writer)
+            results.extend(accepted)
+        return results, posts, verdicts
+    
+    async def _reuse_existing(self, posts: List[Dict[str, Any]]) -> Tuple[List[EvaluationResult], List[Dict[str, Any]]]:
+        """제목+본문 해시가 같은 기존 평가 결과를 한 번의 조회로 찾아 재사용합니다.
+        
+        Returns:
+            (재사용한 기존 결과들, 새로 평가할 신규/변경 게시글들)
+        """
+        hashes = {str(post["id"]): self._content_hash(post["title"], post["content"]) for post in posts}
+        if not hashes:
+            return [], posts
+        
+        # 같은 내용을 여러 번 평가했으면 가장 최근 결과 사용
+        existing: Dict[str, EvaluationResult] = {}
+        for result in await self.result_repo.list_by_content_hashes(hashes):
+            post_id = str(result.post_id)
+            if post_id not in existing or result.evaluated_at > existing[post_id].evaluated_at:
+                existing[post_id] = result
+        
+        reused = [existing[str(post["id"])] for post in posts if str(post["id"]) in existing]
+        remaining = [post for post in posts if str(post["id"]) not in existing]
+        return reused, remaining
+    
+    def _content_hash(self, title: str, content: str) -> str:
+        return content_hash(title, content, self.content_version)
+    
+    async def _evaluate_with_llm(
+        self,
+        posts: List[Dict[str, Any]],
+        verdicts: Dict[str, CascadeVerdict],
+        writer: ResultWriter
+    ) -> List[EvaluationResult]:
+        """게시글들을 배치 프롬프트(지원 시) 또는 게시글별 프롬프트로 평가합니다."""
+        if not posts:
+            return []
+        if hasattr(self.llm_client, "evaluate_batch"):
             try:
-                result = await self.evaluate_post(
-                    post["id"],
-                    post["title"],
-                    post["content"]
-                )
-                results.append(result)
+                return await self._evaluate_with_batch_prompts(posts, writer, verdicts)
             except Exception as e:
-                print(f"Failed to evaluate post {post['id']}: {e}")
+                logger.warning(f"배치 평가 실패, 게시글별 프롬프트로 대체합니다: {e}")
+        
+        # 게시글별 평가를 동시에 실행 (요청 속도는 LLM 서비스의 스케줄러가 RPM/TPM 한도로 조절)
+        evaluations = await asyncio.gather(
+            *(
+                self._evaluate_post_with_llm(post["id"], post["title"], post["content"], writer, verdicts.get(str(post["id"])))
+                for post in posts
+            ),
+            return_exceptions=True
+        )
+        results = []
+        for post, result in zip(posts, evaluations):
+            if isinstance(result, BaseException):
+                logger.warning(f"게시글 {post['id']} 평가 실패: {result}")
+            else:
+                results.append(result)
         
         return results
+    
+    async def _apply_prefilter(
+        self,
+        posts: List[Dict[str, Any]],
+        writer: ResultWriter
+    ) -> Tuple[List[EvaluationResult], List[Dict[str, Any]]]:
+        """키워드 사전 필터로 LLM 평가가 필요 없는 게시글을 관련 없음으로 저장합니다.
+        
+        Returns:
+            (사전 필터로 처리된 결과들, LLM으로 평가할 게시글들)
+        """
+        skipped = []
+        remaining = []
+        
+        for post in posts:
+            needs_llm, match = self.prefilter.check(post)
+            if needs_llm:
+                remaining.append(post)
+                continue
+            
+            result = EvaluationResult(
+                id=f"eval_{post['id']}_{datetime.utcnow().timestamp()}",
+                post_id=post["id"],
+                is_relevant=False,
+                category="OTHER",
+                relevance_score=0.0,
+                confidence=0.9,
+                details={
+                    "text_length": len(post["title"]) + len(post["content"]) + 1,
+                    "evaluation_method": "keyword_prefilter",
+                    "keyword_hits": match.total,
+                    "engagement": engagement_score(post)
+                },
+                evaluated_at=datetime.utcnow(),
+                content_hash=self._content_hash(post["title"], post["content"])
+            )
+            await writer.add(result)
+            skipped.append(result)
+        
+        return skipped, remaining
+    
+    async def _apply_cascade(
+        self,
+        posts: List[Dict[str, Any]],
+        writer: ResultWriter
+    ) -> Tuple[List[EvaluationResult], List[Dict[str, Any]], Dict[str, CascadeVerdict]]:
+        """1단계 모델로 모든 게시글을 동시에 평가하고, 확실한 게시글의 결과를 저장합니다.
+        
+        Returns:
+            (1단계에서 확정된 결과들, 대형 모델로 넘길 게시글들, 넘긴 게시글 ID별 1단계 판정)
+        """
+        verdicts = await asyncio.gather(
+            *(self.cascade.first_pass(f"{post['title']}\n{post['content']}") for post in posts)
+        )
+        
+        accepted = []
+        escalated = []
+        escalated_verdicts = {}
+        for post, verdict in zip(posts, verdicts):
+            if verdict.escalated:
+                escalated.append(post)
+                escalated_verdicts[str(post["id"])] = verdict
+            else:
+                accepted.append(await self._save_cascade_result(post["id"], post["title"], post["content"], verdict, writer))
+        
+        return accepted, escalated, escalated_verdicts
+    
+    async def _save_cascade_result(
+        self,
+        post_id: str,
+        title: str,
+        content: str,
+        verdict: CascadeVerdict,
+        writer: ResultWriter
+    ) -> EvaluationResult:
+        """1단계 모델 판정을 평가 결과로 저장합니다."""
+        details = {
+            "text_length": len(title) + len(content) + 1,
+            "evaluation_method": "cascade_tier1",
+            "cascade": dict(verdict.details(), tier=1),
+        }
+        if verdict.summary:
+            details["summary"] = verdict.summary
+        
+        result = EvaluationResult(
+            id=f"eval_{post_id}_{datetime.utcnow().timestamp()}",
+            post_id=post_id,
+            is_relevant=verdict.is_relevant,
+            category=verdict.category,
+            relevance_score=verdict.relevance_score,
+            confidence=verdict.confidence,
+            details=details,
+            evaluated_at=datetime.utcnow(),
+            content_hash=self._content_hash(title, content)
+        )
+        await writer.add(result)
+        return result
+    
+    def _escalated_details(self, verdict: CascadeVerdict, tier2_latency_ms: float) -> Dict[str, Any]:
+        """대형 모델로 넘긴 게시글의 details["cascade"]를 만들고 2단계 지연을 기록합니다."""
+        self.cascade.record_tier2_latency(tier2_latency_ms)
+        return dict(verdict.details(), tier=2, tier2_latency_ms=round(tier2_latency_ms, 1))
+    
+    def cascade_stats(self) -> Dict[str, Any]:
+        """캐스케이드 통계 (에스컬레이션 비율, 단계별 평균 지연)를 반환합니다."""
+        return self.cascade.stats.as_dict() if self.cascade is not None else {"enabled": False}
+    
+    async def _evaluate_with_batch_prompts(
+        self,
+        posts: List[Dict[str, Any]],
+        writer: ResultWriter,
+        verdicts: Optional[Dict[str, CascadeVerdict]] = None
+    ) -> List[EvaluationResult]:
+        """배치 프롬프트로 평가하고 결과를 EvaluationResult로 변환하여 저장합니다."""
+        posts_by_id = {str(post["id"]): post for post in posts}
+        verdicts = verdicts or {}
+        results = []
+        
+        started = time.perf_counter()
+        evaluations = await self.llm_client.evaluate_batch(posts)
+        # 배치 호출 시간을 게시글마다 2단계 지연으로 기록
+        batch_latency_ms = (time.perf_counter() - started) * 1000
+        
+        for evaluation in evaluations:
+            result = self._batch_result(posts_by_id[evaluation["id"]], evaluation, "llm_batch", verdicts, batch_latency_ms)
+            await writer.add(result)
+            results.append(result)
+        
+        return results
+    
+    def _batch_result(
+        self,
+        post: Dict[str, Any],
+        evaluation: Dict[str, Any],
+        method: str,
+        verdicts: Dict[str, CascadeVerdict],
+        latency_ms: float
+    ) -> EvaluationResult:
+        """evaluate_batch 형식의 평가를 EvaluationResult로 변환합니다."""
+        details = {
+            "text_length": len(post["title"]) + len(post["content"]) + 1,
+            "evaluation_method": method,
+            "batch_size": evaluation.get("batch_size", 1)
+        }
+        if evaluation["id"] in verdicts:
+            details["cascade"] = self._escalated_details(verdicts[evaluation["id"]], latency_ms)
+        return EvaluationResult(
+            id=f"eval_{evaluation['id']}_{datetime.utcnow().timestamp()}",
+            post_id=post["id"],
+            is_relevant=evaluation["is_relevant"],
+            category=evaluation["category"],
+            relevance_score=evaluation["relevance_score"],
+            confidence=0.9,
+            details=details,
+            evaluated_at=datetime.utcnow(),
+            content_hash=self._content_hash(post["title"], post["content"])
+        )
 
 
 class RelevanceEvaluationService:
     """관련성 평가 서비스."""
     
-    def __init__(self, llm_client, result_repo: EvaluationResultRepository):
+    def __init__(
+        self,
+        llm_client,
+        result_repo: EvaluationResultRepository,
+        matcher: Optional[KeywordMatcher] = None,
+        prefilter: Optional[RelevancePrefilter] = None,
+        write_batch_size: int = 100,
+        write_interval: float = 1.0
+    ):
         self.llm_client = llm_client
         self.result_repo = result_repo
-        self.keywords = ["통신", "5G", "이통", "KT", "SKT", "LGU", "방통위", "KAIT"]
+        self.matcher = matcher or get_keyword_matcher()
+        self.keywords = self.matcher.keywords
+        self.prefilter = prefilter if prefilter is not None else RelevancePrefilter(self.matcher)
+        self.write_batch_size = write_batch_size
+        self.write_interval = write_interval
     
-    async def evaluate_relevance(self, post_id: str, title: str, content: str) -> EvaluationResult:
-        """게시글의 관련성을 평가합니다."""
+    def result_writer(self, on_flush: Optional[FlushCallback] = None) -> ResultWriter:
+        """평가 한 번 동안 결과를 모아 일괄 저장하는 writer를 만듭니다."""
+        return ResultWriter(self.result_repo, self.write_batch_size, self.write_interval, on_flush)
+    
+    async def evaluate_relevance(
+        self,
+        post_id: str,
+        title: str,
+        content: str,
+        engagement: int = 0,
+        writer: Optional[ResultWriter] = None
+    ) -> EvaluationResult:
+        """게시글의 관련성을 평가합니다 (키워드가 없고 반응이 낮으면 LLM을 호출하지 않음).
+        
+        writer를 주면 결과를 writer에 모아 일괄 저장하고, 없으면 바로 저장합니다.
+        """
         text = f"{title}\n{content}"
         
-        # 키워드 매칭
-        keywords_found = [kw for kw in self.keywords if kw in text]
+        # 키워드 매칭 (별칭 포함, 한 번의 스캔)
+        match = self.matcher.match(text)
+        keywords_found = match.keywords
         
         # LLM 관련성 평가
-        is_relevant = await self.llm_client.is_relevant(text)
+        if self.prefilter.needs_llm(match, engagement):
+            is_relevant = await self.llm_client.is_relevant(text)
+            llm_score = 0.8 if is_relevant else 0.2
+            evaluation_method = "hybrid"
+        else:
+            is_relevant = False
+            llm_score = 0.0
+            evaluation_method = "keyword_prefilter"
         
         # 점수 계산
         keyword_score = min(len(keywords_found) / len(self.keywords), 1.0)
-        llm_score = 0.8 if is_relevant else 0.2
         relevance_score = (keyword_score + llm_score) / 2
         
         result = EvaluationResult(
-            id=f"relevance_{datetime.utcnow().timestamp()}",
+            id=f"relevance_{post_id}_{datetime.utcnow().timestamp()}",
             post_id=post_id,
             is_relevant=is_relevant,
             category="relevance_check",
@@ -95,12 +512,16 @@ class RelevanceEvaluationService:
             confidence=0.8,
             details={
                 "keywords_found": keywords_found,
+                "keyword_counts": match.counts,
                 "keyword_score": keyword_score,
                 "llm_score": llm_score,
-                "evaluation_method": "hybrid"
+                "evaluation_method": evaluation_method
             },
             evaluated_at=datetime.utcnow()
         )
         
-        await self.result_repo.save(result)
+        if writer is not None:
+            await writer.add(result)
+        else:
+            await self.result_repo.save(result)
         return result
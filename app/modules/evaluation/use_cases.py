@@ -2,24 +2,168 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Callable, ContextManager, Iterator, Optional
 from datetime import datetime
 from .entities import EvaluationResult, EvaluationSession, EvaluationStatus
-from .services import LLMEvaluationService, RelevanceEvaluationService
+from .keywords import engagement_score
+from .services import EvaluationJob, LLMEvaluationService, RelevanceEvaluationService
 from .repositories import EvaluationResultRepository, EvaluationSessionRepository
+from .writer import FlushCallback
+
+logger = logging.getLogger(__name__)
+
+
+class _NoUsage:
+    """사용량 계측이 없을 때의 빈 집계."""
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {}
+
+
+@contextmanager
+def _untracked() -> Iterator[_NoUsage]:
+    yield _NoUsage()
+
+
+# 블록 안의 LLM 호출을 집계하는 컨텍스트 매니저 팩토리 (as_dict()를 가진 집계를 yield)
+UsageTracker = Callable[[], ContextManager[Any]]
+
+
+def _session_progress(session: EvaluationSession, session_repo: EvaluationSessionRepository) -> FlushCallback:
+    """결과가 저장될 때마다 세션 카운터를 늘리고 세션을 저장하는 콜백 (평가 중 진행 상황 확인용)."""
+    async def on_flush(results: List[EvaluationResult]) -> None:
+        relevant = sum(1 for r in results if r.is_relevant)
+        session.evaluated_posts += len(results)
+        session.relevant_posts += relevant
+        session.irrelevant_posts += len(results) - relevant
+        try:
+            await session_repo.save(session)
+        except Exception as e:
+            # 진행 상황 저장 실패로 평가를 중단하지 않음 (완료 시 다시 저장)
+            logger.warning(f"평가 세션 {session.id} 진행 상황 저장 실패: {e}")
+    return on_flush
 
 
 class EvaluatePostsUseCase:
-    """게시글 평가 유즈케이스."""
+    """게시글 평가 유즈케이스.
+    
+    mode="sync"는 요청/응답 경로로 바로 평가하고, mode="batch_job"은 게시글들을 하나의
+    제공자 배치 작업으로 제출한 뒤 백그라운드에서 완료를 확인하여 결과를 일괄 저장합니다.
+    """
     
-    def __init__(self, llm_service: LLMEvaluationService, session_repo: EvaluationSessionRepository):
+    MODE_SYNC = "sync"
+    MODE_BATCH_JOB = "batch_job"
+    
+    def __init__(
+        self,
+        llm_service: LLMEvaluationService,
+        session_repo: EvaluationSessionRepository,
+        poll_interval: float = 60.0,
+        job_timeout: float = 24 * 3600,
+        usage_tracker: Optional[UsageTracker] = None
+    ):
         self.llm_service = llm_service
         self.session_repo = session_repo
+        self.poll_interval = poll_interval
+        self.job_timeout = job_timeout
+        self.usage_tracker = usage_tracker or _untracked
+        self._batch_jobs: Dict[str, asyncio.Task] = {}
     
-    async def execute(self, posts: List[Dict[str, Any]]) -> List[EvaluationResult]:
-        """게시글들을 평가합니다."""
+    async def execute(self, posts: List[Dict[str, Any]], mode: str = MODE_SYNC) -> List[EvaluationResult]:
+        """게시글들을 평가합니다 (batch_job 모드는 배치 작업이 끝날 때까지 기다림)."""
+        if mode == self.MODE_BATCH_JOB:
+            session = await self.submit_batch_job(posts)
+            return await self.wait_for_batch_job(session.id)
+        
         # 평가 세션 시작
-        session = EvaluationSession(
+        session = self._new_session(posts)
+        await self.session_repo.save(session)
+        
+        with self.usage_tracker() as usage:
+            try:
+                # 게시글들 평가
+                results = await self.llm_service.evaluate_posts_batch(
+                    posts, on_flush=_session_progress(session, self.session_repo)
+                )
+                session.llm_usage = usage.as_dict()
+                await self._complete_session(session, results)
+                return results
+                
+            except Exception as e:
+                session.llm_usage = usage.as_dict()
+                await self._fail_session(session, e)
+                raise
+    
+    async def submit_batch_job(self, posts: List[Dict[str, Any]]) -> EvaluationSession:
+        """게시글들을 제공자 배치 작업으로 제출하고, 완료 확인은 백그라운드 작업으로 넘깁니다.
+        
+        LLM 클라이언트가 배치 작업을 지원하지 않으면 백그라운드에서 요청/응답 경로로 평가합니다.
+        결과는 wait_for_batch_job(session.id)으로 기다릴 수 있습니다.
+        """
+        session = self._new_session(posts)
+        await self.session_repo.save(session)
+        
+        job = None
+        try:
+            if self.llm_service.supports_batch_jobs:
+                job = await self.llm_service.submit_evaluation_job(
+                    posts, on_flush=_session_progress(session, self.session_repo)
+                )
+                session.batch_job_id = job.job["id"] if job.job else None
+                await self.session_repo.save(session)
+        except Exception as e:
+            await self._fail_session(session, e)
+            raise
+        
+        self._batch_jobs[session.id] = asyncio.create_task(self._run_batch_job(session, posts, job))
+        return session
+    
+    async def wait_for_batch_job(self, session_id: str) -> List[EvaluationResult]:
+        """백그라운드 배치 작업이 끝날 때까지 기다려 평가 결과를 반환합니다."""
+        task = self._batch_jobs[session_id]
+        try:
+            return await task
+        finally:
+            self._batch_jobs.pop(session_id, None)
+    
+    async def _run_batch_job(
+        self,
+        session: EvaluationSession,
+        posts: List[Dict[str, Any]],
+        job: Optional[EvaluationJob]
+    ) -> List[EvaluationResult]:
+        """배치 작업이 끝날 때까지 poll_interval마다 확인하고, 끝나면 세션을 완료합니다."""
+        progress = _session_progress(session, self.session_repo)
+        with self.usage_tracker() as usage:
+            try:
+                if job is None:
+                    results = await self.llm_service.evaluate_posts_batch(posts, on_flush=progress)
+                else:
+                    deadline = time.monotonic() + self.job_timeout
+                    while True:
+                        results = await self.llm_service.collect_evaluation_job(job, on_flush=progress)
+                        if results is not None:
+                            break
+                        if time.monotonic() >= deadline:
+                            raise TimeoutError(f"Batch job {session.batch_job_id} did not finish in {self.job_timeout}s")
+                        await asyncio.sleep(self.poll_interval)
+                
+                session.llm_usage = usage.as_dict()
+                await self._complete_session(session, results)
+                return results
+            
+            except Exception as e:
+                session.llm_usage = usage.as_dict()
+                await self._fail_session(session, e)
+                raise
+    
+    def _new_session(self, posts: List[Dict[str, Any]]) -> EvaluationSession:
+        """진행 중 상태의 평가 세션을 만듭니다."""
+        return EvaluationSession(
             id=f"eval_session_{datetime.utcnow().timestamp()}",
             total_posts=len(posts),
             evaluated_posts=0,
@@ -30,39 +174,36 @@ class EvaluatePostsUseCase:
             completed_at=None,
             error_message=None
         )
-        
+    
+    async def _complete_session(self, session: EvaluationSession, results: List[EvaluationResult]) -> None:
+        # 세션 통계 업데이트
+        session.evaluated_posts = len(results)
+        session.relevant_posts = sum(1 for r in results if r.is_relevant)
+        session.irrelevant_posts = sum(1 for r in results if not r.is_relevant)
+        session.status = EvaluationStatus.COMPLETED
+        session.completed_at = datetime.utcnow()
+        await self.session_repo.save(session)
+    
+    async def _fail_session(self, session: EvaluationSession, error: BaseException) -> None:
+        # 세션 실패
+        session.status = EvaluationStatus.FAILED
+        session.error_message = str(error)
+        session.completed_at = datetime.utcnow()
         await self.session_repo.save(session)
-        
-        try:
-            # 게시글들 평가
-            results = await self.llm_service.evaluate_posts_batch(posts)
-            
-            # 세션 통계 업데이트
-            session.evaluated_posts = len(results)
-            session.relevant_posts = sum(1 for r in results if r.is_relevant)
-            session.irrelevant_posts = sum(1 for r in results if not r.is_relevant)
-            session.status = EvaluationStatus.COMPLETED
-            session.completed_at = datetime.utcnow()
-            
-            await self.session_repo.save(session)
-            
-            return results
-            
-        except Exception as e:
-            # 세션 실패
-            session.status = EvaluationStatus.FAILED
-            session.error_message = str(e)
-            session.completed_at = datetime.utcnow()
-            await self.session_repo.save(session)
-            raise
 
 
 class EvaluateRelevanceUseCase:
     """관련성 평가 유즈케이스."""
     
-    def __init__(self, relevance_service: RelevanceEvaluationService, session_repo: EvaluationSessionRepository):
+    def __init__(
+        self,
+        relevance_service: RelevanceEvaluationService,
+        session_repo: EvaluationSessionRepository,
+        usage_tracker: Optional[UsageTracker] = None
+    ):
         self.relevance_service = relevance_service
         self.session_repo = session_repo
+        self.usage_tracker = usage_tracker or _untracked
     
     async def execute(self, posts: List[Dict[str, Any]]) -> List[EvaluationResult]:
         """게시글들의 관련성을 평가합니다."""
@@ -81,34 +222,49 @@ class EvaluateRelevanceUseCase:
         
         await self.session_repo.save(session)
         
-        try:
-            results = []
-            for post in posts:
-                try:
-                    result = await self.relevance_service.evaluate_relevance(
-                        post["id"],
-                        post["title"],
-                        post["content"]
-                    )
-                    results.append(result)
-                except Exception as e:
-                    print(f"Failed to evaluate relevance for post {post['id']}: {e}")
-            
-            # 세션 통계 업데이트
-            session.evaluated_posts = len(results)
-            session.relevant_posts = sum(1 for r in results if r.is_relevant)
-            session.irrelevant_posts = sum(1 for r in results if not r.is_relevant)
-            session.status = EvaluationStatus.COMPLETED
-            session.completed_at = datetime.utcnow()
-            
-            await self.session_repo.save(session)
-            
-            return results
-            
-        except Exception as e:
-            # 세션 실패
-            session.status = EvaluationStatus.FAILED
-            session.error_message = str(e)
-            session.completed_at = datetime.utcnow()
-            await self.session_repo.save(session)
-            raise
+        # 결과는 모아서 일괄 저장하고, 저장할 때마다 세션 진행 상황을 갱신
+        writer = self.relevance_service.result_writer(_session_progress(session, self.session_repo))
+        with self.usage_tracker() as usage:
+            try:
+                results = []
+                # 게시글별 평가를 동시에 실행 (요청 속도는 LLM 서비스의 스케줄러가 조절)
+                evaluations = await asyncio.gather(
+                    *(
+                        self.relevance_service.evaluate_relevance(
+                            post["id"],
+                            post["title"],
+                            post["content"],
+                            engagement=engagement_score(post),
+                            writer=writer
+                        )
+                        for post in posts
+                    ),
+                    return_exceptions=True
+                )
+                await writer.flush()
+                for post, result in zip(posts, evaluations):
+                    if isinstance(result, BaseException):
+                        print(f"Failed to evaluate relevance for post {post['id']}: {result}")
+                    else:
+                        results.append(result)
+                
+                # 세션 통계 업데이트
+                session.evaluated_posts = len(results)
+                session.relevant_posts = sum(1 for r in results if r.is_relevant)
+                session.irrelevant_posts = sum(1 for r in results if not r.is_relevant)
+                session.status = EvaluationStatus.COMPLETED
+                session.completed_at = datetime.utcnow()
+                session.llm_usage = usage.as_dict()
+                
+                await self.session_repo.save(session)
+                
+                return results
+                
+            except Exception as e:
+                # 세션 실패
+                session.status = EvaluationStatus.FAILED
+                session.error_message = str(e)
+                session.completed_at = datetime.utcnow()
+                session.llm_usage = usage.as_dict()
+                await self.session_repo.save(session)
+                raise
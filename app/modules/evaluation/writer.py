@@ -0,0 +1,85 @@
+"""평가 결과 일괄 저장 - 결과를 모아 save_many 한 번으로 쓰고, 저장할 때마다 진행 상황을 알립니다.
+
+게시글마다 result_repo.save를 기다리면 DB 왕복이 평가 루프를 직렬화하므로, 평가 한 번(run)마다
+ResultWriter를 만들어 결과를 버퍼에 모으고 max_size개가 모이거나 max_delay초가 지나면
+순서 없는 일괄 쓰기로 저장합니다. 평가가 끝나면 flush()로 남은 결과를 저장합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+from .entities import EvaluationResult
+from .repositories import EvaluationResultRepository
+
+logger = logging.getLogger(__name__)
+
+# 저장된(또는 재사용한) 결과들을 받는 진행 상황 콜백 (예: 세션 카운터 갱신)
+FlushCallback = Callable[[List[EvaluationResult]], Awaitable[None]]
+
+
+class ResultWriter:
+    """평가 결과를 버퍼에 모아 크기 또는 시간 기준으로 save_many 합니다."""
+
+    def __init__(
+        self,
+        result_repo: EvaluationResultRepository,
+        max_size: int = 100,
+        max_delay: float = 1.0,
+        on_flush: Optional[FlushCallback] = None
+    ):
+        self.result_repo = result_repo
+        self.max_size = max(1, max_size)
+        self.max_delay = max_delay
+        self.on_flush = on_flush
+        self.saved = 0
+        self._pending: List[EvaluationResult] = []
+        self._timer: Optional[asyncio.Task] = None
+        # 진행 상황 콜백은 순서대로 실행 (세션 저장이 이전 카운터로 덮어쓰지 않도록)
+        self._progress_lock = asyncio.Lock()
+
+    async def add(self, result: EvaluationResult) -> None:
+        """결과를 버퍼에 추가하고, max_size개가 모이면 저장합니다."""
+        self._pending.append(result)
+        if len(self._pending) >= self.max_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_delay())
+
+    async def report(self, results: List[EvaluationResult]) -> None:
+        """이미 저장된 결과(증분 평가에서 재사용)를 저장하지 않고 진행 상황에만 반영합니다."""
+        if results:
+            await self._notify(results)
+
+    async def flush(self) -> None:
+        """버퍼의 결과를 한 번의 일괄 쓰기로 저장합니다 (실패하면 결과를 버퍼에 되돌리고 예외 전달)."""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            await self.result_repo.save_many(batch)
+        except Exception:
+            self._pending[:0] = batch
+            raise
+        self.saved += len(batch)
+        await self._notify(batch)
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self.max_delay)
+        try:
+            await self.flush()
+        except Exception as e:
+            # 남은 결과는 다음 flush에서 다시 저장
+            logger.warning(f"평가 결과 저장 실패 (다음 flush에서 재시도): {e}")
+
+    async def _notify(self, results: List[EvaluationResult]) -> None:
+        if self.on_flush is None:
+            return
+        async with self._progress_lock:
+            await self.on_flush(results)
@@ -0,0 +1,191 @@
+"""스토리 클러스터링 - MinHash LSH로 여러 소스의 관련 게시글을 하나의 스토리로 묶습니다.
+
+연합뉴스 기사, 전자신문 후속 기사, 뽐뿌 토론 글처럼 같은 사건을 다루는 게시글을 한
+클러스터로 묶고, 클러스터마다 대표 게시글 하나만 평가/요약하도록 합니다.
+"""
+
+from __future__ import annotations
+
+import random
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from app.modules.crawling.fingerprints import normalize_text, shingles
+
+# 해시 순열에 사용하는 메르센 소수 (2^31 - 1) - 곱셈 결과가 uint64 범위를 넘지 않음
+_PRIME = (1 << 31) - 1
+
+# 대표 게시글 선정 우선순위 (낮을수록 우선)
+_POST_TYPE_PRIORITY = {"news": 0, "government": 1, "community": 2}
+
+Signature = Tuple[int, ...]
+
+
+class MinHasher:
+    """문자 n-gram 집합의 MinHash 시그니처를 계산합니다."""
+
+    def __init__(self, num_perm: int = 120, shingle_size: int = 3, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+        if np is not None:
+            self._a_np = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_np = np.array(self._b, dtype=np.uint64)[:, None]
+
+    def signature(self, text: str) -> Signature:
+        """텍스트의 MinHash 시그니처를 계산합니다."""
+        grams = shingles(normalize_text(text), self.shingle_size)
+        if not grams:
+            return (_PRIME,) * self.num_perm
+
+        hashes = [zlib.crc32(gram.encode("utf-8")) % _PRIME for gram in grams]
+        if np is not None:
+            values = np.array(hashes, dtype=np.uint64)[None, :]
+            return tuple(((self._a_np * values + self._b_np) % _PRIME).min(axis=1).tolist())
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in zip(self._a, self._b))
+
+
+def estimate_jaccard(first: Signature, second: Signature) -> float:
+    """두 MinHash 시그니처로 Jaccard 유사도를 추정합니다."""
+    if not first:
+        return 0.0
+    return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+
+class LSHIndex:
+    """MinHash LSH 인덱스 - 밴드 단위 해시로 유사 후보를 찾습니다."""
+
+    def __init__(self, bands: int, rows: int):
+        self.bands = bands
+        self.rows = rows
+        self._buckets: List[Dict[Tuple[int, ...], List[str]]] = [{} for _ in range(bands)]
+
+    def _band_keys(self, signature: Signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def add(self, key: str, signature: Signature) -> None:
+        """시그니처를 인덱스에 추가합니다."""
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def candidates(self, signature: Signature) -> Set[str]:
+        """적어도 한 밴드가 일치하는 후보 키들을 반환합니다."""
+        found: Set[str] = set()
+        for band, band_key in self._band_keys(signature):
+            found.update(self._buckets[band].get(band_key, ()))
+        return found
+
+
+@dataclass
+class StoryCluster:
+    """스토리 클러스터 - 같은 사건을 다루는 게시글 묶음."""
+    id: str                                   # 클러스터 ID (대표 게시글 ID 기반)
+    representative: Dict[str, Any]            # 평가/요약할 대표 게시글
+    members: List[Dict[str, Any]]             # 대표를 포함한 이번 실행의 게시글들
+    related_history: List[str] = field(default_factory=list)  # 최근 N일 내 관련 게시글 ID
+
+
+class StoryClusterer:
+    """MinHash LSH 기반 스토리 클러스터러."""
+
+    def __init__(
+        self,
+        threshold: float = 0.3,
+        num_perm: int = 120,
+        bands: int = 40,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ):
+        """클러스터러를 초기화합니다.
+
+        Args:
+            threshold: 같은 스토리로 묶을 최소 추정 Jaccard 유사도
+            num_perm: MinHash 순열 수 (bands로 나누어 떨어져야 함)
+            bands: LSH 밴드 수 (후보 임계값 ≈ (1/bands)^(1/rows))
+            shingle_size: 문자 n-gram 크기
+            seed: 해시 순열 시드
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm, shingle_size, seed)
+
+    def _text(self, post: Dict[str, Any]) -> str:
+        return f"{post.get('title', '')}\n{post.get('content', '')}"
+
+    def cluster(self, posts: Sequence[Dict[str, Any]], history: Optional[Sequence[Dict[str, Any]]] = None) -> List[StoryCluster]:
+        """게시글들을 스토리 클러스터로 묶습니다.
+
+        Args:
+            posts: 이번 실행에서 수집된 게시글들 (id, title, content 필요)
+            history: 최근 N일 동안 수집된 게시글들 (관련 이력 표시용, 대표로 선정되지 않음)
+
+        Returns:
+            입력 순서를 따르는 스토리 클러스터 목록
+        """
+        index = LSHIndex(self.bands, self.rows)
+        signatures: Dict[str, Signature] = {}
+
+        history_ids: Set[str] = set()
+        for post in history or ():
+            key = f"history:{post['id']}"
+            signatures[key] = self.hasher.signature(self._text(post))
+            index.add(key, signatures[key])
+            history_ids.add(key)
+
+        parent = {post["id"]: post["id"] for post in posts}
+
+        def find(key: str) -> str:
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        related: Dict[str, Set[str]] = {}
+        for post in posts:
+            key = post["id"]
+            signature = self.hasher.signature(self._text(post))
+            for candidate in index.candidates(signature):
+                if estimate_jaccard(signature, signatures[candidate]) < self.threshold:
+                    continue
+                if candidate in history_ids:
+                    related.setdefault(key, set()).add(candidate.split(":", 1)[1])
+                else:
+                    parent[find(candidate)] = find(key)
+            signatures[key] = signature
+            index.add(key, signature)
+
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for post in posts:
+            groups.setdefault(find(post["id"]), []).append(post)
+
+        clusters = []
+        for members in groups.values():
+            representative = min(members, key=self._representative_rank)
+            history_links = sorted(set().union(*(related.get(m["id"], set()) for m in members)))
+            clusters.append(StoryCluster(
+                id=f"story_{representative['id']}",
+                representative=representative,
+                members=members,
+                related_history=history_links,
+            ))
+        return clusters
+
+    def _representative_rank(self, post: Dict[str, Any]):
+        """대표 게시글 선정 기준 - 뉴스 > 정부 > 커뮤니티, 그다음 본문 길이와 조회수."""
+        return (
+            _POST_TYPE_PRIORITY.get(post.get("post_type"), len(_POST_TYPE_PRIORITY)),
+            -len(post.get("content", "")),
+            -(post.get("views") or 0),
+        )
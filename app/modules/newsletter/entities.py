@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -27,6 +27,7 @@ class NewsletterItem:
     category: str            # 카테고리 (예: SKT, KT, LGU)
     relevance_score: float   # 관련성 점수 (0.0 ~ 1.0)
     created_at: datetime     # 생성 시간
+    related_urls: List[str] = field(default_factory=list)  # 같은 스토리의 다른 소스 URL들
 
 
 @dataclass
@@ -62,6 +62,12 @@ class TemplateService:
                     <h3>{item.title}</h3>
                     <p>{item.content[:100]}...</p>
                     <a href="{item.url}">자세히 보기</a>
+            """
+            if item.related_urls:
+                html += f"""
+                    <p>관련 기사 {len(item.related_urls)}건: {" ".join(f'<a href="{url}">[{i}]</a>' for i, url in enumerate(item.related_urls, 1))}</p>
+            """
+            html += """
                 </li>
             """
         
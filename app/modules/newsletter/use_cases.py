@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
-from datetime import datetime
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta
+from .clustering import StoryClusterer
 from .entities import Newsletter, NewsletterItem
 from .services import NewsletterService, TemplateService
 from .repositories import NewsletterRepository, SubscriberRepository
+from app.modules.crawling.entities import PostType, compact
+from app.modules.crawling.fingerprints import SimHashIndex, fingerprint
+from app.modules.crawling.repositories import CrawledPostRepository
+
+logger = logging.getLogger(__name__)
 
 
 class CreateNewsletterUseCase:
@@ -97,7 +105,15 @@ class DailyNewsletterUseCase:
         crawl_news_use_case=None,
         crawl_government_use_case=None,
         evaluate_posts_use_case=None,
-        email_sender=None
+        email_sender=None,
+        crawler_registry=None,
+        sources: Optional[List[str]] = None,
+        duplicate_index: Optional[SimHashIndex] = None,
+        story_clusterer: Optional[StoryClusterer] = None,
+        crawled_post_repository: Optional[CrawledPostRepository] = None,
+        cluster_window_days: int = 3,
+        llm_service=None,
+        summary_min_chars: int = 1500
     ):
         self.newsletter_service = newsletter_service
         self.template_service = template_service
@@ -106,6 +122,15 @@ class DailyNewsletterUseCase:
         self.crawl_government_use_case = crawl_government_use_case
         self.evaluate_posts_use_case = evaluate_posts_use_case
         self.email_sender = email_sender
+        self.crawler_registry = crawler_registry
+        self.sources = sources
+        self.duplicate_index = duplicate_index
+        self.story_clusterer = story_clusterer
+        self.crawled_post_repository = crawled_post_repository
+        self.cluster_window_days = cluster_window_days
+        # 긴 뉴스/정부 문서는 뉴스레터 아이템에 본문 대신 요약을 넣음
+        self.llm_service = llm_service
+        self.summary_min_chars = summary_min_chars
     
     async def execute(self) -> Dict[str, Any]:
         """일일 뉴스레터를 생성하고 발송합니다."""
@@ -116,9 +141,17 @@ class DailyNewsletterUseCase:
         crawled_posts = await self._crawl_all_sources()
         print(f"✅ 총 {len(crawled_posts)}개 게시글 크롤링 완료")
         
+        # 유사 중복 게시글은 LLM 평가 전에 제외
+        unique_posts = self._flag_near_duplicates(crawled_posts)
+        print(f"✅ 유사 중복 {len(crawled_posts) - len(unique_posts)}개 제외")
+        
+        # 같은 스토리를 다루는 게시글은 대표 게시글 하나만 평가
+        story_posts = await self._cluster_stories(unique_posts)
+        print(f"✅ {len(unique_posts)}개 게시글을 {len(story_posts)}개 스토리로 묶음")
+        
         # 2단계: LLM 평가 (Mock 데이터 사용)
         print("🧠 2단계: LLM 평가")
-        evaluated_posts = await self._evaluate_posts(crawled_posts)
+        evaluated_posts = await self._evaluate_posts(story_posts)
         print(f"✅ 총 {len(evaluated_posts)}개 게시글 평가 완료")
         
         # 3단계: 뉴스레터 생성
@@ -136,14 +169,124 @@ class DailyNewsletterUseCase:
         return {
             "newsletter_id": newsletter.id,
             "crawled_posts": len(crawled_posts),
+            "duplicate_posts": len(crawled_posts) - len(unique_posts),
+            "story_clusters": len(story_posts),
             "evaluated_posts": len(evaluated_posts),
             "newsletter_items": len(newsletter.items),
             "send_result": send_result
         }
     
     async def _crawl_all_sources(self) -> List[Dict[str, Any]]:
-        """모든 소스에서 데이터를 크롤링합니다 (Mock 데이터)."""
-        # Mock 데이터 반환
+        """모든 소스에서 데이터를 크롤링합니다 (레지스트리가 없으면 Mock 데이터)."""
+        if self.crawler_registry is None:
+            return self._mock_crawled_posts()
+        
+        sources = self.sources or self.crawler_registry.sources()
+        results = await asyncio.gather(
+            *(self._crawl_source(source) for source in sources),
+            return_exceptions=True
+        )
+        
+        # 모든 소스의 크롤링이 끝날 때까지는 압축 레코드로 보관하고, 게시글 딕셔너리는 마지막에 만듦
+        posts: List[Dict[str, Any]] = []
+        for source, result in zip(sources, results):
+            if isinstance(result, Exception):
+                print(f"❌ {source} 크롤링 실패: {result}")
+                continue
+            posts.extend(self._to_post_dict(record, source) for record in result)
+        return posts
+    
+    async def _crawl_source(self, source: str) -> List[Any]:
+        """레지스트리에서 크롤러를 가져와 한 소스를 크롤링하고, 결과를 압축 레코드로 반환합니다."""
+        config = self.crawler_registry.get_config(source)
+        crawler = self.crawler_registry.create(source)
+        items = await crawler.crawl(limit=config.get("limit", 10))
+        return [compact(item) for item in items]
+    
+    def _flag_near_duplicates(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """SimHash 지문으로 유사 중복 게시글에 duplicate_of를 표시하고, 원본 게시글만 반환합니다."""
+        index = self.duplicate_index if self.duplicate_index is not None else SimHashIndex()
+        unique_posts = []
+        
+        for post in posts:
+            if post.get("simhash") is None:
+                post["simhash"] = fingerprint(post.get("title", ""), post.get("content", ""))
+            if not post.get("duplicate_of"):
+                post["duplicate_of"] = index.check_and_add(post["id"], post["simhash"])
+            if not post["duplicate_of"]:
+                unique_posts.append(post)
+        
+        return unique_posts
+    
+    async def _cluster_stories(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """MinHash LSH로 관련 게시글을 스토리 클러스터로 묶고, 클러스터별 대표 게시글만 반환합니다.
+        
+        대표 게시글에는 cluster_id와 같은 스토리의 다른 게시글 URL(related_urls)을 추가합니다.
+        최근 cluster_window_days일 동안 저장된 게시글과 이어지는 스토리는 related_history로 표시합니다.
+        """
+        if self.story_clusterer is None or not posts:
+            return posts
+        
+        history = await self._load_story_history({post["url"] for post in posts if post.get("url")})
+        clusters = self.story_clusterer.cluster(posts, history)
+        
+        representatives = []
+        for cluster in clusters:
+            representative = cluster.representative
+            representative["cluster_id"] = cluster.id
+            representative["cluster_size"] = len(cluster.members)
+            representative["related_urls"] = [
+                member["url"] for member in cluster.members
+                if member is not representative and member.get("url")
+            ]
+            representative["related_history"] = cluster.related_history
+            representatives.append(representative)
+        return representatives
+    
+    async def _load_story_history(self, current_urls) -> List[Dict[str, Any]]:
+        """최근 N일 동안 저장된 게시글을 클러스터링 이력으로 불러옵니다 (실패 시 빈 목록).
+        
+        이번 실행 게시글은 이미 저장되었을 수 있으므로, 저장소의 upsert 키인 URL로 제외합니다
+        (저장된 게시글 ID는 크롤러 ID가 아닌 문서 ID).
+        """
+        if self.crawled_post_repository is None or self.cluster_window_days <= 0:
+            return []
+        
+        since = datetime.utcnow() - timedelta(days=self.cluster_window_days)
+        try:
+            stored_posts = await self.crawled_post_repository.list_since(since)
+        except Exception as e:
+            print(f"⚠️ 스토리 이력 조회 실패, 이번 실행 게시글만 클러스터링: {e}")
+            return []
+        
+        return [
+            {"id": post.id, "title": post.title, "content": post.content}
+            for post in stored_posts
+            if post.url not in current_urls and not post.duplicate_of
+        ]
+    
+    def _to_post_dict(self, record: Any, source: str) -> Dict[str, Any]:
+        """크롤링 레코드(엔티티 또는 Compact* 압축 표현)를 게시글 딕셔너리로 변환합니다."""
+        post_type = getattr(record, "post_type", None)
+        if post_type is None and self.crawler_registry is not None:
+            post_type = self.crawler_registry.get_spec(source).post_type
+        return {
+            "id": record.id,
+            "title": record.title,
+            "content": record.content,
+            "source": getattr(record, "source", None) or source,
+            "url": record.url,
+            "post_type": getattr(post_type, "value", post_type),
+            "author": getattr(record, "author", None) or getattr(record, "department", ""),
+            "views": getattr(record, "views", 0),
+            "likes": getattr(record, "likes", 0),
+            "comments": getattr(record, "comments", 0),
+            "simhash": getattr(record, "simhash", None),
+            "duplicate_of": getattr(record, "duplicate_of", None)
+        }
+    
+    def _mock_crawled_posts(self) -> List[Dict[str, Any]]:
+        """개발용 Mock 크롤링 데이터를 반환합니다."""
         return [
             {
                 "id": "mock_1",
@@ -179,20 +322,23 @@ class DailyNewsletterUseCase:
     
     async def _create_newsletter(self, posts: List[Dict[str, Any]]) -> Newsletter:
         """평가된 게시글들로 뉴스레터를 생성합니다."""
-        # 관련성 높은 게시글만 필터링
+        # 관련성 높은 게시글만 필터링 (_cluster_stories가 스토리마다 대표 게시글만 남기므로 추가 중복 제거 불필요)
         relevant_posts = [post for post in posts if post.get("relevance_score", 0) > 0.5]
         
+        await self._summarize_long_posts(relevant_posts)
+        
         # NewsletterItem으로 변환
         newsletter_items = [
             NewsletterItem(
                 id=f"item_{i}",
                 title=post["title"],
-                content=post["content"],
+                content=post.get("summary") or post["content"],
                 source=post["source"],
                 url=post["url"],
                 category=post.get("category", "general"),
                 relevance_score=post.get("relevance_score", 0.0),
-                created_at=datetime.utcnow()
+                created_at=datetime.utcnow(),
+                related_urls=post.get("related_urls", [])
             )
             for i, post in enumerate(relevant_posts)
         ]
@@ -201,6 +347,29 @@ class DailyNewsletterUseCase:
         title = f"일일 뉴스레터 - {datetime.utcnow().strftime('%Y년 %m월 %d일')}"
         return await self.newsletter_service.create_newsletter(newsletter_items, title)
     
+    async def _summarize_long_posts(self, posts: List[Dict[str, Any]]) -> None:
+        """summary_min_chars보다 긴 뉴스/정부 문서를 동시에 요약하여 post["summary"]에 넣습니다.
+        
+        긴 문서는 LLM 서비스가 조각별로 나누어 요약한 뒤 합칩니다 (맵리듀스).
+        """
+        if self.llm_service is None:
+            return
+        
+        long_posts = [
+            post for post in posts
+            if post.get("post_type") in (PostType.NEWS.value, PostType.GOVERNMENT.value)
+            and len(post.get("content") or "") > self.summary_min_chars
+        ]
+        summaries = await asyncio.gather(
+            *(self.llm_service.summarize(post["content"], sentences=3) for post in long_posts),
+            return_exceptions=True
+        )
+        for post, summary in zip(long_posts, summaries):
+            if isinstance(summary, BaseException):
+                logger.warning(f"게시글 {post['id']} 요약 실패, 본문 사용: {summary}")
+            elif summary:
+                post["summary"] = summary
+    
     async def _send_newsletter(self, newsletter: Newsletter) -> Dict[str, Any]:
         """뉴스레터를 이메일로 발송합니다."""
         # 템플릿 렌더링
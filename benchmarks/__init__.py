@@ -0,0 +1 @@
+"""Benchmarks - 성능 측정 스크립트들 (``python -m benchmarks.<name>``로 실행)."""
@@ -0,0 +1,101 @@
+"""크롤링 레코드 메모리 벤치마크 - CrawledPost 대비 CompactCrawledPost의 레코드당 메모리.
+
+실행:
+    python -m benchmarks.crawl_record_memory --posts 100000 [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from app.modules.crawling.entities import CrawledPost, CompactCrawledPost
+
+SOURCES = ["ppomppu", "ruliweb", "clien"]
+AUTHORS = [f"user{i}" for i in range(500)]
+
+
+def _parsed(value: str) -> str:
+    """HTML 파싱 결과처럼 매번 새 문자열 객체를 만듭니다 (리터럴 공유 방지)."""
+    return value.encode("utf-8").decode("utf-8")
+
+
+def make_post(i: int, base_time: datetime) -> CrawledPost:
+    """크롤러가 만드는 것과 비슷한 형태의 게시글을 생성합니다."""
+    source = SOURCES[i % len(SOURCES)]
+    return CrawledPost(
+        id=f"{source}_{i}",
+        title=f"통신 관련 게시글 {i}",
+        content=f"5G 요금제와 단말기 지원금에 대한 게시글 본문 {i}",
+        url=f"https://example.com/{source}/{i}",
+        source=_parsed(source),
+        post_type=_parsed("community"),
+        author=_parsed(AUTHORS[i % len(AUTHORS)]),
+        views=i % 5000,
+        likes=i % 100,
+        comments=i % 50,
+        metadata={},
+        crawled_at=base_time + timedelta(seconds=i),
+    )
+
+
+def measure(build: Callable[[], List[Any]]) -> int:
+    """레코드 목록을 만드는 동안 늘어난 메모리(bytes)를 측정합니다."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    gc.collect()
+    return after - before
+
+
+def run(posts: int) -> Dict[str, Any]:
+    """벤치마크를 실행하고 결과를 반환합니다."""
+    base_time = datetime(2025, 10, 1)
+
+    # 동일한 본문 문자열(title/content/url)이 양쪽 측정에 모두 포함되도록 매번 새로 생성
+    regular = measure(lambda: [make_post(i, base_time) for i in range(posts)])
+    compact = measure(lambda: [CompactCrawledPost.from_entity(make_post(i, base_time)) for i in range(posts)])
+
+    # 변환이 손실 없이 왕복되는지 확인
+    sample = make_post(42, base_time)
+    assert CompactCrawledPost.from_entity(sample).to_entity() == sample
+
+    return {
+        "benchmark": "crawl_record_memory",
+        "posts": posts,
+        "crawled_post_bytes": regular,
+        "compact_post_bytes": compact,
+        "crawled_post_bytes_per_record": round(regular / posts, 1),
+        "compact_post_bytes_per_record": round(compact / posts, 1),
+        "saving_bytes_per_record": round((regular - compact) / posts, 1),
+        "saving_ratio": round(1 - compact / regular, 3) if regular else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="크롤링 레코드 메모리 벤치마크")
+    parser.add_argument("--posts", type=int, default=100_000, help="생성할 게시글 수")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    result = run(args.posts)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False))
+        return
+
+    print(f"게시글 수: {result['posts']:,}")
+    print(f"CrawledPost        : {result['crawled_post_bytes_per_record']:>8} bytes/record")
+    print(f"CompactCrawledPost : {result['compact_post_bytes_per_record']:>8} bytes/record")
+    print(f"절감               : {result['saving_bytes_per_record']:>8} bytes/record ({result['saving_ratio']:.1%})")
+
+
+if __name__ == "__main__":
+    main()
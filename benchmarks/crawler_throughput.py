@@ -0,0 +1,217 @@
+"""크롤러 처리량 벤치마크 - 로컬 픽스처 서버를 대상으로 크롤러를 동시성 수준별로 측정합니다.
+
+각 소스에 대해 두 가지 작업을 측정합니다.
+- ``crawl``: 레지스트리로 만든 크롤러의 ``crawl()`` 호출
+- ``fetch``: 크롤러의 ``fetch()``로 소스의 목록/상세 페이지 조회 (공통 HTTP 경로)
+
+결과(pages/sec, p50/p99 지연, RSS)는 JSON으로 저장되어 릴리스 간 비교에 사용합니다.
+
+실행:
+    python -m benchmarks.crawler_throughput --concurrency 1,4,16 --latency-ms 30 \\
+        --output bench_crawlers.json [--baseline previous.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.adapters.crawlers.registry import CrawlerRegistry
+from .fixture_server import FaultConfig, FixtureServer
+from .fixtures import build_fixtures, page_paths, SOURCE_PAGES
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값에서 nearest-rank 백분위수를 구합니다."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def _rss_mb() -> float:
+    """현재 RSS(MB)를 반환합니다 (/proc 미지원 환경에서는 최대 RSS)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * resource.getpagesize() / 1024 / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(maxrss / 1024 / (1024 if sys.platform == "darwin" else 1), 1)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+async def _run_concurrently(operation: Callable[[int], Awaitable[Any]], count: int, concurrency: int) -> Dict[str, Any]:
+    """operation을 count회, 최대 concurrency개 동시에 실행하고 지연/오류를 수집합니다."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def _one(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await operation(i)
+            except Exception:
+                errors += 1
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one(i) for i in range(count)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "operations": count,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "p50_ms": round(_percentile(latencies, 50), 2),
+        "p99_ms": round(_percentile(latencies, 99), 2),
+    }
+
+
+async def bench_source(
+    registry: CrawlerRegistry,
+    server: FixtureServer,
+    source: str,
+    concurrency: int,
+    operations: int,
+) -> List[Dict[str, Any]]:
+    """한 소스를 한 동시성 수준에서 측정합니다."""
+    crawler = registry.create(source, base_url=server.source_url(source))
+    paths = page_paths(source)
+    results = []
+
+    try:
+        # 클라이언트 생성/연결 비용이 측정에 섞이지 않도록 한 번 미리 요청
+        try:
+            await crawler.fetch(paths[0])
+        except Exception:
+            pass
+        
+        workloads = {
+            "crawl": lambda i: crawler.crawl(limit=10),
+            "fetch": lambda i: crawler.fetch(paths[i % len(paths)]),
+        }
+        for workload, operation in workloads.items():
+            # 주입된 429/5xx 응답은 처리량에서 제외하고 2xx 페이지만 집계
+            pages_before = server.pages_served(source)
+            stats = await _run_concurrently(operation, operations, concurrency)
+            pages = server.pages_served(source) - pages_before
+            stats.update({
+                "source": source,
+                "workload": workload,
+                "concurrency": concurrency,
+                "pages": pages,
+                "pages_per_sec": round(pages / stats["elapsed_s"], 1) if stats["elapsed_s"] else 0.0,
+                "ops_per_sec": round(operations / stats["elapsed_s"], 1) if stats["elapsed_s"] else 0.0,
+                "rss_mb": _rss_mb(),
+            })
+            results.append(stats)
+    finally:
+        await crawler.close()
+
+    return results
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """전체 벤치마크를 실행합니다."""
+    sources = args.sources.split(",") if args.sources else list(SOURCE_PAGES)
+    levels = [int(level) for level in args.concurrency.split(",")]
+    faults = FaultConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.error_status, args.seed)
+    fixtures_dir = Path(args.fixtures_dir) if args.fixtures_dir else None
+
+    registry = CrawlerRegistry(discover_entry_points=False)
+    results: List[Dict[str, Any]] = []
+
+    async with FixtureServer(build_fixtures(sources, fixtures_dir, args.seed), faults) as server:
+        for source in sources:
+            for level in levels:
+                results.extend(await bench_source(registry, server, source, level, args.operations))
+
+    return {
+        "benchmark": "crawler_throughput",
+        "timestamp": datetime.utcnow().isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "config": {
+            "sources": sources,
+            "concurrency": levels,
+            "operations": args.operations,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "error_status": args.error_status,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """기준 결과 대비 pages/sec 또는 p99가 tolerance 이상 나빠진 항목을 반환합니다."""
+    key = lambda r: (r["source"], r["workload"], r["concurrency"])
+    previous = {key(r): r for r in baseline.get("results", [])}
+    regressions = []
+
+    for current in report["results"]:
+        before = previous.get(key(current))
+        if not before:
+            continue
+        if before["pages_per_sec"] and current["pages_per_sec"] < before["pages_per_sec"] * (1 - tolerance):
+            regressions.append(f"{key(current)} pages/sec {before['pages_per_sec']} -> {current['pages_per_sec']}")
+        if before["p99_ms"] and current["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            regressions.append(f"{key(current)} p99 {before['p99_ms']}ms -> {current['p99_ms']}ms")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="크롤러 처리량 벤치마크")
+    parser.add_argument("--sources", default="", help="쉼표로 구분한 소스 목록 (기본: 전체)")
+    parser.add_argument("--concurrency", default="1,4,16", help="쉼표로 구분한 동시성 수준")
+    parser.add_argument("--operations", type=int, default=200, help="동시성 수준별 작업 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixtures-dir", default="", help="녹화된 HTML 디렉터리 (<dir>/<source>/*.html)")
+    parser.add_argument("--output", default="", help="결과 JSON 파일 경로 (기본: 표준 출력)")
+    parser.add_argument("--baseline", default="", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="회귀로 판단할 허용 비율")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare(report, json.loads(Path(args.baseline).read_text(encoding="utf-8")), args.tolerance)
+        for line in regressions:
+            print(f"⚠️ 회귀: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""평가 파이프라인 부하 벤치마크 - SimulatedLLM으로 실제 API 없이 대량 평가의 처리량과 지연을 측정합니다.
+
+합성 게시글을 LLMEvaluationService로 평가하며, LLM 호출은 시뮬레이터가 템플릿별 지연 분포,
+429/5xx 오류, RPM/TPM 한도를 재현합니다. 스케줄러의 동시성/예산/재시도가 실제와 같이 적용되므로
+설정 변경(배치 크기, 동시성, 요청 한도)의 처리량 영향을 오프라인에서 비교할 수 있습니다.
+
+실행:
+    python -m benchmarks.evaluation_pipeline --posts 5000 --concurrency 32 --rpm 3000 \\
+        --rate-limit-error-rate 0.01 --server-error-rate 0.005 --seed 42 [--per-post] [--output result.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.infrastructure.external.llm.instrumentation import track_usage
+from app.infrastructure.external.llm.scheduler import LLMScheduler
+from app.infrastructure.external.llm.simulated import SimulatedLLM
+from app.modules.evaluation.entities import EvaluationResult
+from app.modules.evaluation.keywords import RelevancePrefilter
+from app.modules.evaluation.repositories import EvaluationResultRepository
+from app.modules.evaluation.services import LLMEvaluationService
+
+TOPICS = ["SKT 5G 요금제", "KT 단말기 지원금", "LG U+ 인터넷 결합", "방통위 단통법 개정", "KAIT 번호이동 통계", "주말 맛집 후기"]
+
+
+class _MemoryResultRepository(EvaluationResultRepository):
+    """평가 결과를 메모리에 저장하는 레포지토리 (DB 비용 제외)."""
+
+    def __init__(self):
+        self.results: List[EvaluationResult] = []
+
+    async def save(self, result: EvaluationResult) -> str:
+        self.results.append(result)
+        return result.id
+
+    async def save_many(self, results: List[EvaluationResult]) -> List[str]:
+        self.results.extend(results)
+        return [result.id for result in results]
+
+    async def get_by_id(self, result_id: str) -> Optional[EvaluationResult]:
+        return next((result for result in self.results if result.id == result_id), None)
+
+    async def get_by_post_id(self, post_id: str) -> Optional[EvaluationResult]:
+        return next((result for result in self.results if result.post_id == post_id), None)
+
+    async def list_relevant_posts(self, min_score: float = 0.5) -> List[EvaluationResult]:
+        return [result for result in self.results if result.relevance_score >= min_score]
+
+    async def list_by_category(self, category: str) -> List[EvaluationResult]:
+        return [result for result in self.results if result.category == category]
+
+    async def list_recent(self, limit: int = 50000) -> List[EvaluationResult]:
+        return sorted(self.results, key=lambda result: result.evaluated_at, reverse=True)[:limit]
+
+    async def list_by_content_hashes(self, content_hashes: Dict[str, str]) -> List[EvaluationResult]:
+        return [result for result in self.results if content_hashes.get(result.post_id) == result.content_hash]
+
+
+class _PerPostClient:
+    """evaluate_batch를 숨겨 게시글별 analyze_post 경로로 평가하게 하는 래퍼."""
+
+    def __init__(self, llm: SimulatedLLM):
+        self.llm = llm
+
+    async def analyze_post(self, text: str) -> Dict[str, Any]:
+        return await self.llm.analyze_post(text)
+
+
+def make_posts(count: int, seed: int) -> List[Dict[str, Any]]:
+    """주제와 길이가 섞인 합성 게시글을 만듭니다."""
+    rng = random.Random(seed)
+    posts = []
+    for i in range(count):
+        topic = rng.choice(TOPICS)
+        posts.append({
+            "id": f"bench_{i}",
+            "title": f"{topic} 관련 글 {i}",
+            "content": " ".join(f"{topic} 이야기 {j}." for j in range(rng.randint(5, 80))),
+            "views": rng.randint(0, 5000),
+            "likes": rng.randint(0, 100),
+            "comments": rng.randint(0, 50),
+        })
+    return posts
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """합성 게시글을 평가하고 처리량, LLM 사용량, 시뮬레이터/스케줄러 통계를 반환합니다."""
+    scheduler = LLMScheduler(
+        requests_per_minute=args.client_rpm,
+        tokens_per_minute=args.client_tpm,
+        max_concurrency=args.concurrency,
+        retry_delay=args.retry_delay,
+    )
+    config: Dict[str, Any] = {
+        "scheduler": scheduler,
+        "seed": args.seed,
+        "rate_limit_error_rate": args.rate_limit_error_rate,
+        "server_error_rate": args.server_error_rate,
+        "rpm": args.rpm,
+        "tpm": args.tpm,
+    }
+    if args.latency:
+        config["latency"] = args.latency
+    llm = SimulatedLLM(config)
+
+    repo = _MemoryResultRepository()
+    service = LLMEvaluationService(
+        _PerPostClient(llm) if args.per_post else llm,
+        repo,
+        prefilter=RelevancePrefilter(min_engagement=0),
+        incremental=False
+    )
+    posts = make_posts(args.posts, args.seed)
+
+    started = time.perf_counter()
+    with track_usage() as usage:
+        results = await service.evaluate_posts_batch(posts)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "benchmark": "evaluation_pipeline",
+        "timestamp": datetime.utcnow().isoformat(),
+        "config": {key: value for key, value in vars(args).items() if key != "output"},
+        "posts": len(posts),
+        "evaluated": len(results),
+        "stored": len(repo.results),
+        "elapsed_s": round(elapsed, 3),
+        "posts_per_sec": round(len(results) / elapsed, 1) if elapsed else 0.0,
+        "llm_usage": usage.as_dict(),
+        "simulator": llm.simulation_stats(),
+        "scheduler": scheduler.scheduler_stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="평가 파이프라인 부하 벤치마크 (SimulatedLLM)")
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--per-post", action="store_true", help="배치 프롬프트 대신 게시글별 analyze_post로 평가")
+    parser.add_argument("--concurrency", type=int, default=16, help="클라이언트 스케줄러 동시성 한도")
+    parser.add_argument("--client-rpm", type=int, default=100000, help="클라이언트 스케줄러 RPM 예산")
+    parser.add_argument("--client-tpm", type=int, default=100000000, help="클라이언트 스케줄러 TPM 예산")
+    parser.add_argument("--retry-delay", type=float, default=1.0)
+    parser.add_argument("--latency", default="", help="템플릿별 지연 분포 (기본: SIMULATED_LATENCY)")
+    parser.add_argument("--rate-limit-error-rate", type=float, default=0.0)
+    parser.add_argument("--server-error-rate", type=float, default=0.0)
+    parser.add_argument("--rpm", type=int, default=0, help="시뮬레이션 서버 RPM 한도 (0이면 제한 없음)")
+    parser.add_argument("--tpm", type=int, default=0, help="시뮬레이션 서버 TPM 한도 (0이면 제한 없음)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="", help="결과 JSON 파일 경로 (기본: 표준 출력)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""로컬 픽스처 HTTP 서버 - 지연/오류 주입이 가능한 asyncio 기반 HTTP/1.1 서버.
+
+실제 커뮤니티/뉴스 사이트 대신 녹화되거나 합성된 HTML을 제공하여 크롤러를 벤치마크합니다.
+
+단독 실행:
+    python -m benchmarks.fixture_server --port 8765 --latency-ms 50 --error-rate 0.01 [--fixtures-dir recorded/]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .fixtures import build_fixtures
+
+_REASONS = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+@dataclass
+class FaultConfig:
+    """지연/오류 주입 설정."""
+    latency_ms: float = 0.0        # 기본 응답 지연 (ms)
+    jitter_ms: float = 0.0         # 지연 편차 (정규분포 표준편차, ms)
+    error_rate: float = 0.0        # 오류 응답 비율 (0.0 ~ 1.0)
+    error_status: int = 503        # 주입할 오류 상태 코드
+    seed: int = 0                  # 재현 가능한 주입을 위한 시드
+
+
+class FixtureServer:
+    """픽스처 HTTP 서버 - 경로별 HTML을 설정된 지연과 오류율로 응답합니다."""
+
+    def __init__(self, routes: Dict[str, bytes], faults: Optional[FaultConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.routes = routes
+        self.faults = faults or FaultConfig()
+        self.host = host
+        self.port = port
+        self.requests: Counter = Counter()   # 소스별 요청 수
+        self.errors: Counter = Counter()     # 소스별 주입된 오류 수
+        self.responses: Counter = Counter()  # (소스, 상태 코드)별 응답 수
+        self._rng = random.Random(self.faults.seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def base_url(self) -> str:
+        """서버의 기본 URL을 반환합니다."""
+        return f"http://{self.host}:{self.port}"
+
+    def source_url(self, source: str) -> str:
+        """소스별 base_url을 반환합니다 (크롤러의 base_url로 사용)."""
+        return f"{self.base_url}/{source}"
+
+    async def start(self) -> None:
+        """서버를 시작합니다."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """서버를 종료합니다."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FixtureServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """keep-alive 연결에서 요청을 반복 처리합니다."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode("latin-1").split()
+                path = parts[1].split("?", 1)[0] if len(parts) >= 2 else "/"
+                status, body = await self._respond(path)
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+                    f"Content-Type: text/html; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def pages_served(self, source: str) -> int:
+        """소스에 2xx로 응답한 페이지 수를 반환합니다 (주입된 오류와 404 제외)."""
+        return sum(count for (name, status), count in self.responses.items() if name == source and 200 <= status < 300)
+
+    async def _respond(self, path: str) -> Tuple[int, bytes]:
+        """경로에 대한 상태 코드와 본문을 결정하고 상태 코드별로 집계합니다."""
+        source = path.strip("/").split("/", 1)[0]
+        self.requests[source] += 1
+        status, body = await self._render(source, path)
+        self.responses[source, status] += 1
+        return status, body
+
+    async def _render(self, source: str, path: str) -> Tuple[int, bytes]:
+        """지연/오류 주입을 적용해 응답을 만듭니다."""
+
+        delay = self.faults.latency_ms
+        if self.faults.jitter_ms:
+            delay = max(0.0, self._rng.gauss(delay, self.faults.jitter_ms))
+        if delay:
+            await asyncio.sleep(delay / 1000)
+
+        if self.faults.error_rate and self._rng.random() < self.faults.error_rate:
+            self.errors[source] += 1
+            return self.faults.error_status, b"injected error"
+
+        body = self.routes.get(path)
+        if body is None:
+            return 404, b"not found"
+        return 200, body
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    faults = FaultConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.error_status, args.seed)
+    fixtures_dir = Path(args.fixtures_dir) if args.fixtures_dir else None
+    server = FixtureServer(build_fixtures(fixtures_dir=fixtures_dir, seed=args.seed), faults, args.host, args.port)
+    await server.start()
+    print(f"픽스처 서버 실행 중: {server.base_url} ({len(server.routes)}개 경로)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="크롤러 벤치마크용 로컬 픽스처 HTTP 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixtures-dir", default="", help="녹화된 HTML 디렉터리 (<dir>/<source>/*.html)")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
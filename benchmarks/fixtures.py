@@ -0,0 +1,92 @@
+"""벤치마크용 HTML 픽스처 - 녹화된 HTML 또는 합성 HTML을 소스별 경로로 제공합니다.
+
+녹화된 HTML은 ``<fixtures_dir>/<source>/<path>.html`` 형식으로 두면 합성 페이지 대신 사용됩니다.
+(예: ``benchmarks/fixtures/ppomppu/hot.html`` -> ``/ppomppu/hot``)
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 소스별 목록 페이지 경로 (크롤러 기능 이름과 대응)
+SOURCE_PAGES: Dict[str, List[str]] = {
+    "ppomppu": ["hot", "category/phone"],
+    "ruliweb": ["hot", "category/mobile"],
+    "clien": ["hot", "category/cm_mobile"],
+    "etnews": ["tech", "telecom"],
+    "yonhap": ["tech", "telecom"],
+    "kait": ["notices", "reports"],
+    "broadcast_commission": ["notices", "policies"],
+}
+
+ARTICLES_PER_LIST = 20
+
+_TOPICS = ["5G 요금제", "단말기 지원금", "SKT 신규 서비스", "KT 망 장애", "LG U+ 로밍", "방통위 과징금", "KAIT 통계"]
+
+
+def _article_html(source: str, index: int, rng: random.Random) -> str:
+    """합성 게시글 상세 페이지를 생성합니다."""
+    topic = rng.choice(_TOPICS)
+    paragraphs = "".join(
+        f"<p>{topic} 관련 {source} 게시글 {index}의 본문 단락 {p}입니다. 이통시장 여론과 통신 정책을 다룹니다.</p>"
+        for p in range(rng.randint(3, 12))
+    )
+    return (
+        f"<html><head><title>{topic} - {source} {index}</title></head><body>"
+        f"<article><h1>{topic} 소식 {index}</h1>"
+        f"<span class=\"author\">user{rng.randint(1, 500)}</span>"
+        f"<span class=\"views\">{rng.randint(0, 20000)}</span>"
+        f"<div class=\"content\">{paragraphs}</div></article></body></html>"
+    )
+
+
+def _list_html(source: str, page: str, rng: random.Random) -> str:
+    """합성 목록 페이지를 생성합니다."""
+    rows = "".join(
+        f"<tr><td><a href=\"/{source}/article/{i}\">{rng.choice(_TOPICS)} 게시글 {i}</a></td>"
+        f"<td class=\"views\">{rng.randint(0, 20000)}</td></tr>"
+        for i in range(ARTICLES_PER_LIST)
+    )
+    return f"<html><body><h1>{source} {page}</h1><table>{rows}</table></body></html>"
+
+
+def build_fixtures(
+    sources: Optional[List[str]] = None,
+    fixtures_dir: Optional[Path] = None,
+    seed: int = 0,
+) -> Dict[str, bytes]:
+    """요청 경로 -> HTML 본문 매핑을 만듭니다.
+
+    Args:
+        sources: 포함할 소스 목록 (None이면 전체)
+        fixtures_dir: 녹화된 HTML 디렉터리 (있으면 합성 페이지보다 우선)
+        seed: 합성 HTML 생성 시드
+
+    Returns:
+        ``/<source>/<path>`` 형식의 경로를 키로 하는 HTML 바이트 딕셔너리
+    """
+    rng = random.Random(seed)
+    routes: Dict[str, bytes] = {}
+
+    for source in sources or list(SOURCE_PAGES):
+        for page in SOURCE_PAGES.get(source, ["hot"]):
+            routes[f"/{source}/{page}"] = _list_html(source, page, rng).encode("utf-8")
+        for i in range(ARTICLES_PER_LIST):
+            routes[f"/{source}/article/{i}"] = _article_html(source, i, rng).encode("utf-8")
+
+        recorded = (fixtures_dir / source) if fixtures_dir else None
+        if recorded and recorded.is_dir():
+            for path in recorded.rglob("*.html"):
+                route = "/" + source + "/" + path.relative_to(recorded).with_suffix("").as_posix()
+                routes[route] = path.read_bytes()
+
+    return routes
+
+
+def page_paths(source: str) -> List[str]:
+    """소스의 모든 페이지 경로(base_url 기준 상대 경로)를 반환합니다."""
+    pages = [f"/{page}" for page in SOURCE_PAGES.get(source, ["hot"])]
+    pages += [f"/article/{i}" for i in range(ARTICLES_PER_LIST)]
+    return pages
@@ -0,0 +1,357 @@
+"""로컬 LLM 배치 작업 대체 서버 - Anthropic Message Batches API와 OpenAI Batch API를 흉내 냅니다.
+
+실제 제공자 대신 이 서버를 ``CLAUDE_BASE_URL``/``OPENAI_BASE_URL``로 지정하면
+``EvaluatePostsUseCase``의 배치 작업 모드(제출 → 완료 확인 → 결과 일괄 저장)를 오프라인으로 실행할 수 있습니다.
+배치 응답에서 빠진 게시글의 재평가를 위해 요청/응답 API(``/v1/messages``, ``/v1/chat/completions``)도 제공합니다.
+응답은 키워드 매처로 만든 결정적인 평가 JSON 배열입니다.
+
+단독 실행:
+    python -m benchmarks.llm_batch_server --port 8766 --processing-seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.modules.evaluation.keywords import get_keyword_matcher
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found"}
+# 배치 프롬프트의 "[n] 제목: ...\n본문: ..." 블록 (빈 줄까지)
+_POST_PATTERN = re.compile(r"\[(\d+)\] 제목: (.*?)(?=\n[ \t]*\n|\Z)", re.DOTALL)
+_CATEGORY_KEYWORDS = ("SKT", "KT", "LGU", "방통위", "KAIT")
+
+# (시스템 프롬프트, 사용자 메시지) -> 응답 텍스트
+Responder = Callable[[Optional[str], str], str]
+
+
+def keyword_responder(system: Optional[str], prompt: str) -> str:
+    """배치 평가 프롬프트의 게시글마다 키워드 매칭으로 관련성/카테고리를 정해 JSON 배열로 답합니다."""
+    matcher = get_keyword_matcher()
+    items = []
+    for number, text in _POST_PATTERN.findall(prompt):
+        keywords = matcher.match(text).keywords
+        category = next((keyword for keyword in keywords if keyword in _CATEGORY_KEYWORDS), None)
+        items.append({
+            "n": int(number),
+            "relevant": bool(keywords),
+            "score": 0.9 if keywords else 0.1,
+            "category": category or ("이통시장여론" if keywords else "OTHER"),
+        })
+    if not items:
+        return "YES" if matcher.match(prompt).total else "NO"
+    return json.dumps(items, ensure_ascii=False)
+
+
+def _system_text(system: Any) -> Optional[str]:
+    if isinstance(system, list):
+        return "".join(block.get("text", "") for block in system)
+    return system
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class LLMBatchServer:
+    """배치 작업 대체 서버 - 작업은 processing_seconds 뒤에 완료됩니다."""
+
+    def __init__(
+        self,
+        processing_seconds: float = 0.0,
+        responder: Optional[Responder] = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        self.processing_seconds = processing_seconds
+        self.responder = responder or keyword_responder
+        self.host = host
+        self.port = port
+        self.batches: Dict[str, Dict[str, Any]] = {}   # 작업 ID -> {"kind", "created", "requests", ...}
+        self.files: Dict[str, bytes] = {}
+        self.requests = 0
+        self._ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    @property
+    def base_url(self) -> str:
+        """서버의 기본 URL을 반환합니다 (SDK의 base_url로 사용)."""
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """서버를 시작합니다."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """서버를 종료합니다."""
+        if self._server is not None:
+            self._server.close()
+            # 클라이언트가 열어 둔 keep-alive 연결도 닫음
+            handlers = list(self._connections.values())
+            for writer in list(self._connections):
+                writer.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "LLMBatchServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """keep-alive 연결에서 요청을 반복 처리합니다."""
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0) or 0))
+
+                method, target = request_line.decode("latin-1").split()[:2]
+                self.requests += 1
+                status, content_type, payload = self._route(method, target.split("?", 1)[0], headers, body)
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+                    + (b"" if method == "HEAD" else payload)  # HEAD 응답은 헤더만 (연결 예열용)
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    def _route(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> Tuple[int, str, bytes]:
+        """요청 경로를 Anthropic/OpenAI 배치 및 요청/응답 엔드포인트로 나눕니다."""
+        parts = [part for part in path.split("/") if part]
+        try:
+            if method == "POST" and parts == ["v1", "messages"]:
+                return self._json(self._message(json.loads(body)))
+            if method == "POST" and parts == ["v1", "chat", "completions"]:
+                return self._json(self._chat_completion(json.loads(body)))
+            if parts[:3] == ["v1", "messages", "batches"]:
+                if method == "POST" and len(parts) == 3:
+                    return self._json(self._create_message_batch(json.loads(body)))
+                if method == "GET" and len(parts) == 4:
+                    return self._json(self._message_batch(parts[3]))
+                if method == "GET" and len(parts) == 5 and parts[4] == "results":
+                    return 200, "application/x-jsonl", self._message_batch_results(parts[3])
+            if parts[:2] == ["v1", "files"]:
+                if method == "POST" and len(parts) == 2:
+                    return self._json(self._upload_file(headers.get("content-type", ""), body))
+                if method == "GET" and len(parts) == 4 and parts[3] == "content":
+                    return 200, "application/octet-stream", self.files[parts[2]]
+            if parts[:2] == ["v1", "batches"]:
+                if method == "POST" and len(parts) == 2:
+                    return self._json(self._create_openai_batch(json.loads(body)))
+                if method == "GET" and len(parts) == 3:
+                    return self._json(self._openai_batch(parts[2]))
+        except KeyError:
+            return self._json({"error": {"type": "not_found_error", "message": path}}, 404)
+        except (ValueError, json.JSONDecodeError) as e:
+            return self._json({"error": {"type": "invalid_request_error", "message": str(e)}}, 400)
+        return self._json({"error": {"type": "not_found_error", "message": path}}, 404)
+
+    def _json(self, value: Dict[str, Any], status: int = 200) -> Tuple[int, str, bytes]:
+        return status, "application/json", json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+    def _new_id(self, prefix: str) -> str:
+        return f"{prefix}_{next(self._ids):06d}"
+
+    def _finished(self, batch: Dict[str, Any]) -> bool:
+        return time.time() - batch["created"] >= self.processing_seconds
+
+    # Anthropic Message Batches
+    def _create_message_batch(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        batch_id = self._new_id("msgbatch")
+        self.batches[batch_id] = {"kind": "anthropic", "created": time.time(), "requests": payload["requests"]}
+        return self._message_batch(batch_id)
+
+    def _message_batch(self, batch_id: str) -> Dict[str, Any]:
+        batch = self.batches[batch_id]
+        finished = self._finished(batch)
+        count = len(batch["requests"])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if finished else "in_progress",
+            "request_counts": {
+                "processing": 0 if finished else count,
+                "succeeded": count if finished else 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": _iso(batch["created"]),
+            "expires_at": _iso(batch["created"] + timedelta(days=1).total_seconds()),
+            "ended_at": _iso(batch["created"] + self.processing_seconds) if finished else None,
+            "cancel_initiated_at": None,
+            "archived_at": None,
+            "results_url": f"{self.base_url}/v1/messages/batches/{batch_id}/results" if finished else None,
+        }
+
+    def _message(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Messages API 응답 본문을 만듭니다."""
+        prompt = params["messages"][-1]["content"]
+        text = self.responder(_system_text(params.get("system")), prompt)
+        return {
+            "id": self._new_id("msg"),
+            "type": "message",
+            "role": "assistant",
+            "model": params["model"],
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": len(prompt) // 2, "output_tokens": len(text) // 2},
+        }
+
+    def _message_batch_results(self, batch_id: str) -> bytes:
+        lines = [
+            json.dumps({
+                "custom_id": request["custom_id"],
+                "result": {"type": "succeeded", "message": self._message(request["params"])},
+            }, ensure_ascii=False)
+            for request in self.batches[batch_id]["requests"]
+        ]
+        return "\n".join(lines).encode("utf-8")
+
+    # OpenAI Files / Batch
+    def _upload_file(self, content_type: str, body: bytes) -> Dict[str, Any]:
+        boundary = content_type.split("boundary=", 1)[1].strip('"').encode("latin-1")
+        content = None
+        for part in body.split(b"--" + boundary):
+            head, _, data = part.partition(b"\r\n\r\n")
+            if b'name="file"' in head:
+                content = data[:-2] if data.endswith(b"\r\n") else data
+        if content is None:
+            raise ValueError("file part is required")
+
+        file_id = self._new_id("file")
+        self.files[file_id] = content
+        return self._file_object(file_id, "batch")
+
+    def _file_object(self, file_id: str, purpose: str) -> Dict[str, Any]:
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(self.files[file_id]),
+            "created_at": int(time.time()),
+            "filename": f"{file_id}.jsonl",
+            "purpose": purpose,
+            "status": "processed",
+        }
+
+    def _create_openai_batch(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        batch_id = self._new_id("batch")
+        lines = self.files[payload["input_file_id"]].decode("utf-8").splitlines()
+        self.batches[batch_id] = {
+            "kind": "openai",
+            "created": time.time(),
+            "requests": [json.loads(line) for line in lines if line.strip()],
+            "input_file_id": payload["input_file_id"],
+            "endpoint": payload["endpoint"],
+            "output_file_id": None,
+        }
+        return self._openai_batch(batch_id)
+
+    def _openai_batch(self, batch_id: str) -> Dict[str, Any]:
+        batch = self.batches[batch_id]
+        finished = self._finished(batch)
+        if finished and batch["output_file_id"] is None:
+            batch["output_file_id"] = self._new_id("file")
+            self.files[batch["output_file_id"]] = self._openai_batch_output(batch["requests"])
+        count = len(batch["requests"])
+        return {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": batch["endpoint"],
+            "input_file_id": batch["input_file_id"],
+            "completion_window": "24h",
+            "status": "completed" if finished else "in_progress",
+            "output_file_id": batch["output_file_id"],
+            "error_file_id": None,
+            "created_at": int(batch["created"]),
+            "request_counts": {"total": count, "completed": count if finished else 0, "failed": 0},
+        }
+
+    def _chat_completion(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Chat Completions API 응답 본문을 만듭니다."""
+        messages = body["messages"]
+        system = next((m["content"] for m in messages if m["role"] == "system"), None)
+        prompt = messages[-1]["content"]
+        text = self.responder(system, prompt)
+        return {
+            "id": self._new_id("chatcmpl"),
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": len(prompt) // 2, "completion_tokens": len(text) // 2, "total_tokens": (len(prompt) + len(text)) // 2},
+        }
+
+    def _openai_batch_output(self, requests: List[Dict[str, Any]]) -> bytes:
+        lines = [
+            json.dumps({
+                "id": self._new_id("batch_req"),
+                "custom_id": request["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "request_id": self._new_id("req"),
+                    "body": self._chat_completion(request["body"]),
+                },
+                "error": None,
+            }, ensure_ascii=False)
+            for request in requests
+        ]
+        return "\n".join(lines).encode("utf-8")
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = LLMBatchServer(args.processing_seconds, host=args.host, port=args.port)
+    await server.start()
+    print(f"LLM 배치 대체 서버 실행 중: {server.base_url} (작업 처리 {args.processing_seconds}초)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="LLM 배치 작업 API 로컬 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--processing-seconds", type=float, default=0.0)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""테스트 공용 픽스처 - DB 없이 평가 유즈케이스를 실행하기 위한 메모리 레포지토리."""
+
+from __future__ import annotations
+
+import copy
+from typing import Dict, List, Optional
+
+import pytest
+
+from app.modules.evaluation.entities import EvaluationResult, EvaluationSession
+from app.modules.evaluation.repositories import EvaluationResultRepository, EvaluationSessionRepository
+
+
+class MemoryResultRepository(EvaluationResultRepository):
+    """평가 결과를 메모리에 저장하는 레포지토리 (save_many 호출 크기를 기록)."""
+
+    def __init__(self):
+        self.results: List[EvaluationResult] = []
+        self.batches: List[int] = []
+
+    async def save(self, result: EvaluationResult) -> str:
+        self.results.append(result)
+        return result.id
+
+    async def save_many(self, results: List[EvaluationResult]) -> List[str]:
+        self.batches.append(len(results))
+        self.results.extend(results)
+        return [result.id for result in results]
+
+    async def get_by_id(self, result_id: str) -> Optional[EvaluationResult]:
+        return next((result for result in self.results if result.id == result_id), None)
+
+    async def get_by_post_id(self, post_id: str) -> Optional[EvaluationResult]:
+        return next((result for result in self.results if result.post_id == post_id), None)
+
+    async def list_relevant_posts(self, min_score: float = 0.5) -> List[EvaluationResult]:
+        return [result for result in self.results if result.relevance_score >= min_score]
+
+    async def list_by_category(self, category: str) -> List[EvaluationResult]:
+        return [result for result in self.results if result.category == category]
+
+    async def list_recent(self, limit: int = 50000) -> List[EvaluationResult]:
+        return sorted(self.results, key=lambda result: result.evaluated_at, reverse=True)[:limit]
+
+    async def list_by_content_hashes(self, content_hashes: Dict[str, str]) -> List[EvaluationResult]:
+        return [result for result in self.results if content_hashes.get(result.post_id) == result.content_hash]
+
+
+class MemorySessionRepository(EvaluationSessionRepository):
+    """평가 세션의 저장 시점별 스냅샷을 보관하는 레포지토리."""
+
+    def __init__(self):
+        self.sessions: Dict[str, EvaluationSession] = {}
+        self.snapshots: List[EvaluationSession] = []
+
+    async def save(self, session: EvaluationSession) -> str:
+        self.sessions[session.id] = copy.deepcopy(session)
+        self.snapshots.append(copy.deepcopy(session))
+        return session.id
+
+    async def get_by_id(self, session_id: str) -> Optional[EvaluationSession]:
+        return self.sessions.get(session_id)
+
+    async def list_by_status(self, status: str) -> List[EvaluationSession]:
+        return [session for session in self.sessions.values() if session.status.value == status]
+
+    async def update_status(self, session_id: str, status: str, error_message: str = None) -> bool:
+        return session_id in self.sessions
+
+
+@pytest.fixture
+def result_repo() -> MemoryResultRepository:
+    return MemoryResultRepository()
+
+
+@pytest.fixture
+def session_repo() -> MemorySessionRepository:
+    return MemorySessionRepository()
@@ -0,0 +1,96 @@
+"""배치 작업 모드 테스트 - 로컬 배치 대체 서버로 Claude/OpenAI 배치 작업을 제출하고 결과를 수집합니다."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Optional
+
+import pytest
+
+from app.infrastructure.external.llm.claude import ClaudeService
+from app.infrastructure.external.llm.openai import OpenAIService
+from app.modules.evaluation.entities import EvaluationStatus
+from app.modules.evaluation.keywords import RelevancePrefilter
+from app.modules.evaluation.services import LLMEvaluationService
+from app.modules.evaluation.use_cases import EvaluatePostsUseCase
+from benchmarks.llm_batch_server import LLMBatchServer, keyword_responder
+
+POSTS = [
+    {"id": "post_1", "title": "SKT 5G 요금제 개편", "content": "SKT가 새 5G 요금제를 발표했습니다."},
+    {"id": "post_2", "title": "KT 단말기 지원금 인상", "content": "KT 공시지원금이 올랐습니다."},
+    {"id": "post_3", "title": "주말 맛집 후기", "content": "파스타가 맛있는 식당을 다녀왔습니다."},
+    {"id": "post_4", "title": "방통위 단통법 개정안", "content": "방통위가 단통법 개정안을 발표했습니다."},
+]
+
+
+def _make_service(provider: str, server: LLMBatchServer):
+    if provider == "claude":
+        return ClaudeService({"api_key": "test-key", "base_url": server.base_url})
+    return OpenAIService({"api_key": "test-key", "base_url": f"{server.base_url}/v1"})
+
+
+def _make_use_case(llm, result_repo, session_repo) -> EvaluatePostsUseCase:
+    # 키워드 없는 게시글도 LLM 배치 작업으로 평가 (사전 필터가 건너뛰지 않도록)
+    service = LLMEvaluationService(llm, result_repo, prefilter=RelevancePrefilter(min_engagement=0))
+    return EvaluatePostsUseCase(service, session_repo, poll_interval=0.01)
+
+
+def _dropping_responder(title: str):
+    """처음 응답할 때만 title 게시글의 평가를 빼는 응답기 (배치 작업 응답 누락 재현)."""
+    state = {"dropped": False}
+
+    def respond(system: Optional[str], prompt: str) -> str:
+        text = keyword_responder(system, prompt)
+        if state["dropped"] or title not in prompt:
+            return text
+        state["dropped"] = True
+        numbers = {int(n) for n, line in re.findall(r"\[(\d+)\] 제목: ([^\n]*)", prompt) if title in line}
+        return json.dumps([item for item in json.loads(text) if item["n"] not in numbers], ensure_ascii=False)
+    return respond
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider", ["claude", "openai"])
+async def test_batch_job_mode_saves_completed_results(provider, result_repo, session_repo):
+    async with LLMBatchServer() as server:
+        llm = _make_service(provider, server)
+        use_case = _make_use_case(llm, result_repo, session_repo)
+        try:
+            results = await use_case.execute(POSTS, mode=EvaluatePostsUseCase.MODE_BATCH_JOB)
+        finally:
+            await llm.close()
+        batch_jobs = [batch for batch in server.batches.values() if batch["kind"] == ("anthropic" if provider == "claude" else "openai")]
+
+    by_post = {result.post_id: result for result in results}
+    assert set(by_post) == {post["id"] for post in POSTS}
+    assert all(result.details["evaluation_method"] == "llm_batch_job" for result in results)
+    assert by_post["post_1"].is_relevant and not by_post["post_3"].is_relevant
+    assert len(batch_jobs) == 1
+    assert len(result_repo.results) == len(POSTS)
+
+    session = session_repo.snapshots[-1]
+    assert session.status == EvaluationStatus.COMPLETED
+    assert session.batch_job_id in server.batches
+    assert session.evaluated_posts == len(POSTS)
+    assert session.relevant_posts + session.irrelevant_posts == len(POSTS)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider", ["claude", "openai"])
+async def test_batch_job_mode_reevaluates_missing_results(provider, result_repo, session_repo):
+    async with LLMBatchServer(responder=_dropping_responder("KT 단말기")) as server:
+        llm = _make_service(provider, server)
+        use_case = _make_use_case(llm, result_repo, session_repo)
+        try:
+            results = await use_case.execute(POSTS, mode=EvaluatePostsUseCase.MODE_BATCH_JOB)
+        finally:
+            await llm.close()
+
+    methods = {result.post_id: result.details["evaluation_method"] for result in results}
+    assert set(methods) == {post["id"] for post in POSTS}
+    # 배치 작업 응답에서 빠진 게시글만 요청/응답 경로로 다시 평가
+    assert methods.pop("post_2") == "llm_batch"
+    assert set(methods.values()) == {"llm_batch_job"}
+    assert len(result_repo.results) == len(POSTS)
+    assert session_repo.snapshots[-1].status == EvaluationStatus.COMPLETED
@@ -0,0 +1,122 @@
+"""LLM 응답 캐시 테스트 - 캐시 키 정규화와 동시 요청의 LLM 호출 공유."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from app.infrastructure.external.llm.cache import CachedLLMService
+
+
+class _CountingLLM:
+    """호출 횟수를 세고, 응답 전에 잠시 대기하는 가짜 LLM 서비스."""
+
+    name = "fake"
+    model = "fake-model"
+
+    def __init__(self, delay: float = 0.01, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls: List[str] = []
+
+    async def summarize(self, text: str, sentences: int = 3, style: str = "neutral") -> str:
+        self.calls.append(text)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return f"summary:{text}"
+
+    async def analyze_post(
+        self,
+        text: str,
+        criteria: Optional[Dict[str, Any]] = None,
+        categories: Optional[List[str]] = None,
+        sentences: int = 3
+    ) -> Dict[str, Any]:
+        self.calls.append(text)
+        await asyncio.sleep(self.delay)
+        return {"is_relevant": True, "category": "5G", "tags": ["요금제"]}
+
+
+def test_cache_key_normalizes_whitespace_and_unicode():
+    cache = CachedLLMService(_CountingLLM())
+
+    assert cache.cache_key("summarize", "SKT  5G\n요금제 ") == cache.cache_key("summarize", "SKT 5G 요금제")
+    # NFKC: 전각 문자는 반각과 같은 키
+    assert cache.cache_key("summarize", "ＳＫＴ") == cache.cache_key("summarize", "SKT")
+
+
+def test_cache_key_separates_method_params_and_template_version():
+    inner = _CountingLLM()
+    cache = CachedLLMService(inner, template_version="1")
+    key = cache.cache_key("summarize", "text", {"sentences": 3})
+
+    assert key != cache.cache_key("generate_title", "text", {"sentences": 3})
+    assert key != cache.cache_key("summarize", "text", {"sentences": 1})
+    assert key != CachedLLMService(inner, template_version="2").cache_key("summarize", "text", {"sentences": 3})
+    # 인자 순서는 키에 영향 없음
+    assert cache.cache_key("summarize", "text", {"a": 1, "b": 2}) == cache.cache_key("summarize", "text", {"b": 2, "a": 1})
+
+
+@pytest.mark.asyncio
+async def test_repeated_call_is_served_from_memory():
+    inner = _CountingLLM()
+    cache = CachedLLMService(inner)
+
+    first = await cache.analyze_post("SKT 5G 요금제")
+    first["tags"].append("변경")
+    second = await cache.analyze_post("SKT  5G 요금제")
+
+    assert len(inner.calls) == 1
+    assert second["tags"] == ["요금제"]   # 반환값을 수정해도 캐시된 값은 그대로
+    assert cache.stats.misses == 1
+    assert cache.stats.memory_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_llm_call():
+    inner = _CountingLLM(delay=0.05)
+    cache = CachedLLMService(inner)
+
+    results = await asyncio.gather(*(cache.summarize("같은 글") for _ in range(5)))
+
+    assert results == ["summary:같은 글"] * 5
+    assert len(inner.calls) == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.memory_hits == 4
+    assert not cache._inflight
+
+
+@pytest.mark.asyncio
+async def test_inflight_failure_reaches_waiters_and_is_not_cached():
+    inner = _CountingLLM(delay=0.05, fail=True)
+    cache = CachedLLMService(inner)
+
+    results = await asyncio.gather(*(cache.summarize("같은 글") for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(inner.calls) == 1
+    assert not cache._inflight
+
+    inner.fail = False
+    assert await cache.summarize("같은 글") == "summary:같은 글"
+    assert len(inner.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_first_caller_does_not_cancel_other_waiters():
+    inner = _CountingLLM(delay=0.05)
+    cache = CachedLLMService(inner)
+
+    first = asyncio.create_task(cache.summarize("같은 글"))
+    await asyncio.sleep(0)
+    others = [asyncio.create_task(cache.summarize("같은 글")) for _ in range(2)]
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await asyncio.gather(*others) == ["summary:같은 글"] * 2
+    assert first.cancelled()
+    assert len(inner.calls) == 1
+    assert not cache._inflight
@@ -0,0 +1,100 @@
+"""LLM 스케줄러 테스트 - 우선순위 등급별 배정 순서와 interactive 예약 슬롯."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import pytest
+
+from app.infrastructure.external.llm.scheduler import (
+    PRIORITY_BACKFILL,
+    PRIORITY_DAILY,
+    PRIORITY_INTERACTIVE,
+    LLMScheduler,
+    request_priority,
+)
+
+
+def _scheduler(max_concurrency: int = 1, reserved_slots: int = 0) -> LLMScheduler:
+    # 예산은 충분히 크게 두어 배정 순서만 확인
+    return LLMScheduler(100000, 100000000, max_concurrency=max_concurrency, reserved_slots=reserved_slots)
+
+
+def _submit(scheduler: LLMScheduler, priority: str, name: str, order: List[str], gate: asyncio.Event = None) -> asyncio.Task:
+    """priority 등급으로 요청 하나를 제출합니다 (gate가 있으면 열릴 때까지 슬롯을 점유)."""
+    async def call() -> str:
+        order.append(name)
+        if gate is not None:
+            await gate.wait()
+        return name
+
+    async def run() -> str:
+        with request_priority(priority):
+            return await scheduler.run(call, estimated_tokens=10)
+    return asyncio.create_task(run())
+
+
+async def _settle() -> None:
+    """대기 중인 작업과 디스패처가 한 차례씩 실행되도록 양보합니다."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_backfill_waits_while_daily_requests_are_queued():
+    scheduler = _scheduler()
+    order: List[str] = []
+    gate = asyncio.Event()
+
+    tasks = [_submit(scheduler, PRIORITY_DAILY, "blocker", order, gate)]
+    await _settle()
+    tasks += [_submit(scheduler, PRIORITY_BACKFILL, f"backfill_{i}", order) for i in range(2)]
+    tasks += [_submit(scheduler, PRIORITY_DAILY, f"daily_{i}", order) for i in range(2)]
+    await _settle()
+
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    assert order == ["blocker", "daily_0", "daily_1", "backfill_0", "backfill_1"]
+    assert scheduler.priority_stats[PRIORITY_BACKFILL].dispatched == 2
+
+
+@pytest.mark.asyncio
+async def test_interactive_request_is_dispatched_before_queued_daily_requests():
+    scheduler = _scheduler()
+    order: List[str] = []
+    gate = asyncio.Event()
+
+    tasks = [_submit(scheduler, PRIORITY_DAILY, "blocker", order, gate)]
+    await _settle()
+    tasks += [_submit(scheduler, PRIORITY_DAILY, f"daily_{i}", order) for i in range(3)]
+    tasks.append(_submit(scheduler, PRIORITY_INTERACTIVE, "interactive", order))
+    await _settle()
+    assert scheduler.scheduler_stats()["priorities"][PRIORITY_DAILY]["queued"] == 3
+
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    assert order == ["blocker", "interactive", "daily_0", "daily_1", "daily_2"]
+
+
+@pytest.mark.asyncio
+async def test_reserved_slot_serves_interactive_while_daily_saturates():
+    scheduler = _scheduler(max_concurrency=2, reserved_slots=1)
+    order: List[str] = []
+    gate = asyncio.Event()
+
+    blocker = _submit(scheduler, PRIORITY_DAILY, "blocker", order, gate)
+    await _settle()
+    daily = _submit(scheduler, PRIORITY_DAILY, "daily", order)
+    interactive = _submit(scheduler, PRIORITY_INTERACTIVE, "interactive", order)
+
+    # daily는 예약 슬롯을 쓸 수 없어 대기하고, interactive는 남은 슬롯에서 바로 실행
+    assert await asyncio.wait_for(interactive, timeout=1) == "interactive"
+    assert order == ["blocker", "interactive"]
+    assert not daily.done()
+
+    gate.set()
+    await asyncio.gather(blocker, daily)
+    assert order == ["blocker", "interactive", "daily"]
@@ -0,0 +1,126 @@
+"""평가 결과 일괄 저장 테스트 - 크기/시간 기준 flush, 실패 시 재저장, 마지막 flush."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from app.modules.evaluation.entities import EvaluationResult
+from app.modules.evaluation.writer import ResultWriter
+
+
+def _result(n: int, relevant: bool = True) -> EvaluationResult:
+    return EvaluationResult(
+        id=f"eval_{n}",
+        post_id=f"post_{n}",
+        is_relevant=relevant,
+        category="5G",
+        relevance_score=0.9 if relevant else 0.1,
+        confidence=0.9,
+        details={},
+        evaluated_at=datetime.utcnow(),
+    )
+
+
+class _FailingOnce:
+    """첫 save_many만 실패시키는 레포지토리 래퍼."""
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.failed = False
+
+    async def save_many(self, results: List[EvaluationResult]) -> List[str]:
+        if not self.failed:
+            self.failed = True
+            raise RuntimeError("write failed")
+        return await self.repo.save_many(results)
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full_and_on_final_flush(result_repo):
+    flushed: List[int] = []
+
+    async def on_flush(results: List[EvaluationResult]) -> None:
+        flushed.append(len(results))
+
+    writer = ResultWriter(result_repo, max_size=4, max_delay=60, on_flush=on_flush)
+    for n in range(10):
+        await writer.add(_result(n))
+    assert result_repo.batches == [4, 4]
+
+    await writer.flush()
+
+    assert result_repo.batches == [4, 4, 2]
+    assert [result.post_id for result in result_repo.results] == [f"post_{n}" for n in range(10)]
+    assert flushed == [4, 4, 2]
+    assert writer.saved == 10
+    # 남은 결과가 없으면 다시 저장하지 않음
+    await writer.flush()
+    assert result_repo.batches == [4, 4, 2]
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_max_delay(result_repo):
+    writer = ResultWriter(result_repo, max_size=100, max_delay=0.01)
+    await writer.add(_result(1))
+    await writer.add(_result(2))
+    assert result_repo.batches == []
+
+    await asyncio.sleep(0.05)
+
+    assert result_repo.batches == [2]
+    assert writer.saved == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_results_for_next_flush(result_repo):
+    flushed: List[int] = []
+
+    async def on_flush(results: List[EvaluationResult]) -> None:
+        flushed.append(len(results))
+
+    writer = ResultWriter(_FailingOnce(result_repo), max_size=100, max_delay=60, on_flush=on_flush)
+    await writer.add(_result(1))
+    await writer.add(_result(2))
+
+    with pytest.raises(RuntimeError):
+        await writer.flush()
+    assert writer.saved == 0
+    assert flushed == []
+
+    await writer.add(_result(3))
+    await writer.flush()
+
+    assert [result.post_id for result in result_repo.results] == ["post_1", "post_2", "post_3"]
+    assert flushed == [3]
+    assert writer.saved == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_timed_flush_keeps_results_for_final_flush(result_repo):
+    writer = ResultWriter(_FailingOnce(result_repo), max_size=100, max_delay=0.01)
+    await writer.add(_result(1))
+
+    await asyncio.sleep(0.05)   # 시간 기준 flush가 실패하고 결과는 버퍼에 남음
+    assert result_repo.results == []
+
+    await writer.flush()
+    assert [result.post_id for result in result_repo.results] == ["post_1"]
+
+
+@pytest.mark.asyncio
+async def test_report_notifies_progress_without_saving(result_repo):
+    reported: List[str] = []
+
+    async def on_flush(results: List[EvaluationResult]) -> None:
+        reported.extend(result.post_id for result in results)
+
+    writer = ResultWriter(result_repo, on_flush=on_flush)
+    await writer.report([_result(1), _result(2, relevant=False)])
+
+    assert reported == ["post_1", "post_2"]
+    assert result_repo.results == []
+    assert writer.saved == 0